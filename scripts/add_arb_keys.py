@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Batch-insert ARB keys from fragment files into every locale.
+
+A fragment holds the keys of one feature for any number of locales:
+
+  JSON / YAML   {"ko": {"key": "값", "@key": {...}}, "en": {...}}
+  CSV           key,description,ko,en[,placeholders]   (placeholders as JSON)
+
+Fragments are named by path or by name in scripts/arb_fragments/
+(``tracking`` -> scripts/arb_fragments/tracking.json). All fragments are
+merged first, then each locale ARB of l10n.yaml's arb-dir is read,
+updated and written once, however many fragments contribute to it.
+
+Entries already in an ARB are merged by arb_merge: identical entries are
+skipped, conflicting ones follow --policy (keep, overwrite or fail), and
+existing MEDICAL REVIEW tags are always kept, so re-runs are no-ops.
+
+Usage: python3 scripts/arbtool.py add-keys <fragment>... [--policy keep|overwrite|fail] [--profile]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+from arb import discover_arb_files, load_arb, locale_of
+from arb_merge import IDENTICAL, METADATA_CONFLICT, NEW, POLICIES, VALUE_CONFLICT, MergeConflict, merge_entries
+from arb_profile import add_profile_arguments, count, phase, profiling
+from arb_writer import ArbEditor
+
+FRAGMENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'arb_fragments')
+FRAGMENT_SUFFIXES = ('.json', '.yaml', '.yml', '.csv')
+
+
+def available_fragments() -> list:
+    """Names of the fragments in FRAGMENT_DIR."""
+    try:
+        names = os.listdir(FRAGMENT_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted(os.path.splitext(name)[0] for name in names if name.endswith(FRAGMENT_SUFFIXES))
+
+
+def resolve_fragment(name: str) -> str:
+    """Return the path of a fragment given by path or by name in FRAGMENT_DIR."""
+    if os.path.isfile(name):
+        return name
+    for suffix in FRAGMENT_SUFFIXES:
+        path = os.path.join(FRAGMENT_DIR, name + suffix)
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(f"no fragment {name!r} (available: {', '.join(available_fragments()) or 'none'})")
+
+
+def _load_csv(path: str) -> dict:
+    entries = {}
+    with open(path, encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        # medical_review is informational (arbtool export CSVs)
+        locales = [name for name in reader.fieldnames
+                   if name not in ('key', 'description', 'placeholders', 'medical_review')]
+        for row in reader:
+            key = row['key']
+            metadata = {}
+            if row.get('description'):
+                metadata['description'] = row['description']
+            if row.get('placeholders'):
+                metadata['placeholders'] = json.loads(row['placeholders'])
+            for locale in locales:
+                if row[locale] == '':
+                    continue
+                locale_entries = entries.setdefault(locale, {})
+                locale_entries[key] = row[locale]
+                if metadata:
+                    locale_entries[f'@{key}'] = metadata
+    return entries
+
+
+def load_fragment(path: str) -> dict:
+    """Load a fragment file as ``{locale: {key: value}}``."""
+    if path.endswith('.csv'):
+        return _load_csv(path)
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(f'{path}: YAML fragments need PyYAML (pip install pyyaml)') from None
+            fragment = yaml.safe_load(f)
+        else:
+            fragment = json.load(f)
+    if not isinstance(fragment, dict) or not all(isinstance(v, dict) for v in fragment.values()):
+        raise ValueError(f'{path}: a fragment maps each locale to its ARB entries')
+    return fragment
+
+
+def merge_fragments(paths) -> dict:
+    """
+    Merge fragment files into ``{locale: {key: value}}`` in argument order.
+
+    Raises ValueError if two fragments define the same key differently.
+    """
+    merged = {}
+    origin = {}
+    for path in paths:
+        for locale, entries in load_fragment(path).items():
+            locale_entries = merged.setdefault(locale, {})
+            for key, value in entries.items():
+                if key in locale_entries and locale_entries[key] != value:
+                    raise ValueError(f'{key} ({locale}) differs between {origin[(locale, key)]} and {path}')
+                locale_entries[key] = value
+                origin[(locale, key)] = path
+    return merged
+
+
+def insert_entries(entries_by_locale: dict, arb_paths: dict, policy: str = 'keep') -> dict:
+    """
+    Merge entries into the ARB file of each locale in one read/write pass per file.
+
+    Args:
+        entries_by_locale: ``{locale: {key: value}}``
+        arb_paths: ``{locale: ARB path}``; locales without a path are skipped
+        policy: how conflicting entries are handled (see arb_merge)
+
+    Returns:
+        ``{locale: (counts, conflicts)}`` as returned by ``merge_entries``
+
+    Raises:
+        MergeConflict: with policy 'fail'; no file is written then
+    """
+    editors = {}
+    with phase('parse'):
+        for locale in entries_by_locale:
+            if locale in arb_paths:
+                editors[locale] = ArbEditor(arb_paths[locale], load_arb(arb_paths[locale]))
+
+    # Every locale is merged before anything is written, so 'fail' leaves all files untouched
+    results = {}
+    with phase('merge'):
+        for locale, editor in editors.items():
+            updates, counts, conflicts = merge_entries(editor.data, entries_by_locale[locale], policy,
+                                                       source=os.path.basename(arb_paths[locale]))
+            for key, value in updates.items():
+                editor.set(key, value)
+            results[locale] = (counts, conflicts)
+
+    count('keys', sum(len(entries_by_locale[locale]) for locale in editors))
+    count('keys_changed', sum(len(editor.changed_keys) for editor in editors.values()))
+
+    # Write back only changed entries (skipped when nothing changed)
+    with phase('write'):
+        for editor in editors.values():
+            editor.save()
+    return results
+
+
+def print_merge_result(name: str, counts: dict, conflicts: list, policy: str, limit: int = 10):
+    """Print one locale's merge counts and its first conflicts."""
+    action = 'overwritten' if policy == 'overwrite' else 'kept'
+    print(f"✅ {name}: {counts[NEW]} new, {counts[IDENTICAL]} identical, "
+          f"{counts[VALUE_CONFLICT]} value conflicts, {counts[METADATA_CONFLICT]} metadata conflicts"
+          + (f" ({action})" if conflicts else ''))
+    for outcome, key, existing, incoming in conflicts[:limit]:
+        print(f"   ⚠️  {key} [{outcome}]: {existing!r} -> {incoming!r}")
+    if len(conflicts) > limit:
+        print(f"   ... {len(conflicts) - limit} more")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Insert keys from fragment files into every locale ARB')
+    parser.add_argument('fragments', nargs='+', metavar='fragment',
+                        help=f"fragment file or name in scripts/arb_fragments "
+                             f"({', '.join(available_fragments()) or 'none'})")
+    parser.add_argument('--policy', choices=POLICIES, default='keep',
+                        help='conflicting entries: keep the ARB value, overwrite it, '
+                             'or fail without writing (default: keep)')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        paths = [resolve_fragment(name) for name in args.fragments]
+        entries_by_locale = merge_fragments(paths)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    arb_paths = {locale_of(path): path for path in discover_arb_files()}
+    try:
+        with profiling('add-keys', args):
+            results = insert_entries(entries_by_locale, arb_paths, args.policy)
+    except MergeConflict as e:
+        print(f"❌ {e}; nothing written", file=sys.stderr)
+        for outcome, key, existing, incoming in e.conflicts[:10]:
+            print(f"   {key} [{outcome}]: {existing!r} -> {incoming!r}", file=sys.stderr)
+        return 1
+
+    for locale, entries in entries_by_locale.items():
+        if locale not in arb_paths:
+            print(f"⚠️  No ARB file for locale '{locale}'; skipped {len(entries)} entries")
+            continue
+        print_merge_result(os.path.basename(arb_paths[locale]), *results[locale], args.policy)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
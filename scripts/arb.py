@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Shared ARB loading layer for the i18n scripts.
+
+Parsed ARB files (key order, values and @metadata) are cached in a binary
+sidecar next to the ARB file (``.app_ko.arb.cache``). The cache is keyed by
+file size, mtime and a content hash, so repeated runs in one CI job or
+pre-commit chain skip JSON decoding entirely.
+
+``iter_arb_entries`` streams entries without materializing the document,
+for inputs too large to load (merged bundles, historical snapshots).
+
+Usage:
+    python3 scripts/arb.py check <arb_file>...   # validate JSON syntax
+    python3 scripts/arb.py keys <arb_file>       # print sorted message keys
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+
+from arb_profile import count
+
+# Magic + Python minor version (marshal format is interpreter specific)
+_CACHE_MAGIC = b'ARBC' + bytes(sys.version_info[:2])
+# size, mtime_ns, blake2b-128 content digest
+_CACHE_HEADER = struct.Struct('<6sQq16s')
+
+
+def cache_path(arb_file_path: str) -> str:
+    """Return the sidecar cache path for an ARB file."""
+    directory, name = os.path.split(arb_file_path)
+    return os.path.join(directory, f'.{name}.cache')
+
+
+def content_digest(raw: bytes) -> bytes:
+    """Hash ARB file contents for cache validation."""
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _read_cache(path: str, st, raw=None):
+    """Return cached data for an ARB file, or None if the cache is stale."""
+    try:
+        with open(cache_path(path), 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    if len(blob) < _CACHE_HEADER.size:
+        return None
+    magic, size, mtime_ns, digest = _CACHE_HEADER.unpack_from(blob)
+    if magic != _CACHE_MAGIC:
+        return None
+
+    if size != st.st_size or mtime_ns != st.st_mtime_ns:
+        # Touched but possibly unchanged (git checkout, editor save)
+        if raw is None or content_digest(raw) != digest:
+            return None
+    try:
+        return marshal.loads(blob[_CACHE_HEADER.size:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_cache(path: str, st, raw: bytes, data: dict):
+    """Write the sidecar cache atomically; failures are not fatal."""
+    target = cache_path(path)
+    tmp = f'{target}.{os.getpid()}.tmp'
+    header = _CACHE_HEADER.pack(_CACHE_MAGIC, st.st_size, st.st_mtime_ns,
+                                content_digest(raw))
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(header)
+            f.write(marshal.dumps(data))
+        os.replace(tmp, target)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def load_arb(arb_file_path: str, use_cache: bool = True) -> dict:
+    """
+    Load an ARB file as an ordered dict of keys, values and @metadata.
+
+    Each call returns a fresh dict that callers may mutate.
+    """
+    st = os.stat(arb_file_path)
+    if use_cache:
+        data = _read_cache(arb_file_path, st)
+        if data is not None:
+            count('cache_hits')
+            return data
+
+    with open(arb_file_path, 'rb') as f:
+        raw = f.read()
+    count('bytes_read', len(raw))
+
+    if use_cache:
+        data = _read_cache(arb_file_path, st, raw)
+        if data is not None:
+            # Content unchanged: refresh size/mtime so the next run hits the fast path
+            _write_cache(arb_file_path, st, raw, data)
+            count('cache_hits')
+            return data
+
+    data = json.loads(raw.decode('utf-8'))
+    if not isinstance(data, dict):
+        raise ValueError(f'{arb_file_path}: ARB root must be a JSON object')
+    if use_cache:
+        _write_cache(arb_file_path, st, raw, data)
+    return data
+
+
+def refresh_cache(arb_file_path: str, raw: bytes, data: dict):
+    """Record just-written ARB contents in the parse cache."""
+    _write_cache(arb_file_path, os.stat(arb_file_path), raw, data)
+
+
+def message_keys(data: dict) -> list:
+    """Return message keys (excluding @metadata and @@locale) in file order."""
+    return [key for key in data if not key.startswith('@')]
+
+
+def find_project_root(start: str = None) -> str:
+    """Return the nearest directory at or above start containing l10n.yaml."""
+    path = os.path.abspath(start or os.getcwd())
+    while True:
+        if os.path.isfile(os.path.join(path, 'l10n.yaml')):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            # Fall back to the repository root this script lives in
+            return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        path = parent
+
+
+def load_l10n_config(project_root: str = None) -> dict:
+    """
+    Read the flat ``key: value`` settings from l10n.yaml.
+
+    Returns a dict with at least 'project_root', 'arb-dir' and
+    'template-arb-file'; 'arb-dir' is resolved to an absolute path.
+    """
+    root = project_root or find_project_root()
+    config = {'arb-dir': 'lib/l10n', 'template-arb-file': 'app_en.arb'}
+    try:
+        with open(os.path.join(root, 'l10n.yaml'), 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if ':' not in line:
+                    continue
+                name, value = (part.strip() for part in line.split(':', 1))
+                value = value.strip('\'"')
+                if value in ('true', 'false'):
+                    value = value == 'true'
+                config[name] = value
+    except OSError:
+        pass
+    config['project_root'] = root
+    config['arb-dir'] = os.path.join(root, config['arb-dir'])
+    return config
+
+
+def locale_of(arb_file_path: str) -> str:
+    """Return the locale suffix of an ARB file name (app_ko.arb -> ko)."""
+    stem = os.path.splitext(os.path.basename(arb_file_path))[0]
+    return stem.split('_', 1)[1] if '_' in stem else stem
+
+
+def discover_arb_files(config: dict = None) -> list:
+    """
+    List every locale ARB file in the configured arb-dir.
+
+    Files share the template's prefix (app_ko.arb -> app_*.arb); the
+    template comes first, the other locales follow in name order.
+    """
+    config = config or load_l10n_config()
+    arb_dir = config['arb-dir']
+    template = config['template-arb-file']
+    prefix = template.split('_', 1)[0] + '_' if '_' in template else ''
+    names = sorted(name for name in os.listdir(arb_dir)
+                   if name.startswith(prefix) and name.endswith('.arb'))
+    if template in names:
+        names.remove(template)
+        names.insert(0, template)
+    return [os.path.join(arb_dir, name) for name in names]
+
+
+def _run_captured(func, path, args):
+    import io
+    from contextlib import redirect_stdout
+
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        result = func(path, *args)
+    return buffer.getvalue(), result
+
+
+def run_per_locale(func, arb_files, *args, max_workers: int = None) -> list:
+    """
+    Call ``func(path, *args)`` for each ARB file on a process pool.
+
+    Each call's printed output is replayed in input order, and results are
+    returned in input order. A single file runs in-process. func must be a
+    module-level function so it can be sent to worker processes.
+    """
+    arb_files = list(arb_files)
+    workers = min(len(arb_files), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [func(path, *args) for path in arb_files]
+
+    # Imported lazily: multiprocessing dominates the cold start of quick commands
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_captured, func, path, args) for path in arb_files]
+        results = []
+        for future in futures:
+            output, result = future.result()
+            sys.stdout.write(output)
+            results.append(result)
+    return results
+
+
+# Characters that may continue a JSON number ('' means end of buffer)
+_NUMBER_CHARS = frozenset('0123456789.eE+-') | {''}
+
+
+class _StreamBuffer:
+    """Text window over a file that only holds unconsumed input."""
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Drop consumed text and read one more chunk. Returns False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f'expected {chars!r} but found {ch or "EOF"!r}')
+        self.pos += 1
+        return ch
+
+    def decode(self, decoder) -> object:
+        """Decode one complete JSON value, reading more input as needed."""
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number cut at the chunk boundary decodes as a shorter number
+            if (not isinstance(value, (str, dict, list))
+                    and self.buf[end:end + 1] in _NUMBER_CHARS and self.fill()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_arb_entries(f, chunk_size: int = 1 << 16):
+    """
+    Stream top-level ARB entries as ``(section, key, value)`` tuples.
+
+    Reads ``f`` (a text file object) chunk by chunk, so memory is bounded
+    by the largest single entry rather than the file size. Streams may hold
+    several concatenated ARB documents, and a message key whose value is an
+    object (a merged multi-locale bundle such as ``{"ko": {...}}``) is
+    walked as a section; ``section`` is the tuple of enclosing section keys.
+    """
+    stream = _StreamBuffer(f, chunk_size)
+    decoder = json.JSONDecoder()
+
+    while stream.peek():
+        stream.expect('{')
+        sections = []
+        first = True
+        while True:
+            ch = stream.expect('}"' if first else '},')
+            if ch == '}':
+                if not sections:
+                    break
+                sections.pop()
+                first = False
+                continue
+            if ch == ',':
+                stream.expect('"')
+            # Let the decoder consume the key string from its opening quote
+            stream.pos -= 1
+
+            key = stream.decode(decoder)
+            stream.expect(':')
+            if stream.peek() == '{' and not key.startswith('@'):
+                stream.pos += 1
+                sections.append(key)
+                first = True
+                continue
+
+            yield tuple(sections), key, stream.decode(decoder)
+            first = False
+
+
+def _main(argv):
+    if len(argv) < 2 or argv[0] not in ('check', 'keys'):
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+
+    command, paths = argv[0], argv[1:]
+    if command == 'keys':
+        print('\n'.join(sorted(message_keys(load_arb(paths[0])))))
+        return 0
+
+    for path in paths:
+        try:
+            load_arb(path)
+        except (ValueError, OSError) as e:
+            print(f"❌ {path}: {e}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Duplicate and near-duplicate ARB values: string reuse candidates.
+
+Exact duplicates: every key's values are normalized (NFKC, case-folded,
+whitespace collapsed) and hashed across all locales; keys with the same
+hash have identical text in every locale and can share one message.
+
+Near-duplicates: character-shingle MinHash signatures are bucketed with
+LSH bands, so only keys that share a bucket are compared (no O(n^2) pass);
+candidate pairs are confirmed with exact Jaccard similarity and joined
+into groups.
+
+Groups are ranked by the translated characters consolidation would save.
+
+Usage: python3 scripts/arbtool.py duplicates [--min-similarity 0.8] [--limit N] [--format json]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import unicodedata
+import zlib
+
+from arb import discover_arb_files, load_l10n_config
+from arb_matrix import ArbMatrix
+
+_WHITESPACE = re.compile(r'\s+')
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16  # 16 bands x 4 rows: pairs above ~0.5 Jaccard usually share a bucket
+_PRIME = (1 << 61) - 1
+# Fixed (a, b) pairs so results are reproducible across runs
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(b'a%d' % i, digest_size=8).digest(), 'little') % (_PRIME - 1) + 1,
+     int.from_bytes(hashlib.blake2b(b'b%d' % i, digest_size=8).digest(), 'little') % _PRIME)
+    for i in range(NUM_PERM)
+]
+
+
+def normalize(value: str) -> str:
+    """Canonical form for comparison: NFKC, case-folded, whitespace collapsed."""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFKC', value)).strip().casefold()
+
+
+def shingles(text: str) -> set:
+    """Character n-grams of text (the whole text if it is shorter than n)."""
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def minhash(shingle_set: set) -> tuple:
+    hashes = [zlib.crc32(s.encode('utf-8')) for s in shingle_set]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def _texts(matrix: ArbMatrix) -> dict:
+    """``{key: (normalized value per locale)}`` for keys present in every locale."""
+    columns = [matrix.values[locale] for locale in matrix.locales]
+    texts = {}
+    for i, key in enumerate(matrix.keys):
+        values = [column[i] for column in columns]
+        if all(isinstance(value, str) and value.strip() for value in values):
+            texts[key] = tuple(normalize(value) for value in values)
+    return texts
+
+
+def exact_duplicates(texts: dict) -> list:
+    """Groups of keys whose normalized values are identical in every locale."""
+    groups = {}
+    for key, values in texts.items():
+        digest = hashlib.blake2b('\x1f'.join(values).encode('utf-8'), digest_size=16).digest()
+        groups.setdefault(digest, []).append(key)
+    return [keys for keys in groups.values() if len(keys) > 1]
+
+
+def near_duplicates(texts: dict, min_similarity: float, exclude=()) -> list:
+    """
+    Groups of keys whose values are similar (Jaccard >= min_similarity over
+    character shingles of all locales), found through MinHash LSH buckets.
+    Keys in ``exclude`` (already exact duplicates) are skipped.
+    """
+    exclude = set(exclude)
+    shingle_sets = {}
+    buckets = {}
+    rows = NUM_PERM // BANDS
+    for key, values in texts.items():
+        if key in exclude:
+            continue
+        # Locale-tagged shingles, so similarity must hold in every locale at once
+        shingle_set = {f'{n}:{s}' for n, value in enumerate(values) for s in shingles(value)}
+        shingle_sets[key] = shingle_set
+        signature = minhash(shingle_set)
+        for band in range(BANDS):
+            buckets.setdefault((band, signature[band * rows:(band + 1) * rows]), []).append(key)
+
+    parent = {}
+
+    def find(key):
+        while parent[key] != key:
+            key = parent[key]
+        return key
+
+    checked = set()
+    for bucket in buckets.values():
+        for i, first in enumerate(bucket):
+            for second in bucket[i + 1:]:
+                pair = (first, second) if first < second else (second, first)
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                a, b = shingle_sets[first], shingle_sets[second]
+                if len(a & b) / len(a | b) >= min_similarity:
+                    parent.setdefault(first, first)
+                    parent.setdefault(second, second)
+                    parent[find(first)] = find(second)
+
+    order = {key: i for i, key in enumerate(texts)}
+    groups = {}
+    for key in parent:
+        groups.setdefault(find(key), []).append(key)
+    return [sorted(keys, key=order.get) for keys in groups.values() if len(keys) > 1]
+
+
+def rank_groups(matrix: ArbMatrix, groups: list, kind: str) -> list:
+    """Consolidation candidates with the translated characters they would save."""
+    ranked = []
+    for keys in groups:
+        rows = [matrix.row(key) for key in keys]
+        saving = sum(len(value) for row in rows[1:] for value in row.values())
+        ranked.append({'kind': kind, 'saving': saving, 'keys': keys,
+                       'values': {locale: rows[0][locale] for locale in matrix.locales}})
+    return ranked
+
+
+def _preview(value: str, width: int = 50) -> str:
+    value = _WHITESPACE.sub(' ', value)
+    return repr(value if len(value) <= width else value[:width - 1] + '…')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find duplicate and near-duplicate ARB values')
+    parser.add_argument('arb_files', nargs='*',
+                        help="ARB files (default: every app_*.arb in l10n.yaml's arb-dir)")
+    parser.add_argument('--min-similarity', type=float, default=0.8,
+                        help='Jaccard threshold for near-duplicates (default: 0.8)')
+    parser.add_argument('--limit', type=int, default=30, help='candidates to print (default: 30, 0 = all)')
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    args = parser.parse_args(argv)
+
+    arb_files = args.arb_files or discover_arb_files(load_l10n_config())
+    matrix = ArbMatrix.from_files(arb_files)
+    texts = _texts(matrix)
+
+    exact = exact_duplicates(texts)
+    near = near_duplicates(texts, args.min_similarity, exclude=[key for keys in exact for key in keys])
+    candidates = rank_groups(matrix, exact, 'exact') + rank_groups(matrix, near, 'near')
+    candidates.sort(key=lambda c: (-c['saving'], c['keys'][0]))
+    shown = candidates[:args.limit] if args.limit else candidates
+
+    if args.format == 'json':
+        json.dump(shown, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+
+    print(f"🔍 {len(texts)} keys present in all {len(matrix.locales)} locales ({', '.join(matrix.locales)})")
+    print(f"📋 {len(exact)} exact duplicate groups, {len(near)} near-duplicate groups "
+          f"(Jaccard >= {args.min_similarity})")
+    print("")
+    for rank, candidate in enumerate(shown, 1):
+        values = ' / '.join(_preview(value) for value in candidate['values'].values())
+        print(f"{rank:>3}. [{candidate['kind']}] saves {candidate['saving']} chars: {values}")
+        for key in candidate['keys']:
+            print(f"       {key}")
+    if len(shown) < len(candidates):
+        print(f"\n... {len(candidates) - len(shown)} more (use --limit 0)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
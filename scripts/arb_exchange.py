@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Streaming XLIFF 2.0 / CSV export and import for translator handoff.
+
+Export writes one unit per template message: the key, the template text
+(source), the target locale's text, the description, the placeholders and
+the MEDICAL REVIEW flag, optionally filtered by key prefix, by the flag or
+by review status (review_store.py). Import applies the targets of a
+returned file to the target locale ARB in one merge pass and replaces the
+file atomically (only if something changed); keys the ARB does not have
+yet are appended.
+
+Both directions stream: ARB files are read with ``arb.iter_arb_entries``,
+XLIFF with ``iterparse`` and CSV row by row, and the two inputs of each
+direction are merge-joined on the key. Inputs in the same key order (as
+exported) join with no buffering; entries read ahead of their partner are
+parked, and the park spills to a temporary SQLite file once it grows past
+SPILL_LIMIT entries, so memory stays flat even for 100k-key bundles
+(apart from the key names, which a first pass over each ARB collects to
+find duplicate keys; json.loads keeps the last one, and so do we).
+
+CSV files use the fragment layout of add_arb_keys.py
+(key,description,<source>,<target>,placeholders,medical_review).
+
+Usage:
+    python3 scripts/arbtool.py export [--format xliff|csv] [--locale en] [--prefix checkin_]
+                                      [--medical-only] [--review-status pending] [-o FILE]
+    python3 scripts/arbtool.py import FILE [--locale en]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from contextlib import nullcontext
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import escape, quoteattr
+
+from arb import discover_arb_files, iter_arb_entries, load_l10n_config, locale_of
+from arb_profile import count
+from arb_writer import ArbStreamWriter
+
+XLIFF_NS = 'urn:oasis:names:tc:xliff:document:2.0'
+CSV_FIELDS = ('key', 'description', 'placeholders', 'medical_review')
+SPILL_LIMIT = 4096
+
+_MISSING = object()
+
+
+class Lookahead:
+    """
+    Take items by key from an ordered ``(key, item)`` stream.
+
+    Items read past while looking for a key are parked for a later take;
+    beyond ``limit`` parked items they move to a temporary SQLite table.
+    Items must be JSON-serializable.
+    """
+
+    def __init__(self, items, limit: int = SPILL_LIMIT):
+        self._items = iter(items)
+        self._limit = limit
+        self._parked = {}
+        self._db = None
+        self._dir = None
+
+    def _spill(self):
+        if self._db is None:
+            self._dir = tempfile.TemporaryDirectory(prefix='arb_exchange.')
+            self._db = sqlite3.connect(os.path.join(self._dir.name, 'park.db'))
+            self._db.execute('CREATE TABLE park (seq INTEGER PRIMARY KEY, key TEXT UNIQUE, item TEXT)')
+        self._db.executemany('INSERT OR REPLACE INTO park (key, item) VALUES (?, ?)',
+                             ((key, json.dumps(item)) for key, item in self._parked.items()))
+        count('spilled', len(self._parked))
+        self._parked.clear()
+
+    def _unpark(self, key):
+        item = self._parked.pop(key, _MISSING)
+        if item is _MISSING and self._db is not None:
+            row = self._db.execute('SELECT item FROM park WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self._db.execute('DELETE FROM park WHERE key = ?', (key,))
+                item = json.loads(row[0])
+        return item
+
+    def take(self, key):
+        """Return the item for key (removing it), or None if the stream has none."""
+        item = self._unpark(key)
+        if item is not _MISSING:
+            return item
+        for found, item in self._items:
+            if found == key:
+                return item
+            self._parked[found] = item
+            if len(self._parked) > self._limit:
+                self._spill()
+        return None
+
+    def remaining(self):
+        """Yield every item not taken yet, in stream order."""
+        if self._db is not None:
+            self._spill()
+            for key, item in self._db.execute('SELECT key, item FROM park ORDER BY seq'):
+                yield key, json.loads(item)
+        else:
+            yield from self._parked.items()
+        self._parked = {}
+        yield from self._items
+        self.close()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._dir.cleanup()
+            self._db = None
+
+
+def _repeated_keys(f) -> dict:
+    """``{key: occurrences}`` for the message keys that appear more than once in f."""
+    seen = set()
+    repeated = {}
+    for section, key, _ in iter_arb_entries(f):
+        if section or key.startswith('@'):
+            continue
+        if key in seen:
+            repeated[key] = repeated.get(key, 1) + 1
+        seen.add(key)
+    return repeated
+
+
+def iter_messages(f):
+    """
+    Stream ``(key, value, metadata)`` per message of an ARB file.
+
+    ``@key`` metadata is attached to the message before it, as the ARB
+    tools write it; ``@@`` globals are skipped. A key that appears more
+    than once is yielded once, at its last occurrence, as json.loads keeps
+    the last; finding repeats takes a first pass over the keys, so f must
+    be seekable.
+    """
+    start = f.tell()
+    repeated = _repeated_keys(f)
+    f.seek(start)
+    for key, n in repeated.items():
+        print(f"⚠️  {getattr(f, 'name', 'ARB')}: duplicate key '{key}' ({n} times, last one kept)",
+              file=sys.stderr)
+
+    current = None
+    for section, key, value in iter_arb_entries(f):
+        if section or key.startswith('@@'):
+            continue
+        if key.startswith('@'):
+            if current is not None and key[1:] == current[0]:
+                current[2] = value if isinstance(value, dict) else None
+            continue
+        if current is not None:
+            yield tuple(current)
+            current = None
+        if key in repeated:
+            repeated[key] -= 1
+            if repeated[key]:
+                # An earlier occurrence; its @metadata is skipped with it
+                continue
+        current = [key, value, None]
+    if current is not None:
+        yield tuple(current)
+
+
+def is_medical(metadata) -> bool:
+    return isinstance(metadata, dict) and 'MEDICAL REVIEW' in str(metadata.get('description', ''))
+
+
+def export_units(source_file, target_file, prefixes=(), medical_only: bool = False, keys=None):
+    """
+    Merge-join the template and target ARB streams into export units.
+
+    Yields ``(key, source, target or None, description, placeholders, medical)``.
+    """
+    targets = Lookahead((key, value) for key, value, _ in iter_messages(target_file)) \
+        if target_file is not None else None
+    try:
+        for key, value, metadata in iter_messages(source_file):
+            target = targets.take(key) if targets is not None else None
+            medical = is_medical(metadata)
+            if prefixes and not key.startswith(tuple(prefixes)):
+                continue
+            if (medical_only and not medical) or (keys is not None and key not in keys):
+                continue
+            metadata = metadata or {}
+            description = metadata.get('description')
+            yield (key, value, target, description if isinstance(description, str) else None,
+                   metadata.get('placeholders'), medical)
+    finally:
+        if targets is not None:
+            targets.close()
+
+
+def write_xliff(units, out, source_locale: str, target_locale: str) -> int:
+    """Write units as an XLIFF 2.0 document; returns the number of units."""
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write(f'<xliff xmlns="{XLIFF_NS}" version="2.0" '
+              f'srcLang={quoteattr(source_locale)} trgLang={quoteattr(target_locale)}>\n')
+    out.write(' <file id="arb">\n')
+    written = 0
+    for key, source, target, description, placeholders, medical in units:
+        notes = []
+        if description:
+            notes.append(f'    <note category="description">{escape(description)}</note>\n')
+        if placeholders:
+            notes.append(f'    <note category="placeholders">'
+                         f'{escape(json.dumps(placeholders, ensure_ascii=False))}</note>\n')
+        if medical:
+            notes.append('    <note category="medical-review">required</note>\n')
+        state = 'translated' if target is not None else 'initial'
+        out.write(f'  <unit id={quoteattr(key)}>\n')
+        if notes:
+            out.write('   <notes>\n' + ''.join(notes) + '   </notes>\n')
+        out.write(f'   <segment state="{state}">\n    <source>{escape(str(source))}</source>\n')
+        if target is not None:
+            out.write(f'    <target>{escape(str(target))}</target>\n')
+        out.write('   </segment>\n  </unit>\n')
+        written += 1
+    out.write(' </file>\n</xliff>\n')
+    return written
+
+
+def write_csv(units, out, source_locale: str, target_locale: str) -> int:
+    """Write units as CSV in the add_arb_keys fragment layout; returns the number of rows."""
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(['key', 'description', source_locale, target_locale, 'placeholders', 'medical_review'])
+    written = 0
+    for key, source, target, description, placeholders, medical in units:
+        writer.writerow([key, description or '', source, '' if target is None else target,
+                         json.dumps(placeholders, ensure_ascii=False) if placeholders else '',
+                         'required' if medical else ''])
+        written += 1
+    return written
+
+
+def read_xliff(path: str):
+    """
+    Stream a returned XLIFF 2.0 file.
+
+    Returns ``(target locale, iterator of (key, target text))``; units
+    without a target are skipped.
+    """
+    events = iterparse(path, events=('start', 'end'))
+    unit_tag, xliff_tag = f'{{{XLIFF_NS}}}unit', f'{{{XLIFF_NS}}}xliff'
+    target_tag = f'{{{XLIFF_NS}}}target'
+
+    _, root = next(events)
+    if root.tag != xliff_tag:
+        raise ValueError(f'{path}: not an XLIFF 2.0 document')
+
+    def units():
+        stack = [root]
+        for event, element in events:
+            if event == 'start':
+                stack.append(element)
+                continue
+            stack.pop()
+            if element.tag != unit_tag:
+                continue
+            targets = element.iter(target_tag)
+            texts = [''.join(target.itertext()) for target in targets]
+            if texts:
+                yield element.get('id'), ''.join(texts)
+            # Drop the processed unit so the tree never grows
+            stack[-1].remove(element)
+
+    return root.get('trgLang'), units()
+
+
+def read_csv(f, locale: str = None, template_locale: str = None):
+    """
+    Stream a returned CSV file.
+
+    Returns ``(locale, iterator of (key, text))``; the locale column is
+    ``locale`` or else the only column that is not the template's.
+    """
+    reader = csv.DictReader(f)
+    columns = [name for name in reader.fieldnames or () if name not in CSV_FIELDS]
+    if locale is None:
+        candidates = [name for name in columns if name != template_locale]
+        if len(candidates) != 1:
+            raise ValueError(f"cannot tell the target locale from columns {columns}; use --locale")
+        locale = candidates[0]
+    elif locale not in columns:
+        raise ValueError(f'no {locale!r} column (columns: {", ".join(columns)})')
+    return locale, ((row['key'], row[locale]) for row in reader if row[locale] != '')
+
+
+def import_translations(arb_path: str, incoming) -> dict:
+    """
+    Apply ``(key, text)`` pairs to an ARB file in one streaming merge pass
+    (after a pass over its keys to find duplicates, whose text goes to the
+    last occurrence).
+
+    The file is replaced atomically, and only if a value changed or a key
+    was added. Returns counts of 'updated', 'identical' and 'added' keys.
+    """
+    counts = {'updated': 0, 'identical': 0, 'added': 0}
+    translations = Lookahead(incoming)
+    try:
+        with open(arb_path, encoding='utf-8') as f, ArbStreamWriter(arb_path) as writer:
+            repeated = _repeated_keys(f)
+            f.seek(0)
+            for section, key, value in iter_arb_entries(f):
+                if not section and not key.startswith('@'):
+                    if key in repeated and repeated[key] > 1:
+                        # json.loads keeps the last occurrence; earlier ones are copied as they are
+                        repeated[key] -= 1
+                        text = None
+                    else:
+                        text = translations.take(key)
+                    if text is not None:
+                        if text == value:
+                            counts['identical'] += 1
+                        else:
+                            counts['updated'] += 1
+                            value = text
+                writer.write(key, value)
+            for key, text in translations.remaining():
+                writer.write(key, text)
+                counts['added'] += 1
+            if counts['updated'] or counts['added']:
+                writer.commit()
+    finally:
+        translations.close()
+    return counts
+
+
+def _review_keys(status: str, locale: str, config: dict) -> set:
+    import review_store
+    path = review_store.default_db_path(config)
+    if not os.path.exists(path):
+        raise ValueError(f'no review database at {os.path.relpath(path)} (run: arbtool tag --review-db)')
+    conn = review_store.connect(path)
+    try:
+        return {key for (key,) in conn.execute(
+            'SELECT key FROM review WHERE status = ? AND locale = ?', (status, locale))}
+    finally:
+        conn.close()
+
+
+def export_main(argv=None):
+    parser = argparse.ArgumentParser(description='Export ARB messages to XLIFF 2.0 or CSV')
+    parser.add_argument('--format', choices=('xliff', 'csv'), default='xliff')
+    parser.add_argument('--locale', help='target locale (default: the first non-template locale)')
+    parser.add_argument('--prefix', action='append', default=[], help='only keys with this prefix (repeatable)')
+    parser.add_argument('--medical-only', action='store_true', help='only MEDICAL REVIEW tagged keys')
+    parser.add_argument('--review-status', choices=('pending', 'approved', 'rejected'),
+                        help='only keys with this status in the review store (template locale)')
+    parser.add_argument('-o', '--output', help='output file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    config = load_l10n_config()
+    arb_files = discover_arb_files(config)
+    template = arb_files[0]
+    targets = {locale_of(path): path for path in arb_files[1:]}
+    target_locale = args.locale or next(iter(targets), locale_of(template))
+    if target_locale != locale_of(template) and target_locale not in targets:
+        print(f"❌ No ARB file for locale '{target_locale}'", file=sys.stderr)
+        return 1
+
+    try:
+        keys = (_review_keys(args.review_status, locale_of(template), config)
+                if args.review_status else None)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    write = write_xliff if args.format == 'xliff' else write_csv
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        with open(template, encoding='utf-8') as source, \
+                open(targets.get(target_locale, template), encoding='utf-8') as target:
+            units = export_units(source, target, args.prefix, args.medical_only, keys)
+            written = write(units, out, locale_of(template), target_locale)
+    finally:
+        if args.output:
+            out.close()
+    if args.output:
+        print(f"✅ Exported {written} messages ({locale_of(template)} -> {target_locale}) to {args.output}")
+    return 0
+
+
+def import_main(argv=None):
+    parser = argparse.ArgumentParser(description='Import translations from XLIFF 2.0 or CSV into an ARB file')
+    parser.add_argument('file', help='returned .xlf/.xliff or .csv file')
+    parser.add_argument('--locale', help="target locale (default: the XLIFF trgLang / the CSV's locale column)")
+    args = parser.parse_args(argv)
+
+    config = load_l10n_config()
+    arb_files = {locale_of(path): path for path in discover_arb_files(config)}
+    template_locale = locale_of(config['template-arb-file'])
+
+    try:
+        csv_input = args.file.endswith('.csv')
+        with open(args.file, encoding='utf-8', newline='') if csv_input else nullcontext() as f:
+            if csv_input:
+                locale, incoming = read_csv(f, args.locale, template_locale)
+            else:
+                locale, incoming = read_xliff(args.file)
+                locale = args.locale or locale
+            if locale not in arb_files:
+                raise ValueError(f"no ARB file for locale '{locale}'")
+            counts = import_translations(arb_files[locale], incoming)
+    except (OSError, ValueError, SyntaxError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    print(f"✅ {os.path.basename(arb_files[locale])}: {counts['updated']} updated, "
+          f"{counts['added']} added, {counts['identical']} unchanged")
+    return 0
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command not in ('export', 'import'):
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(2)
+    sys.exit((export_main if command == 'export' else import_main)(sys.argv[2:]))
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Text-expansion and overflow risk analysis across locales.
+
+Every value of every locale is measured in terminal-style display columns
+(East Asian Width: wide and fullwidth characters count 2, combining marks
+and format characters 0, ambiguous characters 1 unless --ambiguous-wide)
+and compared with the template locale. Multi-line values count their
+widest line; ICU arguments count as PLACEHOLDER_WIDTH columns and a
+plural/select counts its longest branch.
+
+A key is flagged when its width exceeds the template width times the
+budget of the first matching rule in EXPANSION_BUDGETS (weekday columns,
+tabs, buttons and labels have little room; body text wraps and gets
+DEFAULT_BUDGET). Values narrower than MIN_WIDTH columns are never flagged.
+
+All locales are measured in one pass: the values are joined into one
+code point array, each distinct code point is classified once and the
+widths are summed per line with array operations. NumPy is used when it
+is installed; without it the same computation runs in pure Python.
+
+Usage: python3 scripts/arbtool.py expansion [arb_files...] [--locale en] [--limit N]
+                                            [--format json] [--fail]
+"""
+
+import argparse
+import json
+import sys
+import unicodedata
+
+from arb import discover_arb_files, load_l10n_config
+from arb_matrix import ArbMatrix
+from icu_message import IcuSyntaxError, parse_message
+from medical_rules import INCLUDE, RuleSet
+
+try:
+    import numpy as np
+except ImportError:  # optional: the pure-Python path gives the same results
+    np = None
+
+# (name, pattern, maximum width ratio vs the template); first match wins
+EXPANSION_BUDGETS = [
+    ('weekday', r'^tracking_weekday_', 1.5),
+    ('tab', r'_tab_', 1.5),
+    ('unit', r'_unit$', 1.5),
+    ('button', r'_button(?:_|$)|Button$', 1.6),
+    ('label', r'_label$|Label$', 2.0),
+    ('title', r'_title$|Title$', 2.0),
+]
+DEFAULT_BUDGET = 2.5
+
+PLACEHOLDER_WIDTH = 4
+MIN_WIDTH = 4
+
+_ZERO_WIDTH_CATEGORIES = frozenset(('Mn', 'Me', 'Cf', 'Cc'))
+
+
+def budget_rules(budgets=None) -> RuleSet:
+    """RuleSet whose rule names are budget names."""
+    return RuleSet([(name, pattern, INCLUDE) for name, pattern, _ in budgets or EXPANSION_BUDGETS])
+
+
+def char_width(ch: str, ambiguous_wide: bool = False) -> int:
+    """Display columns of one character."""
+    if unicodedata.category(ch) in _ZERO_WIDTH_CATEGORIES:
+        return 0
+    eaw = unicodedata.east_asian_width(ch)
+    if eaw in ('W', 'F'):
+        return 2
+    return 2 if eaw == 'A' and ambiguous_wide else 1
+
+
+def _render(ast: tuple) -> str:
+    parts = []
+    for node in ast:
+        if isinstance(node, str):
+            parts.append(node)
+        elif node[2]:
+            parts.append(max((_render(branch) for _, branch in node[2]), key=len))
+        else:
+            parts.append('0' * PLACEHOLDER_WIDTH)
+    return ''.join(parts)
+
+
+def display_text(value: str, use_escaping: bool = False) -> str:
+    """The widest text a message can display (arguments filled, longest branch)."""
+    if '{' not in value and not (use_escaping and "'" in value):
+        return value
+    try:
+        return _render(parse_message(value, use_escaping))
+    except IcuSyntaxError:
+        return value
+
+
+def _widths_numpy(texts: list, ambiguous_wide: bool):
+    # One code point array for everything; values are separated like lines
+    codes = np.frombuffer('\n'.join(texts).encode('utf-32-le'), dtype=np.uint32)
+    if not len(codes):
+        return np.zeros(len(texts), dtype=np.int64)
+    # Classify each distinct code point once, then look every character up
+    distinct = np.flatnonzero(np.bincount(codes))
+    table = np.zeros(int(distinct[-1]) + 1, dtype=np.int32)
+    table[distinct] = [char_width(chr(c), ambiguous_wide) for c in distinct.tolist()]
+    # Width before each line break: line widths are differences between them
+    breaks = np.flatnonzero(codes == 0x0A)
+    before = np.concatenate(([0], np.cumsum(table[codes])))
+    edges = np.concatenate(([0], before[breaks], [before[-1]]))
+    line_widths = np.diff(edges)
+    lines_per_value = np.fromiter((text.count('\n') + 1 for text in texts), dtype=np.int64, count=len(texts))
+    value_starts = np.concatenate(([0], np.cumsum(lines_per_value)[:-1]))
+    return np.maximum.reduceat(line_widths, value_starts)
+
+
+def _widths_python(texts: list, ambiguous_wide: bool) -> list:
+    table = {}
+    widths = []
+    for text in texts:
+        widest = 0
+        for line in text.split('\n'):
+            width = 0
+            for ch in line:
+                w = table.get(ch)
+                if w is None:
+                    w = table[ch] = char_width(ch, ambiguous_wide)
+                width += w
+            if width > widest:
+                widest = width
+        widths.append(widest)
+    return widths
+
+
+def display_widths(texts, ambiguous_wide: bool = False):
+    """Display width (widest line) of each text: an int array with NumPy, else a list."""
+    texts = list(texts)
+    if np is None:
+        return _widths_python(texts, ambiguous_wide)
+    if not texts:
+        return np.zeros(0, dtype=np.int64)
+    return _widths_numpy(texts, ambiguous_wide)
+
+
+def key_budgets(keys, budgets=None, default: float = DEFAULT_BUDGET):
+    """``(budget names, ratios)`` aligned with keys ('default' / default where no rule matches)."""
+    budgets = budgets or EXPANSION_BUDGETS
+    rules = budget_rules(budgets)
+    ratios = {name: ratio for name, _, ratio in budgets}
+    names = []
+    for key in keys:
+        rule = rules.match(key)
+        names.append(rule.name if rule is not None else 'default')
+    return names, [ratios.get(name, default) for name in names]
+
+
+def width_matrix(matrix: ArbMatrix, use_escaping: bool = False, ambiguous_wide: bool = False):
+    """
+    Widths of every locale, measured in one pass: rows follow matrix.locales,
+    columns matrix.keys, -1 where a locale has no string value.
+    """
+    texts = []
+    present = []
+    for locale in matrix.locales:
+        for value in matrix.values[locale]:
+            is_text = isinstance(value, str)
+            texts.append(display_text(value, use_escaping) if is_text else '')
+            present.append(is_text)
+    widths = display_widths(texts, ambiguous_wide)
+    shape = (len(matrix.locales), len(matrix.keys))
+    if np is not None:
+        return np.where(np.array(present, dtype=bool), widths, -1).reshape(shape)
+    n = shape[1]
+    return [[width if ok else -1 for width, ok in zip(widths[i * n:(i + 1) * n], present[i * n:(i + 1) * n])]
+            for i in range(shape[0])]
+
+
+def _over_numpy(widths, limits: list) -> list:
+    base = widths[0]
+    limits = np.asarray(limits, dtype=np.float64)
+    over = (base > 0) & (widths[1:] >= MIN_WIDTH) & (widths[1:] > base * limits)
+    rows, columns = np.nonzero(over)
+    return list(zip((rows + 1).tolist(), columns.tolist(),
+                    base[columns].tolist(), widths[rows + 1, columns].tolist()))
+
+
+def _over_python(widths: list, limits: list) -> list:
+    base = widths[0]
+    return [(row, i, b, w)
+            for row in range(1, len(widths))
+            for i, (b, w, limit) in enumerate(zip(base, widths[row], limits))
+            if b > 0 and w >= MIN_WIDTH and w > b * limit]
+
+
+def over_budget(matrix: ArbMatrix, budgets=None, default: float = DEFAULT_BUDGET,
+                use_escaping: bool = False, ambiguous_wide: bool = False) -> list:
+    """
+    Keys whose width in a locale exceeds the template width times their budget.
+
+    Returns ``[{'locale', 'key', 'budget', 'limit', 'template_width', 'width', 'ratio'}]``,
+    worst (width / allowed width) first.
+    """
+    widths = width_matrix(matrix, use_escaping, ambiguous_wide)
+    names, limits = key_budgets(matrix.keys, budgets, default)
+    over = (_over_numpy if np is not None else _over_python)(widths, limits)
+    flagged = [{'locale': matrix.locales[row], 'key': matrix.keys[i], 'budget': names[i],
+                'limit': limits[i], 'template_width': base, 'width': width,
+                'ratio': round(width / base, 2)}
+               for row, i, base, width in over]
+    flagged.sort(key=lambda f: (-f['width'] / (f['template_width'] * f['limit']), f['locale'], f['key']))
+    return flagged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Flag translations that expand past their width budget')
+    parser.add_argument('arb_files', nargs='*',
+                        help="ARB files, template first (default: every app_*.arb in l10n.yaml's arb-dir)")
+    parser.add_argument('--locale', action='append', help='only report this locale (repeatable)')
+    parser.add_argument('--default-budget', type=float, default=DEFAULT_BUDGET,
+                        help=f'width ratio for keys no budget rule matches (default: {DEFAULT_BUDGET})')
+    parser.add_argument('--ambiguous-wide', action='store_true',
+                        help='count East Asian ambiguous-width characters as 2 columns')
+    parser.add_argument('--limit', type=int, default=30, help='keys to print (default: 30, 0 = all)')
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    parser.add_argument('--fail', action='store_true', help='exit 1 if any key is over budget (for hooks)')
+    args = parser.parse_args(argv)
+
+    config = load_l10n_config()
+    arb_files = args.arb_files or discover_arb_files(config)
+    matrix = ArbMatrix.from_files(arb_files)
+    flagged = over_budget(matrix, default=args.default_budget,
+                          use_escaping=config.get('use-escaping') is True, ambiguous_wide=args.ambiguous_wide)
+    if args.locale:
+        flagged = [f for f in flagged if f['locale'] in args.locale]
+    shown = flagged[:args.limit] if args.limit else flagged
+
+    if args.format == 'json':
+        json.dump(shown, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 1 if args.fail and flagged else 0
+
+    template = matrix.locales[0]
+    print(f"🔍 Display width vs {template} for {len(matrix.keys)} keys in "
+          f"{len(matrix.locales) - 1} locales ({'numpy' if np is not None else 'pure Python'})")
+    for locale in matrix.locales[1:]:
+        if args.locale and locale not in args.locale:
+            continue
+        count = sum(1 for f in flagged if f['locale'] == locale)
+        print(f"  {'⚠️ ' if count else '✅'} {locale}: {count} keys over budget")
+    if shown:
+        print("")
+    for f in shown:
+        value = matrix.value(f['locale'], f['key'])
+        print(f"  {f['locale']}: {f['key']}  {f['template_width']} -> {f['width']} cols "
+              f"(x{f['ratio']}, {f['budget']} budget x{f['limit']}): {value!r}")
+    if len(shown) < len(flagged):
+        print(f"\n... {len(flagged) - len(shown)} more (use --limit 0)")
+    return 1 if args.fail and flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
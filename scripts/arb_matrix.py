@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Columnar in-memory store for a multi-locale ARB set.
+
+``ArbMatrix`` keeps one interned key table shared by every locale, one
+value column per locale aligned with it (None where a locale lacks the
+key) and one column of ``__slots__`` ``Metadata`` records. Equal strings
+(values, descriptions) are stored once, and equal metadata records are
+shared between keys and locales, so whole-matrix operations (all locales
+x all keys) touch compact lists instead of one dict per locale plus one
+dict per ``@key``.
+
+Usage: python3 scripts/arb_matrix.py [arb_files...]   # print the footprint
+"""
+
+import json
+import sys
+
+from arb import load_arb, locale_of
+
+_MISSING = object()
+
+
+class Metadata:
+    """
+    Immutable, shared record for one ``@key`` entry.
+
+    ``description`` is the description string, ``placeholders`` and
+    ``extra`` (every other field, including a description that is not a
+    string) are canonical JSON; each is None when absent. Records are
+    shared between keys and locales, so they cannot be changed once built.
+    """
+
+    __slots__ = ('description', 'placeholders', 'extra')
+
+    def __init__(self, description, placeholders, extra):
+        object.__setattr__(self, 'description', description)
+        object.__setattr__(self, 'placeholders', placeholders)
+        object.__setattr__(self, 'extra', extra)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'Metadata records are shared and immutable (cannot set {name!r})')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'Metadata records are shared and immutable (cannot delete {name!r})')
+
+    def to_dict(self) -> dict:
+        entry = {}
+        if self.description is not None:
+            entry['description'] = self.description
+        if self.placeholders is not None:
+            entry['placeholders'] = json.loads(self.placeholders)
+        if self.extra is not None:
+            entry.update(json.loads(self.extra))
+        return entry
+
+
+class ArbMatrix:
+    """Keys x locales table of ARB values and metadata."""
+
+    __slots__ = ('keys', 'locales', 'values', 'metadata', 'globals', '_index', '_strings', '_records')
+
+    def __init__(self):
+        self.keys = []        # interned message keys, template order first
+        self.locales = []     # locale names, template first
+        self.values = {}      # locale -> [value or None] aligned with keys
+        self.metadata = {}    # locale -> [Metadata or None] aligned with keys
+        self.globals = {}     # locale -> {'@@locale': ..., ...}
+        self._index = {}
+        self._strings = {}
+        self._records = {}
+
+    @classmethod
+    def from_files(cls, arb_files):
+        """Build a matrix from ARB files (template first); each dict is dropped after conversion."""
+        matrix = cls()
+        for path in arb_files:
+            matrix.add_locale(locale_of(path), load_arb(path))
+        return matrix
+
+    def _share(self, text):
+        if text is None:
+            return None
+        return self._strings.setdefault(text, text)
+
+    def _record(self, entry) -> Metadata:
+        if not isinstance(entry, dict):
+            entry = {'description': entry}
+        description = entry.get('description')
+        placeholders = entry.get('placeholders')
+        # A description that is not a string is kept as it is, with the other fields
+        plain = ('description', 'placeholders') if isinstance(description, str) else ('placeholders',)
+        extra = {k: v for k, v in entry.items() if k not in plain}
+        # Canonical JSON both identifies equal records and stores nested data compactly
+        signature = (
+            description if isinstance(description, str) else None,
+            json.dumps(placeholders, ensure_ascii=False, separators=(',', ':')) if placeholders is not None else None,
+            json.dumps(extra, ensure_ascii=False, separators=(',', ':')) if extra else None,
+        )
+        record = self._records.get(signature)
+        if record is None:
+            record = self._records[signature] = Metadata(*map(self._share, signature))
+        return record
+
+    def _key_index(self, key: str) -> int:
+        i = self._index.get(key)
+        if i is None:
+            i = self._index[key] = len(self.keys)
+            self.keys.append(sys.intern(key))
+            for column in self.values.values():
+                column.append(None)
+            for column in self.metadata.values():
+                column.append(None)
+        return i
+
+    def add_locale(self, locale: str, data: dict):
+        """Add (or replace) one locale from a parsed ARB dict."""
+        if locale not in self.values:
+            self.locales.append(locale)
+        values = self.values[locale] = [None] * len(self.keys)
+        metadata = self.metadata[locale] = [None] * len(self.keys)
+        self.globals[locale] = {}
+
+        for key, value in data.items():
+            if key.startswith('@@'):
+                self.globals[locale][key] = value
+            elif key.startswith('@'):
+                i = self._key_index(key[1:])
+                metadata[i] = self._record(value)
+            else:
+                i = self._key_index(key)
+                values[i] = self._share(value) if isinstance(value, str) else value
+
+    def index(self, key: str) -> int:
+        return self._index[key]
+
+    def value(self, locale: str, key: str, default=None):
+        i = self._index.get(key)
+        return default if i is None else self.values[locale][i]
+
+    def row(self, key: str) -> dict:
+        """``{locale: value}`` for one key across all locales."""
+        i = self._index[key]
+        return {locale: self.values[locale][i] for locale in self.locales}
+
+    def missing(self, locale: str, reference: str = None) -> list:
+        """Keys present in reference (default: template locale) but not in locale."""
+        reference = self.values[reference or self.locales[0]]
+        column = self.values[locale]
+        return [key for key, ref, value in zip(self.keys, reference, column)
+                if ref is not None and value is None]
+
+    def to_dict(self, locale: str) -> dict:
+        """Rebuild the locale's ARB dict (metadata fields as description, placeholders, rest)."""
+        data = dict(self.globals[locale])
+        for key, value, record in zip(self.keys, self.values[locale], self.metadata[locale]):
+            if value is not None:
+                data[key] = value
+            if record is not None:
+                data[f'@{key}'] = record.to_dict()
+        return data
+
+
+def _retained_mb(build) -> float:
+    import gc
+    import tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained / (1 << 20)
+
+
+def main(argv=None):
+    import argparse
+    from arb import discover_arb_files
+    parser = argparse.ArgumentParser(description='Compare ArbMatrix and dict-of-dicts memory')
+    parser.add_argument('arb_files', nargs='*',
+                        help="ARB files (default: every app_*.arb in l10n.yaml's arb-dir)")
+    args = parser.parse_args(argv)
+    arb_files = args.arb_files or discover_arb_files()
+
+    dicts = _retained_mb(lambda: [load_arb(path) for path in arb_files])
+    matrix = _retained_mb(lambda: ArbMatrix.from_files(arb_files))
+    print(f"dict-of-dicts: {dicts:8.2f} MB")
+    print(f"ArbMatrix:     {matrix:8.2f} MB ({matrix / dicts:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Conflict-aware merge of incoming ARB entries into an existing locale.
+
+Each incoming message key (with its ``@metadata``) is classified in one
+pass over the incoming entries:
+
+  new                 key not in the ARB yet            -> always inserted
+  identical           same value and metadata           -> nothing to do
+  value-conflict      different value                   -> per policy
+  metadata-conflict   same value, different metadata    -> per policy
+
+Policies: ``keep`` (leave existing entries alone), ``overwrite`` (take the
+incoming value/metadata) and ``fail`` (raise MergeConflict before anything
+is written). Whatever the policy, review tags already present in an
+existing description (``MEDICAL REVIEW REQUIRED``) are carried over into
+the incoming metadata, and existing metadata fields the incoming entry
+does not set are kept, so re-running an insertion never drops tags added
+by the tagging scripts.
+"""
+
+NEW = 'new'
+IDENTICAL = 'identical'
+VALUE_CONFLICT = 'value-conflict'
+METADATA_CONFLICT = 'metadata-conflict'
+OUTCOMES = (NEW, IDENTICAL, VALUE_CONFLICT, METADATA_CONFLICT)
+
+POLICIES = ('keep', 'overwrite', 'fail')
+
+MEDICAL_REVIEW_MARKER = 'MEDICAL REVIEW'
+MEDICAL_REVIEW_SUFFIX = ' - MEDICAL REVIEW REQUIRED'
+
+
+class MergeConflict(ValueError):
+    """Raised by the 'fail' policy; ``conflicts`` lists (outcome, key, existing, incoming)."""
+
+    def __init__(self, conflicts: list, source: str = ''):
+        first = conflicts[0]
+        super().__init__(f"{source + ': ' if source else ''}{len(conflicts)} conflicting entries "
+                         f"(first: {first[1]} {first[0]})")
+        self.conflicts = conflicts
+
+
+def merge_metadata(existing, incoming):
+    """Incoming metadata on top of existing fields, keeping existing review tags."""
+    if not isinstance(incoming, dict):
+        return existing if incoming is None else incoming
+    if not isinstance(existing, dict):
+        return incoming
+    merged = {**existing, **incoming}
+    old = existing.get('description', '')
+    new = merged.get('description', '')
+    if (isinstance(old, str) and isinstance(new, str)
+            and MEDICAL_REVIEW_MARKER in old and MEDICAL_REVIEW_MARKER not in new):
+        merged['description'] = f"{new}{MEDICAL_REVIEW_SUFFIX}" if new else old
+    return merged
+
+
+def merge_entries(existing: dict, incoming: dict, policy: str = 'keep', source: str = ''):
+    """
+    Merge incoming ARB entries into existing ones.
+
+    Returns:
+        (updates, counts, conflicts): ``updates`` maps entry keys to the
+        values to set, ``counts`` maps each outcome to a number of keys and
+        ``conflicts`` lists ``(outcome, key, existing, incoming)``.
+
+    Raises:
+        MergeConflict: with policy 'fail', if any entry conflicts
+    """
+    if policy not in POLICIES:
+        raise ValueError(f'unknown merge policy {policy!r} (expected one of {", ".join(POLICIES)})')
+
+    updates = {}
+    counts = dict.fromkeys(OUTCOMES, 0)
+    conflicts = []
+
+    for key, value in incoming.items():
+        if key.startswith('@@'):
+            continue
+        if key.startswith('@'):
+            # Metadata without its key in this batch is merged on its own
+            if key[1:] in incoming:
+                continue
+            name, value = key[1:], None
+        else:
+            name = key
+
+        metadata_key = f'@{name}'
+        incoming_metadata = incoming.get(metadata_key)
+        existing_metadata = existing.get(metadata_key)
+        merged_metadata = (merge_metadata(existing_metadata, incoming_metadata)
+                           if incoming_metadata is not None else existing_metadata)
+        metadata_changed = merged_metadata != existing_metadata
+
+        if key.startswith('@'):
+            outcome = IDENTICAL if not metadata_changed else (
+                NEW if existing_metadata is None else METADATA_CONFLICT)
+        elif name not in existing:
+            outcome = NEW
+        elif existing[name] != value:
+            outcome = VALUE_CONFLICT
+        elif metadata_changed:
+            outcome = METADATA_CONFLICT
+        else:
+            outcome = IDENTICAL
+        counts[outcome] += 1
+
+        if outcome == IDENTICAL:
+            continue
+        if outcome in (VALUE_CONFLICT, METADATA_CONFLICT):
+            conflicts.append((outcome, name,
+                              existing.get(name) if outcome == VALUE_CONFLICT else existing_metadata,
+                              value if outcome == VALUE_CONFLICT else merged_metadata))
+            if policy != 'overwrite':
+                continue
+
+        if value is not None and existing.get(name) != value:
+            updates[name] = value
+        if metadata_changed:
+            updates[metadata_key] = merged_metadata
+
+    if policy == 'fail' and conflicts:
+        raise MergeConflict(conflicts, source)
+    return updates, counts, conflicts
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Phase timing and counters for the ARB scripts (``--profile``).
+
+Scripts mark their phases with ``phase('parse')`` and report counts with
+``count('keys', n)``; both are no-ops unless a command runs inside
+``profiling()``. A profiled run emits one JSON line with per-phase wall
+and CPU time, counters (keys, regex evaluations, bytes read and written)
+and totals, and can additionally dump a cProfile and a tracemalloc
+snapshot for offline analysis.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+
+_active = None
+
+
+class Profile:
+    """Accumulated phase timings and counters of one command run."""
+
+    def __init__(self, command: str):
+        self.command = command
+        self.phases = {}
+        self.counters = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.phases.setdefault(name, [0.0, 0.0])
+            totals[0] += time.perf_counter() - wall
+            totals[1] += time.process_time() - cpu
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def record(self, wall: float, cpu: float) -> dict:
+        return {
+            'command': self.command,
+            'timestamp': round(time.time(), 3),
+            'wall_s': round(wall, 6),
+            'cpu_s': round(cpu, 6),
+            'phases': {name: {'wall_s': round(w, 6), 'cpu_s': round(c, 6)}
+                       for name, (w, c) in self.phases.items()},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+
+def phase(name: str):
+    """Time a phase of the active profiled run (no-op when not profiling)."""
+    return _active.phase(name) if _active is not None else contextlib.nullcontext()
+
+
+def count(name: str, n: int = 1):
+    """Add n to a counter of the active profiled run (no-op when not profiling)."""
+    if _active is not None:
+        _active.count(name, n)
+
+
+def profiling_enabled(args) -> bool:
+    return bool(args.profile or args.profile_output or args.profile_dump)
+
+
+def add_profile_arguments(parser):
+    """Add --profile, --profile-output and --profile-dump to an argparse parser."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', action='store_true',
+                       help='emit per-phase timings and counters as a JSON line on stderr')
+    group.add_argument('--profile-output', metavar='FILE',
+                       help='append the profile JSON line to FILE instead (implies --profile)')
+    group.add_argument('--profile-dump', metavar='PREFIX',
+                       help='also write PREFIX.prof (cProfile) and PREFIX.tracemalloc '
+                            '(tracemalloc snapshot) (implies --profile)')
+
+
+def _regex_evaluations() -> int:
+    from medical_rules import REPORT_RULES, V1_RULES, V2_RULES
+    return sum(rules.regex_evaluations for rules in (V1_RULES, V2_RULES, REPORT_RULES))
+
+
+@contextlib.contextmanager
+def profiling(command: str, args):
+    """Profile the enclosed command run if args request it (see add_profile_arguments)."""
+    global _active
+    if not profiling_enabled(args):
+        yield None
+        return
+
+    profile = Profile(command)
+    profiler = None
+    if args.profile_dump:
+        import cProfile
+        import tracemalloc
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+
+    regex_before = _regex_evaluations()
+    _active = profile
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    if profiler:
+        profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profiler:
+            profiler.disable()
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        _active = None
+        profile.count('regex_evaluations', _regex_evaluations() - regex_before)
+
+        record = profile.record(wall, cpu)
+        if profiler:
+            profiler.dump_stats(f'{args.profile_dump}.prof')
+            tracemalloc.take_snapshot().dump(f'{args.profile_dump}.tracemalloc')
+            record['peak_traced_mb'] = round(tracemalloc.get_traced_memory()[1] / (1 << 20), 3)
+            tracemalloc.stop()
+
+        line = json.dumps(record, ensure_ascii=False)
+        if args.profile_output:
+            os.makedirs(os.path.dirname(os.path.abspath(args.profile_output)), exist_ok=True)
+            with open(args.profile_output, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        else:
+            print(line, file=sys.stderr)
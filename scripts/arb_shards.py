@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Feature-sharded ARB layout and the merge build for flutter gen-l10n.
+
+Each locale can be kept as one shard per feature, named after the key
+prefix (``checkin_``, ``tracking_``, ``onboarding_``, ...):
+
+  lib/l10n/shards/ko/checkin.arb
+  lib/l10n/shards/ko/tracking.arb
+  lib/l10n/shards/en/checkin.arb
+  ...
+
+Every shard is a valid ARB file (with ``@@locale``) holding the keys of
+its feature plus their ``@metadata``. ``build`` merges the shards of each
+locale into the single app_<locale>.arb that ``flutter gen-l10n`` reads.
+Keys already in the merged ARB keep their position (new keys follow their
+neighbour in the shards, first build: shards in name order), so a build
+only changes the entries whose shards changed. Shard hashes are recorded
+in .dart_tool/arbtool/shards.cache, and a locale is only rebuilt when one of
+its shards was added, removed or changed; a merged ARB edited by hand
+since the last build is never overwritten without --force.
+
+Usage: python3 scripts/arbtool.py shards split|build|status [--shard-dir DIR] [--force]
+"""
+
+import argparse
+import json
+import marshal
+import os
+import sys
+
+from arb import content_digest, discover_arb_files, load_arb, load_l10n_config, locale_of
+from arb_writer import atomic_write
+
+_CACHE_VERSION = 1
+
+UNCHANGED = 'unchanged'
+BUILT = 'built'
+
+
+def feature_of(key: str) -> str:
+    """Feature shard of an entry: its key prefix (``@checkin_x`` -> ``checkin``, ``_x`` -> ``common``)."""
+    name = key.lstrip('@')
+    return (name.split('_', 1)[0] if '_' in name else '') or 'common'
+
+
+def shard_root(config: dict) -> str:
+    return os.path.join(config['arb-dir'], 'shards')
+
+
+def cache_file(project_root: str) -> str:
+    return os.path.join(project_root, '.dart_tool', 'arbtool', 'shards.cache')
+
+
+def render_arb(data: dict) -> str:
+    """ARB text in the project's format (2-space indent, no trailing newline)."""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def split_entries(data: dict) -> dict:
+    """Split one locale's entries into ``{feature: entries}``; ``@@`` globals go into every shard."""
+    globals_ = {key: value for key, value in data.items() if key.startswith('@@')}
+    shards = {}
+    for key, value in data.items():
+        if key.startswith('@@'):
+            continue
+        shards.setdefault(feature_of(key), dict(globals_))[key] = value
+    return shards
+
+
+def shard_files(root: str) -> dict:
+    """``{locale: {feature: path}}`` for the shards under root."""
+    layout = {}
+    if not os.path.isdir(root):
+        return layout
+    for locale in sorted(os.listdir(root)):
+        directory = os.path.join(root, locale)
+        if not os.path.isdir(directory):
+            continue
+        shards = {os.path.splitext(name)[0]: os.path.join(directory, name)
+                  for name in sorted(os.listdir(directory)) if name.endswith('.arb')}
+        if shards:
+            layout[locale] = shards
+    return layout
+
+
+def merge_shards(paths) -> dict:
+    """
+    Merge shard files (in the given order) into one ARB dict.
+
+    Raises ValueError if a key appears in more than one shard.
+    """
+    merged = {}
+    origin = {}
+    for path in paths:
+        for key, value in load_arb(path).items():
+            if key.startswith('@@'):
+                merged.setdefault(key, value)
+                continue
+            if key in origin:
+                raise ValueError(f'{key} is defined in both {origin[key]} and {path}')
+            merged[key] = value
+            origin[key] = path
+    return merged
+
+
+def keep_order(merged: dict, reference) -> dict:
+    """
+    Reorder merged entries like ``reference`` (the keys of the previous
+    output), so a build only changes the entries that changed. Keys not in
+    reference follow the entry that precedes them in the shards.
+    """
+    reference = [key for key in reference if key in merged]
+    known = set(reference)
+    inserted = {}  # anchor (None = start) -> new keys
+    previous = None
+    for key in merged:
+        if key not in known:
+            inserted.setdefault(previous, []).append(key)
+        previous = key
+
+    ordered = {}
+
+    def emit(anchor):
+        # Iterative: a new shard can insert thousands of keys in one chain
+        stack = inserted.get(anchor, [])[::-1]
+        while stack:
+            key = stack.pop()
+            ordered[key] = merged[key]
+            stack.extend(inserted.get(key, [])[::-1])
+
+    emit(None)
+    for key in reference:
+        ordered[key] = merged[key]
+        emit(key)
+    return ordered
+
+
+def _load_state(path: str) -> dict:
+    try:
+        with open(path, 'rb') as f:
+            version, state = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    return state if version == _CACHE_VERSION else {}
+
+
+def _save_state(path: str, state: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            marshal.dump((_CACHE_VERSION, state), f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _stamp(path: str):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _digest(path: str, known: dict) -> bytes:
+    """Content digest of path, reusing ``known[path]`` while its stamp is unchanged."""
+    stamp = _stamp(path)
+    cached = known.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, 'rb') as f:
+        digest = content_digest(f.read())
+    known[path] = (stamp, digest)
+    return digest
+
+
+def _output_path(config: dict, locale: str) -> str:
+    prefix = config['template-arb-file'].split('_', 1)[0]
+    return os.path.join(config['arb-dir'], f'{prefix}_{locale}.arb')
+
+
+def split(config: dict, root: str, force: bool = False) -> dict:
+    """
+    Write the shards of every locale ARB. Returns ``{locale: number of shards}``.
+
+    The ARB files themselves are left as they are and recorded as built from
+    the new shards, so the first ``build`` only rewrites a locale once one of
+    its shards changes.
+
+    Raises FileExistsError if a locale already has shards (unless force).
+    """
+    existing = shard_files(root)
+    written = {}
+    for path in discover_arb_files(config):
+        locale = locale_of(path)
+        if locale in existing and not force:
+            raise FileExistsError(f'{os.path.relpath(os.path.join(root, locale))} already has shards (use --force)')
+        directory = os.path.join(root, locale)
+        os.makedirs(directory, exist_ok=True)
+        shards = split_entries(load_arb(path))
+        for feature, entries in shards.items():
+            atomic_write(os.path.join(directory, f'{feature}.arb'), render_arb(entries))
+        # Shards of features that no longer exist would be merged back in
+        for feature, stale in existing.get(locale, {}).items():
+            if feature not in shards:
+                os.remove(stale)
+        written[locale] = len(shards)
+
+    state_path = cache_file(config['project_root'])
+    state = _load_state(state_path)
+    known = state.setdefault('files', {})
+    builds = state.setdefault('builds', {})
+    for locale, shards in shard_files(root).items():
+        if locale in written:
+            inputs = [(feature, _digest(path, known)) for feature, path in shards.items()]
+            builds[locale] = (inputs, _digest(_output_path(config, locale), known))
+    _save_state(state_path, state)
+    return written
+
+
+def build(config: dict, root: str, force: bool = False) -> dict:
+    """
+    Merge each locale's shards into app_<locale>.arb where a shard changed.
+
+    Returns:
+        ``{locale: 'built' | 'unchanged'}``
+
+    Raises:
+        RuntimeError: if a merged ARB was edited since the last build (unless force)
+        ValueError: if a key is defined in two shards of one locale
+    """
+    state_path = cache_file(config['project_root'])
+    state = _load_state(state_path)
+    known = state.setdefault('files', {})
+    builds = state.setdefault('builds', {})
+    results = {}
+
+    for locale, shards in shard_files(root).items():
+        output = _output_path(config, locale)
+        inputs = [(feature, _digest(path, known)) for feature, path in shards.items()]
+        previous = builds.get(locale)
+        current = _digest(output, known) if os.path.exists(output) else None
+
+        if previous is not None and current != previous[1] and not force:
+            raise RuntimeError(f'{os.path.basename(output)} was edited since the last shard build; '
+                               f'move the change into {os.path.relpath(os.path.join(root, locale))} or use --force')
+        if not force and previous is not None and previous[0] == inputs:
+            results[locale] = UNCHANGED
+            continue
+
+        merged = merge_shards(shards.values())
+        if current is not None:
+            merged = keep_order(merged, load_arb(output))
+        content = render_arb(merged).encode('utf-8')
+        digest = content_digest(content)
+        # Same text as before (e.g. a shard was only re-saved): leave the file alone
+        if digest != current:
+            atomic_write(output, content)
+        _digest(output, known)
+        builds[locale] = (inputs, digest)
+        results[locale] = BUILT if digest != current else UNCHANGED
+
+    # Drop stamps of files that are gone, so the cache does not grow forever
+    state['files'] = {path: entry for path, entry in known.items() if os.path.exists(path)}
+    _save_state(state_path, state)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Split ARB files into feature shards and merge them back')
+    parser.add_argument('action', choices=('split', 'build', 'status'),
+                        help='split: write shards from the ARB files; build: merge changed shards '
+                             'into the ARB files; status: list shards per locale')
+    parser.add_argument('--shard-dir', help="shard root (default: shards/ in l10n.yaml's arb-dir)")
+    parser.add_argument('--force', action='store_true',
+                        help='split over existing shards / rebuild even if unchanged or edited by hand')
+    args = parser.parse_args(argv)
+
+    config = load_l10n_config()
+    root = os.path.abspath(args.shard_dir) if args.shard_dir else shard_root(config)
+    relroot = os.path.relpath(root)
+
+    if args.action == 'status':
+        layout = shard_files(root)
+        if not layout:
+            print(f"📋 No shards in {relroot} (run: arbtool shards split)")
+            return 0
+        for locale, shards in layout.items():
+            print(f"📋 {locale}: {len(shards)} shards ({', '.join(shards)})")
+        return 0
+
+    try:
+        if args.action == 'split':
+            for locale, count in split(config, root, args.force).items():
+                print(f"✅ {locale}: {count} shards in {os.path.join(relroot, locale)}")
+            return 0
+        results = build(config, root, args.force)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if not results:
+        print(f"⚠️  No shards in {relroot} (run: arbtool shards split)")
+        return 1
+    for locale, result in results.items():
+        marker = '✅' if result == BUILT else '⏭ '
+        print(f"{marker} {locale}: {result}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
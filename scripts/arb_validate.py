@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+In-process ARB validator (replaces the multi-interpreter validate_arb.sh).
+
+Parses each locale ARB file once, checks message key parity against the
+template locale from l10n.yaml with set operations, and cross-checks ICU
+syntax and placeholders of every message in all locales (icu_message.py).
+
+Exit codes: 0 = valid, 1 = invalid JSON, missing files, key mismatches or
+placeholder/ICU errors (use --warn-only to report key mismatches without
+failing).
+
+Usage: python3 scripts/arbtool.py validate [--warn-only] [arb_files...]
+"""
+
+import argparse
+import os
+import sys
+
+from arb import discover_arb_files, load_arb, load_l10n_config, locale_of, message_keys
+from icu_message import check_placeholders
+
+
+def check_parity(template_keys: set, locale_keys: set):
+    """Return (missing, extra) message keys of a locale relative to the template."""
+    return template_keys - locale_keys, locale_keys - template_keys
+
+
+def validate_arb_files(arb_files, template_path: str, use_escaping: bool = False):
+    """
+    Parse ARB files, compare their key sets with the template and check
+    ICU syntax and placeholders.
+
+    Returns:
+        dict with 'errors' ({path: message} for unreadable files), 'counts'
+        ({path: key count}), 'parity' ({path: (missing, extra)}) and
+        'messages' (icu_message.check_placeholders issues, keyed by path)
+    """
+    result = {'errors': {}, 'counts': {}, 'parity': {}, 'messages': []}
+    datasets = {}
+    keys = {}
+    for path in arb_files:
+        try:
+            datasets[path] = load_arb(path)
+        except (ValueError, OSError) as e:
+            result['errors'][path] = str(e)
+            continue
+        keys[path] = set(message_keys(datasets[path]))
+        result['counts'][path] = len(keys[path])
+
+    template_keys = keys.get(template_path)
+    if template_keys is None:
+        return result
+    for path, locale_keys in keys.items():
+        if path != template_path:
+            result['parity'][path] = check_parity(template_keys, locale_keys)
+
+    result['messages'] = check_placeholders(datasets, template_path, use_escaping)
+    return result
+
+
+def print_result(result: dict, template_path: str) -> bool:
+    """Print validation results. Returns True if there were no key mismatches."""
+    print("📋 Checking JSON syntax...")
+    for path in result['counts']:
+        print(f"  ✓ {path}")
+    for path, message in result['errors'].items():
+        print(f"❌ Invalid ARB file: {path}: {message}")
+
+    print("📋 Checking key consistency...")
+    consistent = True
+    template_locale = locale_of(template_path)
+    for path, (missing, extra) in result['parity'].items():
+        locale = locale_of(path)
+        if missing:
+            consistent = False
+            print(f"⚠️  Missing {locale} keys (present in {template_locale}):")
+            for key in sorted(missing):
+                print(f"    {key}")
+        if extra:
+            consistent = False
+            print(f"⚠️  Extra {locale} keys (not in template {template_locale}):")
+            for key in sorted(extra):
+                print(f"    {key}")
+
+    print("📋 Checking ICU syntax and placeholders...")
+    for severity, path, key, message in result['messages']:
+        marker = '❌' if severity == 'error' else '⚠️ '
+        print(f"{marker} {locale_of(path)}: {key}: {message}")
+
+    print("")
+    print("📊 Key counts:")
+    for path, count in result['counts'].items():
+        print(f"  {locale_of(path)}: {count} keys")
+    return consistent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validate ARB syntax and key parity')
+    parser.add_argument('arb_files', nargs='*',
+                        help="ARB files (default: every app_*.arb in l10n.yaml's arb-dir)")
+    parser.add_argument('--warn-only', action='store_true',
+                        help='exit 0 on key mismatches (invalid files still fail)')
+    args = parser.parse_args(argv)
+
+    print("🔍 Validating ARB files...")
+
+    config = load_l10n_config()
+    template_path = os.path.relpath(os.path.join(config['arb-dir'], config['template-arb-file']))
+    arb_files = args.arb_files or [os.path.relpath(path) for path in discover_arb_files(config)]
+
+    if not os.path.isfile(template_path):
+        print(f"❌ Missing: {template_path}")
+        return 1
+    # Match the template however its path was typed (relative, absolute, via a symlink)
+    template_real = os.path.realpath(template_path)
+    given = [path for path in arb_files if os.path.realpath(path) == template_real]
+    if given:
+        template_path = given[0]
+    else:
+        arb_files.insert(0, template_path)
+
+    result = validate_arb_files(arb_files, template_path, config.get('use-escaping') is True)
+    consistent = print_result(result, template_path)
+
+    if result['errors'] or any(issue[0] == 'error' for issue in result['messages']):
+        print("")
+        print("❌ ARB validation failed")
+        return 1
+    if not consistent:
+        print("")
+        print("⚠️  ARB validation completed with warnings" if args.warn_only else "❌ ARB key mismatch")
+        return 0 if args.warn_only else 1
+
+    print("")
+    print("✅ ARB validation passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
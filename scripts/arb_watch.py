@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Watch mode: revalidate (and optionally retag) ARB files as they change.
+
+Keeps every locale of l10n.yaml's arb-dir parsed in memory and waits for
+changes through inotify (via ctypes, Linux) or, where that is not
+available, by polling file stamps. Only the changed file is re-parsed and
+only the checks it affects are re-run:
+
+  template changed   parity of every locale, placeholders of every locale
+  locale changed     parity and placeholders of that locale only
+
+Every changed file is also checked for medical keys without a MEDICAL
+REVIEW tag; with --retag they are tagged in place (v2 rules).
+
+Usage: python3 scripts/arbtool.py watch [--retag] [--poll] [--interval SECONDS]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import select
+import struct
+import sys
+import time
+
+from arb import discover_arb_files, load_arb, load_l10n_config, locale_of, message_keys
+from arb_validate import check_parity
+from icu_message import check_placeholders
+from medical_rules import V2_RULES
+
+# inotify(7) event masks
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_EVENT = struct.Struct('iIII')
+
+# Editors often save in several steps; changes within this window are batched
+DEBOUNCE_SECONDS = 0.02
+
+
+class InotifyWatcher:
+    """Directory watcher on Linux inotify, called through ctypes."""
+
+    def __init__(self, directory: str):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_CREATE | _IN_DELETE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f'inotify_add_watch failed for {directory}')
+
+    def _drain(self) -> set:
+        names = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            offset = 0
+            while offset < len(buffer):
+                _, _, _, length = _IN_EVENT.unpack_from(buffer, offset)
+                offset += _IN_EVENT.size
+                name = buffer[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name:
+                    names.add(os.fsdecode(name))
+
+    def wait(self, timeout: float = None) -> set:
+        """Block until files change; return the changed file names."""
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+        names = self._drain()
+        time.sleep(DEBOUNCE_SECONDS)
+        return names | self._drain()
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable fallback: compare size/mtime stamps every interval."""
+
+    def __init__(self, directory: str, interval: float = 0.1):
+        self.directory = directory
+        self.interval = interval
+        self._stamps = self._scan()
+
+    def _scan(self) -> dict:
+        stamps = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.arb'):
+                    st = entry.stat()
+                    stamps[entry.name] = (st.st_size, st.st_mtime_ns)
+        return stamps
+
+    def wait(self, timeout: float = None) -> set:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            stamps = self._scan()
+            changed = {name for name in stamps.keys() | self._stamps.keys()
+                       if stamps.get(name) != self._stamps.get(name)}
+            self._stamps = stamps
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+
+def open_watcher(directory: str, polling: bool = False, interval: float = 0.1):
+    """Return an inotify watcher, or a polling watcher if inotify is unavailable."""
+    if not polling:
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, interval)
+
+
+class WatchSession:
+    """In-memory locale set plus the incremental checks run on each change."""
+
+    def __init__(self, config: dict, retag: bool = False):
+        self.config = config
+        self.retag = retag
+        self.use_escaping = config.get('use-escaping') is True
+        self.template = os.path.join(config['arb-dir'], config['template-arb-file'])
+        self.data = {}
+        self.keys = {}
+        self.stamps = {}
+
+    def _stamp(self, path: str):
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    def _load(self, path: str) -> str:
+        """(Re)parse one file; returns an error message or None."""
+        try:
+            stamp = self._stamp(path)
+            data = load_arb(path)
+        except FileNotFoundError:
+            self.data.pop(path, None)
+            self.keys.pop(path, None)
+            self.stamps.pop(path, None)
+            return None
+        except (ValueError, OSError) as e:
+            return str(e)
+        self.data[path] = data
+        self.keys[path] = set(message_keys(data))
+        self.stamps[path] = stamp
+        return None
+
+    def start(self):
+        for path in discover_arb_files(self.config):
+            self._load(path)
+        self.check(list(self.data))
+
+    def changed_paths(self, names) -> list:
+        """Map watcher file names to ARB paths whose contents actually changed."""
+        arb_dir = self.config['arb-dir']
+        prefix = os.path.basename(self.template).split('_', 1)[0] + '_'
+        paths = []
+        for name in sorted(names):
+            if not (name.startswith(prefix) and name.endswith('.arb')):
+                continue
+            path = os.path.join(arb_dir, name)
+            try:
+                stamp = self._stamp(path)
+            except FileNotFoundError:
+                stamp = None
+            # Our own --retag writes (and no-op saves) leave the stamp unchanged
+            if stamp != self.stamps.get(path):
+                paths.append(path)
+        return paths
+
+    def _retag(self, path: str) -> int:
+        import add_medical_review_tags_v2
+        with contextlib.redirect_stdout(io.StringIO()):
+            added, _, _ = add_medical_review_tags_v2.add_medical_review_tags(path, incremental=True)
+        self._load(path)
+        return added
+
+    def check(self, changed: list) -> bool:
+        """Re-parse changed files and run the affected checks. Returns True if clean."""
+        start = time.perf_counter()
+        lines = []
+        errors = {}
+        for path in changed:
+            error = self._load(path)
+            if error:
+                errors[path] = error
+                lines.append(f"❌ {os.path.basename(path)}: invalid ARB: {error}")
+
+        template_keys = self.keys.get(self.template)
+        if template_keys is None:
+            lines.append(f"❌ template {os.path.basename(self.template)} is missing or invalid")
+        else:
+            # Template edits affect every locale; locale edits only themselves
+            affected = (list(self.data) if self.template in changed
+                        else [path for path in changed if path in self.data])
+            for path in affected:
+                if path == self.template:
+                    continue
+                missing, extra = check_parity(template_keys, self.keys[path])
+                locale = locale_of(path)
+                for key in sorted(missing):
+                    lines.append(f"⚠️  {locale}: missing {key}")
+                for key in sorted(extra):
+                    lines.append(f"⚠️  {locale}: extra {key}")
+
+            subset = {path: self.data[path] for path in affected}
+            subset[self.template] = self.data[self.template]
+            for severity, path, key, message in check_placeholders(subset, self.template, self.use_escaping):
+                marker = '❌' if severity == 'error' else '⚠️ '
+                lines.append(f"{marker} {locale_of(path)}: {key}: {message}")
+
+        for path in changed:
+            if path not in self.data or path in errors:
+                continue
+            data = self.data[path]
+            untagged = [key for key in self.keys[path] if V2_RULES.requires_review(key)
+                        and 'MEDICAL REVIEW' not in str((data.get(f'@{key}') or {}).get('description', ''))]
+            if not untagged:
+                continue
+            if self.retag:
+                lines.append(f"🏷  {locale_of(path)}: tagged {self._retag(path)} keys for MEDICAL REVIEW")
+            else:
+                lines.append(f"⚠️  {locale_of(path)}: {len(untagged)} medical keys without MEDICAL REVIEW tag")
+
+        elapsed = (time.perf_counter() - start) * 1000
+        names = ', '.join(os.path.basename(path) for path in changed)
+        status = '❌' if any(line.startswith('❌') for line in lines) else ('⚠️ ' if lines else '✅')
+        print(f"[{time.strftime('%H:%M:%S')}] {status} {names} ({elapsed:.0f} ms)")
+        for line in lines:
+            print(f"    {line}")
+        sys.stdout.flush()
+        return not lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Revalidate ARB files whenever they change')
+    parser.add_argument('--retag', action='store_true',
+                        help='add missing MEDICAL REVIEW tags (v2 rules) to changed files')
+    parser.add_argument('--poll', action='store_true', help='poll file stamps instead of using inotify')
+    parser.add_argument('--interval', type=float, default=0.1,
+                        help='polling interval in seconds (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    config = load_l10n_config()
+    session = WatchSession(config, retag=args.retag)
+    watcher = open_watcher(config['arb-dir'], polling=args.poll, interval=args.interval)
+    mode = 'inotify' if isinstance(watcher, InotifyWatcher) else f'polling every {args.interval}s'
+    print(f"👀 Watching {os.path.relpath(config['arb-dir'])} ({mode}); Ctrl-C to stop")
+
+    try:
+        session.start()
+        while True:
+            changed = session.changed_paths(watcher.wait())
+            if changed:
+                session.check(changed)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
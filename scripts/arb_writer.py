@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Minimal-diff, atomic ARB writer.
+
+ArbEditor records which entries changed and splices only those entries
+into the original file text, so key order, indentation and untouched
+entries stay byte-for-byte identical. Files are written through a temp
+file plus os.replace, so a crash never leaves a truncated ARB, and a run
+that changed nothing does not write at all (no git diff, no watcher
+events for IDE or ``flutter gen-l10n`` watchers).
+"""
+
+import json
+import os
+import tempfile
+
+from arb import load_arb, refresh_cache
+from arb_profile import count
+
+
+def entry_spans(text: str) -> dict:
+    """
+    Map each top-level key to the ``(key_start, value_start, value_end)``
+    offsets of its entry in the ARB text. Duplicate keys map to their last
+    occurrence, matching json.loads.
+    """
+    decoder = json.JSONDecoder()
+    spans = {}
+    pos = text.index('{') + 1
+    length = len(text)
+    while True:
+        while pos < length and text[pos] in ' \t\r\n,':
+            pos += 1
+        if pos >= length or text[pos] == '}':
+            return spans
+        key_start = pos
+        key, pos = decoder.raw_decode(text, pos)
+        pos = text.index(':', pos) + 1
+        while text[pos] in ' \t\r\n':
+            pos += 1
+        value_start = pos
+        _, pos = decoder.raw_decode(text, pos)
+        spans[key] = (key_start, value_start, pos)
+
+
+def _temp_file(path: str):
+    """Open a temp file next to path; returns ``(file, temp path)``."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+    return os.fdopen(fd, 'wb'), tmp
+
+
+def _install(tmp: str, path: str):
+    """Give tmp the mode of path (or a umask-based one) and move it over path."""
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        # New file: mkstemp's 0600 would ignore the umask
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    try:
+        os.chmod(tmp, mode)
+    except OSError:
+        pass
+    os.replace(tmp, path)
+
+
+def atomic_write(path: str, content):
+    """Write content (str or UTF-8 bytes) to path through a temp file in the same directory."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    count('bytes_written', len(content))
+    f, tmp = _temp_file(path)
+    try:
+        with f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        _install(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class ArbStreamWriter:
+    """
+    Write an ARB file entry by entry, in the project format (2-space
+    indent, no trailing newline), without holding the document in memory.
+
+    Entries go to a temp file that replaces path on ``commit()``; leaving
+    the ``with`` block without committing discards it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file, self._tmp = _temp_file(path)
+        self._entries = 0
+        self._bytes = 0
+
+    def write(self, key: str, value):
+        if isinstance(value, (dict, list)):
+            # An entry rendered on its own is indented exactly as in the whole document
+            entry = json.dumps({key: value}, ensure_ascii=False, indent=2)[2:-2]
+        else:
+            # Scalars need no indenting, so the C encoder can render them
+            entry = f'  {json.dumps(key, ensure_ascii=False)}: {json.dumps(value, ensure_ascii=False)}'
+        chunk = ('{\n' if not self._entries else ',\n') + entry
+        self._entries += 1
+        self._bytes += self._file.write(chunk.encode('utf-8'))
+
+    def commit(self):
+        self._bytes += self._file.write(b'\n}' if self._entries else b'{}')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        count('bytes_written', self._bytes)
+        _install(self._tmp, self.path)
+        self._tmp = None
+
+    def discard(self):
+        if self._tmp is not None:
+            self._file.close()
+            try:
+                os.remove(self._tmp)
+            except OSError:
+                pass
+            self._tmp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.discard()
+
+
+class ArbEditor:
+    """Track entry changes for one ARB file and write only those entries."""
+
+    def __init__(self, arb_file_path: str, data: dict = None):
+        """
+        Args:
+            arb_file_path: ARB file to edit
+            data: already-parsed contents (e.g. from load_arb); loaded if omitted
+        """
+        self.path = arb_file_path
+        self.data = data if data is not None else load_arb(arb_file_path)
+        self._original = set(self.data)
+        self._updated = {}   # existing key -> new value
+        self._inserted = {}  # anchor key (None = end of file) -> [new keys]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._updated or self._inserted)
+
+    @property
+    def changed_keys(self) -> list:
+        """Keys whose entries will be rewritten or inserted by save()."""
+        keys = list(self._updated)
+        for new_keys in self._inserted.values():
+            keys.extend(new_keys)
+        return keys
+
+    def set(self, key: str, value, after: str = None) -> bool:
+        """
+        Set an entry, recording it only if the value actually changes.
+
+        New keys are inserted after ``after``; by default ``@key`` follows
+        its message key and other keys go to the end of the file.
+        Returns True if the entry changed.
+        """
+        if key in self.data and self.data[key] == value:
+            return False
+        is_new = key not in self.data
+        self.data[key] = value
+        if not is_new and key in self._original:
+            self._updated[key] = value
+        elif is_new:
+            if after is None and key.startswith('@') and key[1:] in self.data:
+                after = key[1:]
+            elif after not in self.data:
+                after = None
+            self._inserted.setdefault(after, []).append(key)
+        return True
+
+    def render(self, text: str) -> str:
+        """Splice recorded changes into the original ARB text."""
+        spans = entry_spans(text)
+        if not spans:
+            return json.dumps(self.data, ensure_ascii=False, indent=2) + '\n'
+
+        # Reuse the file's own indentation for rewritten entries
+        first_key_start = min(start for start, _, _ in spans.values())
+        line_start = text.rfind('\n', 0, first_key_start) + 1
+        indent = text[line_start:first_key_start]
+
+        def serialize(value):
+            return json.dumps(value, ensure_ascii=False, indent=indent or None).replace('\n', '\n' + indent)
+
+        def inserted_after(anchor):
+            # Keys inserted after anchor, each followed by the keys inserted after it.
+            # Iterative: a recursive closure would be a reference cycle that keeps
+            # this editor (and its parsed data) alive until the cyclic GC runs.
+            parts = []
+            stack = self._inserted.get(anchor, [])[::-1]
+            while stack:
+                key = stack.pop()
+                parts.append(f",\n{indent}{json.dumps(key, ensure_ascii=False)}: {serialize(self.data[key])}")
+                stack.extend(self._inserted.get(key, [])[::-1])
+            return parts
+
+        edits = []  # (start, end, replacement)
+        for key, value in self._updated.items():
+            _, value_start, value_end = spans[key]
+            edits.append((value_start, value_end, serialize(value)))
+
+        last_end = max(end for _, _, end in spans.values())
+        for anchor in self._inserted:
+            if anchor is None or anchor in spans:
+                position = spans[anchor][2] if anchor is not None else last_end
+                edits.append((position, position, ''.join(inserted_after(anchor))))
+
+        edits.sort(key=lambda edit: edit[0])
+        out = []
+        pos = 0
+        for start, end, replacement in edits:
+            out.append(text[pos:start])
+            out.append(replacement)
+            pos = end
+        out.append(text[pos:])
+        return ''.join(out)
+
+    def save(self) -> bool:
+        """Write recorded changes atomically. Returns False (no write) if nothing changed."""
+        if not self.changed:
+            return False
+
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+        count('bytes_read', len(raw))
+        content = self.render(raw.decode('utf-8')).encode('utf-8')
+        atomic_write(self.path, content)
+
+        if not self._inserted:
+            # Key order is unchanged, so the parse cache can be refreshed in place
+            refresh_cache(self.path, content, self.data)
+
+        self._original = set(self.data)
+        self._updated = {}
+        self._inserted = {}
+        return True
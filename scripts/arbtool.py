@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+arbtool - single entry point for the ARB / i18n tooling.
+
+Usage: python3 scripts/arbtool.py <command> [options]
+
+Commands:
+  tag           Add MEDICAL REVIEW REQUIRED tags (v2 rules, --v1 for the legacy rules)
+  report        MEDICAL REVIEW tagged keys report
+  validate      Check ARB syntax and key parity with the template locale
+  add-keys      Insert keys from fragment files (scripts/arb_fragments) into every locale
+  unused        List template keys that no Dart file references
+  missing-keys  List Dart L10n getters that the template lacks
+  duplicates    Rank duplicate and near-duplicate values as reuse candidates
+  watch         Revalidate (and with --retag, retag) ARB files whenever they change
+  shards        Split ARB files into feature shards / merge changed shards back
+  gen-check     Emulate the flutter gen-l10n checks in-process (no Flutter needed)
+  review        MEDICAL REVIEW state store: pending keys, approvals, releases
+  export        Export messages to XLIFF 2.0 / CSV for translators and reviewers
+  import        Apply a returned XLIFF / CSV file to its locale ARB
+  expansion     Flag translations wider than their display-width budget vs the template
+  rules         Profile MEDICAL REVIEW rules: matches, shadowing, cost, excluded keys
+
+ARB paths are read from l10n.yaml. Each command imports only the modules
+it needs, so quick commands such as ``validate`` start fast enough for
+pre-commit hooks. Run ``arbtool <command> --help`` for command options;
+``tag``, ``report`` and ``add-keys`` accept ``--profile`` (arb_profile.py).
+"""
+
+import sys
+
+
+def _tag(argv):
+    if '--v1' in argv:
+        argv = [arg for arg in argv if arg != '--v1']
+        import add_medical_review_tags as tagger
+    else:
+        import add_medical_review_tags_v2 as tagger
+    return tagger.main(argv)
+
+
+def _report(argv):
+    import medical_review_report
+    return medical_review_report.main(argv)
+
+
+def _validate(argv):
+    import arb_validate
+    return arb_validate.main(argv)
+
+
+def _add_keys(argv):
+    import add_arb_keys
+    return add_arb_keys.main(argv)
+
+
+def _unused(argv):
+    import dart_usage
+    return dart_usage.main(argv)
+
+
+def _missing_keys(argv):
+    import dart_missing_keys
+    return dart_missing_keys.main(argv)
+
+
+def _duplicates(argv):
+    import arb_duplicates
+    return arb_duplicates.main(argv)
+
+
+def _watch(argv):
+    import arb_watch
+    return arb_watch.main(argv)
+
+
+def _shards(argv):
+    import arb_shards
+    return arb_shards.main(argv)
+
+
+def _gen_check(argv):
+    import gen_l10n_check
+    return gen_l10n_check.main(argv)
+
+
+def _review(argv):
+    import review_store
+    return review_store.main(argv)
+
+
+def _export(argv):
+    import arb_exchange
+    return arb_exchange.export_main(argv)
+
+
+def _import(argv):
+    import arb_exchange
+    return arb_exchange.import_main(argv)
+
+
+def _expansion(argv):
+    import arb_expansion
+    return arb_expansion.main(argv)
+
+
+def _rules(argv):
+    import rule_coverage
+    return rule_coverage.main(argv)
+
+
+COMMANDS = {
+    'tag': _tag,
+    'report': _report,
+    'validate': _validate,
+    'add-keys': _add_keys,
+    'unused': _unused,
+    'missing-keys': _missing_keys,
+    'duplicates': _duplicates,
+    'watch': _watch,
+    'shards': _shards,
+    'gen-check': _gen_check,
+    'review': _review,
+    'export': _export,
+    'import': _import,
+    'expansion': _expansion,
+    'rules': _rules,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print(__doc__.strip(), file=sys.stderr)
+        return 0 if argv and argv[0] in ('-h', '--help') else 2
+    return COMMANDS[argv[0]](argv[1:])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the i18n scripts on synthetic ARB files.
+
+For each size, generates ARB files with gen_synthetic_arb.py and measures
+wall time (best of --repeat runs), peak traced memory and memory still
+held by the result of each script and of its phases (parse, classify,
+write). The retained memory of ``parse`` (dict-of-dicts) and ``matrix``
+(arb_matrix.ArbMatrix) is summarized as a footprint comparison. Every run starts from a fresh
+copy of the generated files, so no parse cache or tag manifest carries
+over between runs.
+
+Results are compared against a stored baseline and every case slower or
+larger than it by more than --tolerance is reported. The baseline holds
+absolute seconds and MB from one machine, so by default the comparison
+is informational; --check turns it into a gate (exit 1) for runs on the
+machine that recorded the baseline.
+
+Usage: python3 scripts/bench_arb_scripts.py [--sizes 1000,10000,50000] [--locales N]
+                                            [--repeat N] [--check] [--update-baseline]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import add_medical_review_tags
+import add_medical_review_tags_v2
+import add_tracking_i18n
+import arb_exchange
+import arb_expansion
+import medical_review_report
+from arb import load_arb, message_keys
+from arb_matrix import ArbMatrix
+from arb_validate import validate_arb_files
+from arb_writer import ArbEditor
+from gen_synthetic_arb import write_synthetic_arb_files
+from icu_message import parse_message
+from medical_rules import REPORT_RULES, V2_RULES
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(SCRIPT_DIR, 'bench_baseline.json')
+LOCALES = ['ko', 'en', 'ja', 'zh', 'es', 'de', 'fr', 'vi']
+
+# Differences below these are measurement noise, not regressions
+MIN_SECONDS_DELTA = 0.005
+MIN_PEAK_DELTA_MB = 0.5
+
+
+def _tag_write(paths):
+    # Write phase alone: tag every medical key of the template, then save
+    data = load_arb(paths[0])
+    editor = ArbEditor(paths[0], data)
+    for key in message_keys(data):
+        if V2_RULES.requires_review(key):
+            metadata = data.get(f'@{key}', {})
+            editor.set(f'@{key}', {**metadata, 'description': 'MEDICAL REVIEW REQUIRED'})
+    editor.save()
+
+
+def _setup_parsed(paths):
+    return [load_arb(path, use_cache=False) for path in paths]
+
+
+def _export_xliff(paths):
+    out_path = os.path.join(os.path.dirname(paths[0]), 'export.xlf')
+    with open(paths[0], encoding='utf-8') as source, open(paths[1], encoding='utf-8') as target, \
+            open(out_path, 'w', encoding='utf-8') as out:
+        arb_exchange.write_xliff(arb_exchange.export_units(source, target), out, 'ko', 'en')
+    return out_path
+
+
+def _import_xliff(paths, xliff_path):
+    _, incoming = arb_exchange.read_xliff(xliff_path)
+    return arb_exchange.import_translations(paths[1], incoming)
+
+
+# (name, setup(paths) -> state or None, run(paths, state))
+CASES = [
+    ('parse', None,
+     lambda paths, _: [load_arb(path, use_cache=False) for path in paths]),
+    ('matrix', None, lambda paths, _: ArbMatrix.from_files(paths)),
+    ('parse_cached', lambda paths: [load_arb(path) for path in paths],
+     lambda paths, _: [load_arb(path) for path in paths]),
+    ('classify_v2', _setup_parsed,
+     lambda paths, datasets: [V2_RULES.requires_review(key) for key in message_keys(datasets[0])]),
+    ('classify_report', _setup_parsed,
+     lambda paths, datasets: [REPORT_RULES.match(key) for key in message_keys(datasets[0])]),
+    ('tag_write', None, lambda paths, _: _tag_write(paths)),
+    ('tag_v1', None,
+     lambda paths, _: [add_medical_review_tags.add_medical_review_tags(path) for path in paths]),
+    ('tag_v2', None,
+     lambda paths, _: [add_medical_review_tags_v2.add_medical_review_tags(path) for path in paths]),
+    ('report', None,
+     lambda paths, _: medical_review_report.analyze_medical_review_keys(paths[0])),
+    ('report_stream', None,
+     lambda paths, _: medical_review_report.analyze_medical_review_file(paths[0])),
+    ('add_tracking', None,
+     lambda paths, _: add_tracking_i18n.add_tracking_keys(paths[0], paths[1])),
+    ('validate', None,
+     lambda paths, _: validate_arb_files(paths, paths[0])),
+    ('export_xliff', None, lambda paths, _: _export_xliff(paths)),
+    ('import_xliff', _export_xliff, _import_xliff),
+    ('expansion', lambda paths: ArbMatrix.from_files(paths),
+     lambda paths, matrix: arb_expansion.over_budget(matrix)),
+]
+
+
+def _fresh_copy(source_dir: str, work_dir: str) -> list:
+    """Copy the generated ARB files (no sidecars) into an empty work_dir."""
+    shutil.rmtree(work_dir, ignore_errors=True)
+    os.makedirs(work_dir)
+    paths = []
+    for name in sorted(os.listdir(source_dir), key=lambda n: n != 'app_ko.arb'):
+        if name.endswith('.arb'):
+            paths.append(shutil.copy(os.path.join(source_dir, name), work_dir))
+    return paths
+
+
+def _traced(run, paths, state):
+    # The result is still referenced while the traced memory is read
+    tracemalloc.start()
+    try:
+        return run(paths, state), tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case, source_dir: str, work_dir: str, repeat: int) -> dict:
+    """Best wall time over repeat runs, plus peak and retained traced memory of one run."""
+    _, setup, run = case
+    best = None
+    for traced in [False] * repeat + [True]:
+        paths = _fresh_copy(source_dir, work_dir)
+        parse_message.cache_clear()
+        state = setup(paths) if setup else None
+        with contextlib.redirect_stdout(io.StringIO()):
+            if traced:
+                _, (retained, peak) = _traced(run, paths, state)
+            else:
+                start = time.perf_counter()
+                run(paths, state)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+    return {'seconds': round(best, 5), 'peak_mb': round(peak / (1 << 20), 2),
+            'retained_mb': round(retained / (1 << 20), 2)}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Return ``[(case, metric, baseline, current)]`` for every regression."""
+    regressions = []
+    for case, current in results.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+        for metric, floor in (('seconds', MIN_SECONDS_DELTA), ('peak_mb', MIN_PEAK_DELTA_MB),
+                              ('retained_mb', MIN_PEAK_DELTA_MB)):
+            if metric not in base:
+                continue
+            if current[metric] > base[metric] * (1 + tolerance) and current[metric] - base[metric] > floor:
+                regressions.append((case, metric, base[metric], current[metric]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the i18n scripts on synthetic ARB files')
+    parser.add_argument('--sizes', default='1000,10000,50000',
+                        help='comma-separated key counts (default: 1000,10000,50000)')
+    parser.add_argument('--locales', type=int, default=2, help='number of locales (default: 2)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case (default: 3)')
+    parser.add_argument('--cases', help='comma-separated subset of: ' + ','.join(c[0] for c in CASES))
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown/growth vs. baseline (default: 0.25)')
+    parser.add_argument('--check', action='store_true',
+                        help='exit 1 if any case regressed vs. the baseline (same machine only)')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    locales = LOCALES[:max(2, args.locales)]
+    cases = CASES
+    if args.cases:
+        wanted = set(args.cases.split(','))
+        cases = [case for case in CASES if case[0] in wanted]
+
+    try:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+    except FileNotFoundError:
+        baseline = {}
+
+    results = {}
+    print(f"{'case':<24} {'seconds':>9} {'peak MB':>9} {'held MB':>9} {'vs. baseline':>13}")
+    print("-" * 68)
+    with tempfile.TemporaryDirectory(prefix='arb-bench-') as tmp:
+        for size in sizes:
+            source_dir = os.path.join(tmp, f'src{size}')
+            write_synthetic_arb_files(source_dir, size, locales)
+            for case in cases:
+                name = f"{size}/{len(locales)}/{case[0]}"
+                results[name] = measure(case, source_dir, os.path.join(tmp, 'work'), args.repeat)
+                base = baseline.get(name)
+                delta = f"{results[name]['seconds'] / base['seconds'] - 1:+.0%}" if base else 'new'
+                print(f"{name:<24} {results[name]['seconds']:>9.4f} {results[name]['peak_mb']:>9.2f} "
+                      f"{results[name]['retained_mb']:>9.2f} {delta:>13}")
+
+    footprints = []
+    for name, result in results.items():
+        prefix, _, case = name.rpartition('/')
+        matrix = results.get(f"{prefix}/matrix")
+        if case == 'parse' and matrix:
+            footprints.append((prefix, result['retained_mb'], matrix['retained_mb']))
+    if footprints:
+        print("\nIn-memory footprint (dict-of-dicts vs. ArbMatrix):")
+        for name, dicts, matrix in footprints:
+            print(f"  {name:<22} {dicts:>9.2f} MB -> {matrix:>9.2f} MB ({matrix / dicts:.0%})")
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'results': dict(sorted(baseline.items()))}, f, indent=2)
+            f.write('\n')
+        print(f"\n✅ Baseline updated: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print("\n⚠️  No baseline to compare against (use --update-baseline)")
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("")
+        marker = '❌ REGRESSION' if args.check else '⚠️  Above baseline'
+        for case, metric, base, current in regressions:
+            print(f"{marker} {case}: {metric} {base} -> {current} (+{current / base - 1:.0%})")
+        if args.check:
+            return 1
+        print("\n(baseline from another run; use --check to fail on these)")
+        return 0
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: compiled medical rule engine vs. the per-pattern re loop.
+
+Usage: python3 scripts/bench_medical_rules.py [arb_file] [--repeat N]
+"""
+
+import argparse
+import json
+import re
+import sys
+import timeit
+
+from medical_rules import (REPORT_CATEGORIES, REPORT_RULES, V1_MEDICAL_PATTERNS,
+                           V1_RULES, V2_MEDICAL_PATTERNS, V2_RULES,
+                           V2_UI_ONLY_PATTERNS)
+
+
+def legacy_v1(key: str) -> bool:
+    """Original add_medical_review_tags.should_have_medical_review loop."""
+    for pattern in V1_MEDICAL_PATTERNS:
+        if re.match(pattern, key):
+            return True
+    return False
+
+
+def legacy_v2(key: str) -> bool:
+    """Original add_medical_review_tags_v2.should_have_medical_review loop."""
+    for pattern in V2_UI_ONLY_PATTERNS:
+        if re.search(pattern, key):
+            return False
+    for pattern in V2_MEDICAL_PATTERNS:
+        if re.match(pattern, key):
+            return True
+    return False
+
+
+def legacy_report(key: str):
+    """Original medical_review_report category loop."""
+    for category, pattern in REPORT_CATEGORIES.items():
+        if re.search(pattern, key):
+            return category
+    return None
+
+
+def compiled_report(key: str):
+    rule = REPORT_RULES.match(key)
+    return rule.name if rule is not None else None
+
+
+CASES = [
+    ('v1 tagging', legacy_v1, V1_RULES.requires_review),
+    ('v2 tagging', legacy_v2, V2_RULES.requires_review),
+    ('report categories', legacy_report, compiled_report),
+]
+
+
+def per_key_ns(func, keys, repeat: int) -> float:
+    """Best-of-repeat time per key in nanoseconds."""
+    timer = timeit.Timer(lambda: [func(k) for k in keys])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(keys) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('arb_file', nargs='?', default='lib/l10n/app_ko.arb')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.arb_file, 'r', encoding='utf-8') as f:
+        keys = [k for k in json.load(f) if not k.startswith('@')]
+
+    print(f"{len(keys)} keys from {args.arb_file}\n")
+    print(f"{'case':<20} {'legacy ns/key':>14} {'compiled ns/key':>16} {'speedup':>8}")
+    print("-" * 62)
+
+    mismatches = 0
+    for name, legacy, compiled in CASES:
+        mismatches += sum(1 for k in keys if legacy(k) != compiled(k))
+        legacy_ns = per_key_ns(legacy, keys, args.repeat)
+        compiled_ns = per_key_ns(compiled, keys, args.repeat)
+        print(f"{name:<20} {legacy_ns:>14.0f} {compiled_ns:>16.0f} {legacy_ns / compiled_ns:>7.1f}x")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} keys classified differently")
+        return 1
+    print("\n✅ Classification identical")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
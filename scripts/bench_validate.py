@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-process validator vs. the original validate_arb.sh.
+
+Runs each variant as a fresh process (as a pre-commit hook would) and
+reports the best and median wall time. The in-process validator is
+measured both without and with the ARB parse cache.
+
+Usage: python3 scripts/bench_validate.py [--runs N]
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from arb import cache_path, load_l10n_config
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Original scripts/validate_arb.sh: one python3 per ARB for json.tool, two
+# more python3 -c calls for key lists, then sort/comm/wc.
+LEGACY_VALIDATE_SH = r'''
+set -e
+ARB_DIR="lib/l10n"
+for file in $ARB_DIR/app_*.arb; do
+  if ! python3 -m json.tool "$file" > /dev/null 2>&1; then
+    echo "Invalid JSON syntax: $file"
+    exit 1
+  fi
+done
+ko_keys=$(python3 -c "import json; f=open('$ARB_DIR/app_ko.arb'); d=json.load(f); print('\n'.join(sorted([k for k in d.keys() if not k.startswith('@')])))")
+en_keys=$(python3 -c "import json; f=open('$ARB_DIR/app_en.arb'); d=json.load(f); print('\n'.join(sorted([k for k in d.keys() if not k.startswith('@')])))")
+missing_in_en=$(comm -23 <(echo "$ko_keys") <(echo "$en_keys"))
+missing_in_ko=$(comm -13 <(echo "$ko_keys") <(echo "$en_keys"))
+ko_count=$(echo "$ko_keys" | wc -l | tr -d ' ')
+en_count=$(echo "$en_keys" | wc -l | tr -d ' ')
+exit 0
+'''
+
+
+def clear_parse_cache(arb_dir: str):
+    for path in glob.glob(os.path.join(arb_dir, '*.arb')):
+        try:
+            os.remove(cache_path(path))
+        except OSError:
+            pass
+
+
+def time_command(cmd, cwd: str, runs: int, before=None) -> list:
+    """Wall time in milliseconds of each run of cmd."""
+    times = []
+    for _ in range(runs):
+        if before:
+            before()
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    config = load_l10n_config()
+    root = config['project_root']
+    validator = [sys.executable, os.path.join(SCRIPT_DIR, 'arbtool.py'), 'validate', '--warn-only']
+
+    cases = [
+        ('validate_arb.sh (original)', ['bash', '-c', LEGACY_VALIDATE_SH], None),
+        ('arbtool validate (no cache)', validator, lambda: clear_parse_cache(config['arb-dir'])),
+        ('arbtool validate (cached)', validator, None),
+    ]
+
+    print(f"{'variant':<30} {'best ms':>9} {'median ms':>10}")
+    print("-" * 51)
+    results = {}
+    for name, cmd, before in cases:
+        times = time_command(cmd, root, args.runs, before)
+        results[name] = statistics.median(times)
+        print(f"{name:<30} {min(times):>9.1f} {results[name]:>10.1f}")
+
+    legacy = results['validate_arb.sh (original)']
+    print("-" * 51)
+    for name in list(results)[1:]:
+        print(f"{name:<30} {legacy / results[name]:>8.1f}x faster (median)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
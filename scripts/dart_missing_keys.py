@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Reverse ARB check: L10n getters used in Dart that the template ARB lacks.
+
+Resolves every getter access found by dart_usage.py against the template
+key set from l10n.yaml and reports unknown getters with call sites and
+spelling suggestions from a BK-tree over the template keys. Catches the
+error that would otherwise only surface at ``flutter gen-l10n``/analyze
+time, without starting the Flutter toolchain.
+
+Usage: python3 scripts/arbtool.py missing-keys [--max-distance N]
+"""
+
+import argparse
+import os
+import sys
+
+from arb import load_arb, load_l10n_config, message_keys
+from dart_usage import L10N_MEMBERS, build_usage_index
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between a and b."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree for nearest-neighbour lookup under edit distance."""
+
+    __slots__ = ('root',)
+
+    def __init__(self, words=()):
+        self.root = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list:
+        """Return ``[(distance, word)]`` within max_distance, closest first."""
+        found = []
+        stack = [self.root] if self.root else []
+        while stack:
+            candidate, children = stack.pop()
+            distance = edit_distance(word, candidate)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+            # Triangle inequality: only subtrees in [d - max, d + max] can match
+            for edge, child in children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        found.sort()
+        return found
+
+
+def find_missing_keys(index: dict, template_keys) -> dict:
+    """Return ``{getter: call_sites}`` for getters absent from the template."""
+    template_keys = set(template_keys)
+    return {getter: sites for getter, sites in index.items()
+            if getter not in template_keys and getter not in L10N_MEMBERS}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Report Dart L10n getters missing from the template ARB')
+    parser.add_argument('--max-distance', type=int, default=3,
+                        help='edit distance for suggestions (default: 3)')
+    parser.add_argument('--no-cache', action='store_true', help='rescan every Dart file')
+    args = parser.parse_args(argv)
+
+    config = load_l10n_config()
+    template = os.path.join(config['arb-dir'], config['template-arb-file'])
+    keys = message_keys(load_arb(template))
+
+    index = build_usage_index(config, use_cache=not args.no_cache)
+    missing = find_missing_keys(index, keys)
+
+    print(f"🔍 Checking {len(index)} referenced getters against {config['template-arb-file']}...")
+    if not missing:
+        print("✅ Every referenced getter exists in the template")
+        return 0
+
+    tree = BKTree(keys)
+    for getter in sorted(missing):
+        print(f"❌ {getter}")
+        for path, line in missing[getter]:
+            print(f"    {path}:{line}")
+        suggestions = tree.search(getter, args.max_distance)[:3]
+        if suggestions:
+            print(f"    did you mean: {', '.join(word for _, word in suggestions)}?")
+
+    print("")
+    print(f"❌ {len(missing)} getters missing from the template")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Dart-source usage index for L10n getters.
+
+Scans ``lib/**/*.dart`` for getter accesses on L10n receivers
+(``l10n.x``, ``context.l10n.x``, ``L10n.of(context).x`` and any variable
+declared as ``L10n name`` or assigned from ``L10n.of(...)``/``context.l10n``)
+and builds an inverted index from getter name to call sites. Comments are
+ignored; string interpolations are not.
+
+Per-file results are cached in ``.dart_tool/arbtool/dart_usage.cache``,
+validated by size/mtime and a content hash, and only new or changed files
+are rescanned (on a process pool when there are many).
+
+Usage: python3 scripts/arbtool.py unused [--fail] [--show-sites]
+"""
+
+import argparse
+import marshal
+import os
+import re
+import sys
+
+from arb import content_digest, load_arb, load_l10n_config, message_keys
+
+_CACHE_VERSION = 1
+
+# Strings are matched first so that '//' inside a string is not a comment
+_COMMENT_OR_STRING = re.compile(
+    r"""(?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*")"""
+    r'|(?P<comment>//[^\n]*|/\*[\s\S]*?\*/)')
+_L10N_VARIABLE = re.compile(
+    r'\bL10n\??\s+([A-Za-z_]\w*)'
+    r'|\b([A-Za-z_]\w*)\s*=\s*(?:L10n\.of\([^()]*\)!?|\w+\.l10n)\s*;')
+_IDENTIFIER = r'[A-Za-z_]\w*'
+
+# L10n class members that are not message getters
+L10N_MEMBERS = frozenset((
+    'of', 'delegate', 'localizationsDelegates', 'supportedLocales', 'localeName',
+    'hashCode', 'runtimeType', 'toString', 'noSuchMethod',
+))
+
+
+def strip_comments(source: str) -> str:
+    """Blank out comments, keeping newlines so line numbers stay valid."""
+    def replace(m):
+        if m.group('comment') is None:
+            return m.group()
+        return re.sub(r'[^\n]', ' ', m.group())
+    return _COMMENT_OR_STRING.sub(replace, source)
+
+
+def scan_source(source: str) -> list:
+    """Return ``[(getter, line)]`` for every L10n getter access in Dart source."""
+    source = strip_comments(source)
+    receivers = {'l10n'}
+    for m in _L10N_VARIABLE.finditer(source):
+        receivers.add(m.group(1) or m.group(2))
+    receivers = '|'.join(sorted(map(re.escape, receivers)))
+    access = re.compile(
+        rf'(?:(?<![\w$])(?:{receivers})|\bL10n\.of\([^()]*\)!?)\s*\??\.\s*({_IDENTIFIER})')
+
+    refs = []
+    line = 1
+    last = 0
+    for m in access.finditer(source):
+        line += source.count('\n', last, m.start())
+        last = m.start()
+        refs.append((m.group(1), line))
+    return refs
+
+
+def scan_file(path: str):
+    """Scan one Dart file. Returns ``(path, size, mtime_ns, digest, refs)``."""
+    st = os.stat(path)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    refs = scan_source(raw.decode('utf-8', errors='replace'))
+    return path, st.st_size, st.st_mtime_ns, content_digest(raw), refs
+
+
+def _scan_files(paths: list, workers: int = None) -> list:
+    # Small batches are faster in-process than paying for worker startup
+    if len(paths) < 32:
+        return [scan_file(path) for path in paths]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan_file, paths, chunksize=16))
+
+
+def cache_file(project_root: str) -> str:
+    return os.path.join(project_root, '.dart_tool', 'arbtool', 'dart_usage.cache')
+
+
+def _load_cache(path: str) -> dict:
+    try:
+        with open(path, 'rb') as f:
+            version, entries = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    return entries if version == _CACHE_VERSION else {}
+
+
+def _save_cache(path: str, entries: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            marshal.dump((_CACHE_VERSION, entries), f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def dart_files(source_dir: str, exclude_dirs=()) -> list:
+    """List .dart files under source_dir, skipping exclude_dirs (absolute paths)."""
+    exclude_dirs = {os.path.abspath(d) for d in exclude_dirs}
+    found = []
+    for directory, subdirs, files in os.walk(source_dir):
+        subdirs[:] = [d for d in subdirs
+                      if os.path.abspath(os.path.join(directory, d)) not in exclude_dirs]
+        found.extend(os.path.join(directory, name) for name in files if name.endswith('.dart'))
+    found.sort()
+    return found
+
+
+def build_usage_index(config: dict = None, use_cache: bool = True, stats: dict = None) -> dict:
+    """
+    Build ``{getter: [(relative_path, line), ...]}`` for the project's Dart sources.
+
+    Generated localization code (l10n.yaml output-dir) is excluded.
+    ``stats``, if given, receives 'files' and 'scanned' counts.
+    """
+    config = config or load_l10n_config()
+    root = config['project_root']
+    output_dir = os.path.join(root, config.get('output-dir', 'lib/l10n/generated'))
+    paths = dart_files(os.path.join(root, 'lib'), exclude_dirs=[output_dir])
+
+    cache_path = cache_file(root)
+    cached = _load_cache(cache_path) if use_cache else {}
+    entries = {}
+    stale = []
+    for path in paths:
+        entry = cached.get(path)
+        if entry is not None:
+            st = os.stat(path)
+            if entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                entries[path] = entry
+                continue
+            # Touched but possibly unchanged: compare content hashes
+            with open(path, 'rb') as f:
+                if content_digest(f.read()) == entry[2]:
+                    entries[path] = (st.st_size, st.st_mtime_ns, entry[2], entry[3])
+                    continue
+        stale.append(path)
+
+    for path, size, mtime_ns, digest, refs in _scan_files(stale):
+        entries[path] = (size, mtime_ns, digest, refs)
+
+    if use_cache and (stale or len(entries) != len(cached)):
+        _save_cache(cache_path, entries)
+    if stats is not None:
+        stats['files'] = len(paths)
+        stats['scanned'] = len(stale)
+
+    index = {}
+    for path in paths:
+        relative = os.path.relpath(path, root)
+        for getter, line in entries[path][3]:
+            index.setdefault(getter, []).append((relative, line))
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Report ARB keys with no Dart references')
+    parser.add_argument('--fail', action='store_true', help='exit 1 if any key is unused')
+    parser.add_argument('--show-sites', metavar='KEY', action='append', default=[],
+                        help='also print the call sites of KEY (repeatable)')
+    parser.add_argument('--no-cache', action='store_true', help='rescan every Dart file')
+    args = parser.parse_args(argv)
+
+    config = load_l10n_config()
+    template = os.path.join(config['arb-dir'], config['template-arb-file'])
+    keys = message_keys(load_arb(template))
+
+    stats = {}
+    index = build_usage_index(config, use_cache=not args.no_cache, stats=stats)
+    unused = [key for key in keys if key not in index]
+
+    print(f"🔍 Scanned {stats['files']} Dart files ({stats['scanned']} rescanned)")
+    for key in args.show_sites:
+        sites = index.get(key, [])
+        print(f"\n{key}: {len(sites)} references")
+        for path, line in sites:
+            print(f"  {path}:{line}")
+
+    print(f"\n📋 Unused ARB keys: {len(unused)} of {len(keys)}")
+    for key in unused:
+        print(f"    {key}")
+    return 1 if args.fail and unused else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+In-process emulation of the ``flutter gen-l10n`` checks.
+
+Runs the checks that decide whether the ARB files compile into
+lib/l10n/generated/app_localizations.dart, without starting the Flutter
+toolchain, so CI only invokes Flutter once this cheap check passes:
+
+  config        l10n.yaml options: known names, booleans, output-class and
+                output-localization-file names, template file present
+  locales       @@locale matches the file name, one file per locale,
+                template-key coverage (untranslated / unknown keys)
+  getters       keys are valid, non-reserved Dart method names that do not
+                collide with the generated class members; duplicate JSON
+                keys (silently collapsed into one getter) are reported
+  placeholders  ICU syntax, declarations and usage (icu_message.py), valid
+                placeholder names and types, date and number formats
+  dart          imports of the generated file, output-class name and
+                nullable-getter usage of ``<output-class>.of(context)``
+
+Exit codes: 0 = gen-l10n would succeed, 1 = errors (warnings do not fail).
+
+Usage: python3 scripts/arbtool.py gen-check [--no-dart] [--quiet]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from arb import discover_arb_files, load_l10n_config, locale_of
+from dart_usage import L10N_MEMBERS, dart_files, strip_comments
+from icu_message import check_placeholders
+
+# Option names and defaults of flutter gen-l10n (l10n.yaml)
+GEN_L10N_OPTIONS = frozenset((
+    'arb-dir', 'output-dir', 'template-arb-file', 'output-localization-file',
+    'untranslated-messages-file', 'output-class', 'preferred-supported-locales',
+    'header', 'header-file', 'use-deferred-loading', 'gen-inputs-and-outputs-list',
+    'synthetic-package', 'project-dir', 'required-resource-attributes',
+    'nullable-getter', 'format', 'use-escaping', 'suppress-warnings', 'relax-syntax',
+    'use-named-parameters',
+))
+BOOLEAN_OPTIONS = frozenset((
+    'use-deferred-loading', 'synthetic-package', 'required-resource-attributes',
+    'nullable-getter', 'format', 'use-escaping', 'suppress-warnings', 'relax-syntax',
+    'use-named-parameters',
+))
+DEFAULT_OUTPUT_CLASS = 'AppLocalizations'
+DEFAULT_OUTPUT_FILE = 'app_localizations.dart'
+
+# Dart reserved words cannot name a getter, method or parameter
+DART_RESERVED_WORDS = frozenset((
+    'assert', 'break', 'case', 'catch', 'class', 'const', 'continue', 'default',
+    'do', 'else', 'enum', 'extends', 'false', 'final', 'finally', 'for', 'if',
+    'in', 'is', 'new', 'null', 'rethrow', 'return', 'super', 'switch', 'this',
+    'throw', 'true', 'try', 'var', 'void', 'while', 'with',
+))
+
+PLACEHOLDER_TYPES = frozenset(('String', 'Object', 'int', 'double', 'num', 'DateTime'))
+NUMBER_FORMATS = frozenset((
+    'compact', 'compactCurrency', 'compactSimpleCurrency', 'compactLong', 'currency',
+    'decimalPattern', 'decimalPercentPattern', 'percentPattern', 'scientificPattern',
+    'simpleCurrency',
+))
+# intl DateFormat named constructors (skeletons) that gen-l10n maps formats to
+DATE_FORMATS = frozenset((
+    'd', 'E', 'EEEE', 'LLL', 'LLLL', 'M', 'Md', 'MEd', 'MMM', 'MMMd', 'MMMEd', 'MMMM',
+    'MMMMd', 'MMMMEEEEd', 'QQQ', 'QQQQ', 'y', 'yM', 'yMd', 'yMEd', 'yMMM', 'yMMMd',
+    'yMMMEd', 'yMMMM', 'yMMMMd', 'yMMMMEEEEd', 'yQQQ', 'yQQQQ', 'H', 'Hm', 'Hms', 'j',
+    'jm', 'jms', 'jmv', 'jmz', 'jv', 'jz', 'm', 'ms', 's',
+))
+
+# gen-l10n's rule for getter and method names (public, no leading digit)
+_METHOD_NAME = re.compile(r'[a-zA-Z$][a-zA-Z0-9_$]*$')
+_CLASS_NAME = re.compile(r'[A-Z$][a-zA-Z0-9_$]*$')
+_IMPORT = re.compile(r"""^\s*import\s+['"]([^'"]+)['"]""", re.MULTILINE)
+
+
+def _issue(issues: list, severity: str, where: str, key: str, message: str):
+    issues.append((severity, where, key, message))
+
+
+def load_with_duplicates(path: str):
+    """Parse an ARB file, also returning the keys that occur more than once in any object."""
+    duplicates = []
+
+    def pairs_hook(pairs):
+        data = {}
+        for key, value in pairs:
+            if key in data:
+                duplicates.append(key)
+            data[key] = value
+        return data
+
+    with open(path, 'rb') as f:
+        data = json.loads(f.read().decode('utf-8'), object_pairs_hook=pairs_hook)
+    if not isinstance(data, dict):
+        raise ValueError('ARB root must be a JSON object')
+    return data, duplicates
+
+
+def check_config(config: dict) -> list:
+    """Check l10n.yaml settings the way gen-l10n validates its options."""
+    issues = []
+    for name in sorted(config):
+        if name in ('project_root',):
+            continue
+        if name not in GEN_L10N_OPTIONS:
+            _issue(issues, 'warning', 'l10n.yaml', name, 'unknown gen-l10n option')
+        elif name in BOOLEAN_OPTIONS and not isinstance(config[name], bool):
+            _issue(issues, 'error', 'l10n.yaml', name, f'must be true or false, got {config[name]!r}')
+
+    output_class = config.get('output-class', DEFAULT_OUTPUT_CLASS)
+    if not _CLASS_NAME.match(output_class) or output_class in DART_RESERVED_WORDS:
+        _issue(issues, 'error', 'l10n.yaml', 'output-class',
+               f'{output_class!r} is not a valid public Dart class name')
+
+    output_file = config.get('output-localization-file', DEFAULT_OUTPUT_FILE)
+    if not output_file.endswith('.dart'):
+        _issue(issues, 'error', 'l10n.yaml', 'output-localization-file',
+               f'{output_file!r} must be a .dart file')
+
+    if not os.path.isdir(config['arb-dir']):
+        _issue(issues, 'error', 'l10n.yaml', 'arb-dir', f"{config['arb-dir']} does not exist")
+    elif not os.path.isfile(os.path.join(config['arb-dir'], config['template-arb-file'])):
+        _issue(issues, 'error', 'l10n.yaml', 'template-arb-file',
+               f"{config['template-arb-file']} is not in {os.path.relpath(config['arb-dir'])}")
+    return issues
+
+
+def check_locales(datasets: dict, template: str) -> list:
+    """@@locale consistency and template-key coverage. ``datasets`` maps paths to ARB dicts."""
+    issues = []
+    seen = {}
+    for path, data in datasets.items():
+        locale = locale_of(path)
+        declared = data.get('@@locale')
+        if declared is not None and declared != locale:
+            _issue(issues, 'error', locale, '@@locale',
+                   f'{declared!r} does not match the file name {os.path.basename(path)}')
+        locale = declared or locale
+        if locale in seen:
+            _issue(issues, 'error', locale, '@@locale',
+                   f'{os.path.basename(path)} and {os.path.basename(seen[locale])} define the same locale')
+        seen[locale] = path
+
+    template_data = datasets[template]
+    template_keys = [key for key in template_data if not key.startswith('@')]
+    template_set = set(template_keys)
+    for path, data in datasets.items():
+        locale = locale_of(path)
+        keys = {key for key in data if not key.startswith('@')}
+        if path != template:
+            untranslated = [key for key in template_keys if key not in keys]
+            if untranslated:
+                _issue(issues, 'warning', locale, '',
+                       f'{len(untranslated)} untranslated messages fall back to the template '
+                       f'(first: {untranslated[0]})')
+            for key in sorted(keys - template_set):
+                _issue(issues, 'warning', locale, key, 'not in the template; gen-l10n ignores it')
+        for key in keys:
+            if not isinstance(data[key], str):
+                _issue(issues, 'error', locale, key, f'message must be a string, got {type(data[key]).__name__}')
+        for key in data:
+            if key.startswith('@') and not key.startswith('@@') and key[1:] not in keys:
+                _issue(issues, 'warning', locale, key, 'metadata without a message')
+    return issues
+
+
+def check_getters(template_data: dict, duplicates: dict, config: dict) -> list:
+    """Template keys become getters/methods on the output class."""
+    issues = []
+    template_locale = locale_of(config['template-arb-file'])
+    for key in template_data:
+        if key.startswith('@'):
+            continue
+        if not _METHOD_NAME.match(key):
+            _issue(issues, 'error', template_locale, key, 'not a valid Dart method name')
+        elif key in DART_RESERVED_WORDS:
+            _issue(issues, 'error', template_locale, key, 'is a Dart reserved word')
+        elif key in L10N_MEMBERS:
+            _issue(issues, 'error', template_locale, key,
+                   f"collides with {config.get('output-class', DEFAULT_OUTPUT_CLASS)}.{key}")
+        if config.get('required-resource-attributes') is True and f'@{key}' not in template_data:
+            _issue(issues, 'error', template_locale, key,
+                   'missing @metadata (required-resource-attributes: true)')
+
+    # Dart's jsonDecode (like json.loads) keeps the last definition without complaint
+    for path, keys in duplicates.items():
+        for key in sorted(set(keys)):
+            if key.startswith('@') and key[1:] in keys:
+                continue
+            _issue(issues, 'warning', locale_of(path), key,
+                   f'defined {keys.count(key) + 1} times; gen-l10n silently keeps the last one')
+    return issues
+
+
+def check_placeholder_metadata(template_data: dict, template_locale: str) -> list:
+    """Placeholder names, types and formats that gen-l10n would reject."""
+    issues = []
+    for key, metadata in template_data.items():
+        if not key.startswith('@') or key.startswith('@@') or not isinstance(metadata, dict):
+            continue
+        placeholders = metadata.get('placeholders')
+        if placeholders is None:
+            continue
+        name = key[1:]
+        if not isinstance(placeholders, dict):
+            _issue(issues, 'error', template_locale, name, 'placeholders must be a JSON object')
+            continue
+        for placeholder, spec in placeholders.items():
+            if not _METHOD_NAME.match(placeholder) or placeholder in DART_RESERVED_WORDS:
+                _issue(issues, 'error', template_locale, name,
+                       f'placeholder {placeholder!r} is not a valid Dart parameter name')
+            if not isinstance(spec, dict):
+                _issue(issues, 'error', template_locale, name,
+                       f'placeholder {placeholder!r} must be a JSON object')
+                continue
+            placeholder_type = spec.get('type')
+            placeholder_format = spec.get('format')
+            if placeholder_type is not None and placeholder_type not in PLACEHOLDER_TYPES:
+                _issue(issues, 'error', template_locale, name,
+                       f'placeholder {placeholder!r} has unsupported type {placeholder_type!r}')
+            elif placeholder_type == 'DateTime':
+                custom = str(spec.get('isCustomDateFormat')).lower() == 'true'
+                if placeholder_format is None:
+                    _issue(issues, 'error', template_locale, name,
+                           f'DateTime placeholder {placeholder!r} needs a "format"')
+                elif not custom and not all(part in DATE_FORMATS for part in str(placeholder_format).split('+')):
+                    _issue(issues, 'error', template_locale, name,
+                           f'{placeholder_format!r} is not a DateFormat skeleton '
+                           f'(set "isCustomDateFormat": "true" for a pattern)')
+            elif placeholder_type in ('int', 'double', 'num') and placeholder_format is not None:
+                if placeholder_format not in NUMBER_FORMATS:
+                    _issue(issues, 'error', template_locale, name,
+                           f'{placeholder_format!r} is not a NumberFormat constructor')
+    return issues
+
+
+def check_dart_usage(config: dict) -> list:
+    """Check Dart code against the output-class, output file and nullable-getter settings."""
+    issues = []
+    root = config['project_root']
+    lib_dir = os.path.join(root, 'lib')
+    output_class = config.get('output-class', DEFAULT_OUTPUT_CLASS)
+    output_dir = os.path.join(root, config.get('output-dir', os.path.relpath(config['arb-dir'], root)))
+    output_file = config.get('output-localization-file', DEFAULT_OUTPUT_FILE)
+    expected_import = os.path.relpath(os.path.join(output_dir, output_file), lib_dir).replace(os.sep, '/')
+    generated_prefix = os.path.relpath(output_dir, lib_dir).replace(os.sep, '/') + '/'
+    nullable = config.get('nullable-getter', True) is not False
+
+    of_call = re.compile(rf'\b{re.escape(output_class)}\.of\([^()]*\)(!?)(\s*\.)?')
+    default_class = (re.compile(rf'\b{DEFAULT_OUTPUT_CLASS}\b')
+                     if output_class != DEFAULT_OUTPUT_CLASS else None)
+
+    for path in dart_files(lib_dir, exclude_dirs=[output_dir]):
+        with open(path, encoding='utf-8', errors='replace') as f:
+            source = strip_comments(f.read())
+        relpath = os.path.relpath(path, root)
+
+        imports_generated = False
+        for m in _IMPORT.finditer(source):
+            target = m.group(1)
+            target = target.split('/', 1)[1] if target.startswith('package:') else target
+            if target.startswith(generated_prefix):
+                imports_generated = True
+                if target != expected_import:
+                    line = source.count('\n', 0, m.start()) + 1
+                    _issue(issues, 'error', f'{relpath}:{line}', m.group(1),
+                           f'gen-l10n writes {expected_import}')
+        if not imports_generated:
+            continue
+
+        if default_class is not None:
+            m = default_class.search(source)
+            if m:
+                line = source.count('\n', 0, m.start()) + 1
+                _issue(issues, 'error', f'{relpath}:{line}', DEFAULT_OUTPUT_CLASS,
+                       f'the generated class is {output_class} (output-class)')
+
+        for m in of_call.finditer(source):
+            line = source.count('\n', 0, m.start()) + 1
+            if nullable and not m.group(1) and m.group(2):
+                _issue(issues, 'error', f'{relpath}:{line}', f'{output_class}.of',
+                       f'returns {output_class}? with nullable-getter: true; add ! or set nullable-getter: false')
+            elif not nullable and m.group(1):
+                _issue(issues, 'warning', f'{relpath}:{line}', f'{output_class}.of',
+                       'unnecessary ! (nullable-getter: false)')
+    return issues
+
+
+def run_checks(config: dict, arb_files=None, dart: bool = True) -> list:
+    """
+    Run every check; returns ``[(severity, where, key, message)]``.
+
+    ``arb_files`` are checked against l10n.yaml's template, which is loaded
+    whether or not it is among them; a template that cannot be loaded is
+    an error.
+    """
+    issues = check_config(config)
+    if any(severity == 'error' for severity, *_ in issues):
+        return issues
+
+    template = os.path.join(config['arb-dir'], config['template-arb-file'])
+    arb_files = list(arb_files or discover_arb_files(config))
+    # The given files are always checked against the template, however its
+    # path was typed (relative, absolute, via a symlink)
+    template_real = os.path.realpath(template)
+    given = [path for path in arb_files if os.path.realpath(path) == template_real]
+    if given:
+        template = given[0]
+    else:
+        arb_files.insert(0, template)
+    datasets = {}
+    duplicates = {}
+    for path in arb_files:
+        try:
+            datasets[path], found = load_with_duplicates(path)
+        except (ValueError, OSError) as e:
+            _issue(issues, 'error', os.path.basename(path), '', f'invalid ARB: {e}')
+            continue
+        if found:
+            duplicates[path] = found
+    if template not in datasets:
+        _issue(issues, 'error', os.path.basename(template), '',
+               'template could not be loaded; nothing was checked against it')
+        return issues
+
+    template_locale = locale_of(template)
+    issues += check_locales(datasets, template)
+    issues += check_getters(datasets[template], duplicates, config)
+    issues += check_placeholder_metadata(datasets[template], template_locale)
+    for severity, path, key, message in check_placeholders(datasets, template, config.get('use-escaping') is True):
+        _issue(issues, severity, locale_of(path), key, message)
+    if dart:
+        issues += check_dart_usage(config)
+    return issues
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Emulate the flutter gen-l10n checks in-process')
+    parser.add_argument('arb_files', nargs='*',
+                        help="ARB files (default: every app_*.arb in l10n.yaml's arb-dir)")
+    parser.add_argument('--no-dart', action='store_true', help='skip the Dart source checks')
+    parser.add_argument('--quiet', action='store_true', help='print errors only')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    config = load_l10n_config()
+    arb_files = [os.path.abspath(path) for path in args.arb_files]
+    issues = run_checks(config, arb_files, dart=not args.no_dart)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    errors = [issue for issue in issues if issue[0] == 'error']
+    for severity, where, key, message in (errors if args.quiet else issues):
+        marker = '❌' if severity == 'error' else '⚠️ '
+        print(f"{marker} {where}: {key}: {message}" if key else f"{marker} {where}: {message}")
+
+    warnings = len(issues) - len(errors)
+    if errors:
+        print(f"❌ gen-l10n would fail: {len(errors)} errors, {warnings} warnings ({elapsed:.0f} ms)")
+        return 1
+    print(f"✅ gen-l10n checks passed with {warnings} warnings ({elapsed:.0f} ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic ARB files for benchmarking the i18n scripts.
+
+Keys are drawn from the real feature prefixes (checkin_, coping_,
+tracking_emergency_, onboarding_sideEffects_, ...) in roughly the real
+proportions, so the tagging and report rules see a realistic mix of
+medical, UI-only and untouched keys. Every key gets @metadata; about 10%
+carry typed placeholders and some medical keys are already tagged.
+Output is deterministic for a given seed.
+
+Usage: python3 scripts/gen_synthetic_arb.py OUT_DIR [--keys N] [--locales ko,en] [--seed S]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+# (prefix, weight) - weights follow the key counts of app_ko.arb
+PREFIXES = [
+    ('checkin_energy', 62), ('checkin_giComfort', 57), ('checkin_feedback', 41),
+    ('checkin_derived', 41), ('checkin_bowel', 38), ('checkin_meal', 35),
+    ('checkin_hydration', 19), ('checkin_redFlag', 16), ('checkin_mood', 12),
+    ('checkin_screen', 6), ('checkin_button', 4), ('checkin_greeting', 4),
+    ('tracking_dateDetail', 48), ('tracking_trend', 22), ('tracking_dosagePlan', 21),
+    ('tracking_dailyTracking', 19), ('tracking_weeklyInsight', 19), ('tracking_emergency', 14),
+    ('tracking_symptomCheck', 8), ('tracking_redFlag', 6), ('tracking_condition', 6),
+    ('onboarding_injection', 23), ('onboarding_weightGoal', 21), ('onboarding_summary', 17),
+    ('onboarding_sideEffects', 16), ('onboarding_foodNoise', 12), ('onboarding_evidence', 11),
+    ('onboarding_howItWorks', 9), ('onboarding_notYourFault', 5),
+    ('coping_nausea', 12), ('coping_constipation', 11), ('coping_diarrhea', 11),
+    ('coping_vomiting', 9), ('coping_headache', 9), ('coping_fatigue', 9),
+    ('records_symptom', 13), ('records_checkin', 13),
+    ('dashboard_badge', 22), ('dashboard_report', 16), ('dashboard_greeting', 14),
+    ('dashboard_progress', 8),
+    ('auth_signup', 25), ('auth_login', 21), ('auth_signin', 20), ('auth_passwordReset', 20),
+    ('report_share', 20), ('report_symptom', 13), ('profile_edit', 19),
+    ('common_dialog', 16), ('common_button', 10), ('common_error', 10), ('settings_menu', 14),
+]
+
+STEMS = ['question', 'answer', 'option', 'feedback', 'message', 'button', 'error',
+         'description', 'guide', 'step', 'warning', 'tip', 'summary', 'item']
+SUFFIXES = ['', '', '', '', '_title', '_label', '_hint', '_unit', 'Question', 'Answer', 'Feedback']
+
+PLACEHOLDER_TYPES = ['String', 'int', 'double']
+
+_KO_SYLLABLES = [chr(0xAC00 + i * 28) for i in range(0, 399, 7)]
+_WORDS = ('take dose weight meal water energy record check today week your symptom '
+          'nausea level note plan goal progress report share review daily feel').split()
+_LOCALE_WORDS = {'ja': 'の を に は が です ます 記録 体重 症状 今日'.split()}
+
+
+def _text(rng: random.Random, locale: str) -> str:
+    words = rng.randint(1, 8)
+    if locale == 'ko':
+        return ' '.join(''.join(rng.choices(_KO_SYLLABLES, k=rng.randint(1, 4))) for _ in range(words))
+    vocabulary = _LOCALE_WORDS.get(locale) or _WORDS
+    return ' '.join(rng.choices(vocabulary, k=words)).capitalize()
+
+
+def generate_keys(num_keys: int, seed: int = 0) -> list:
+    """Return ``[(key, placeholders, tagged)]`` shared by every locale."""
+    rng = random.Random(seed)
+    prefixes = [prefix for prefix, _ in PREFIXES]
+    weights = [weight for _, weight in PREFIXES]
+    keys = []
+    for i in range(num_keys):
+        prefix = rng.choices(prefixes, weights)[0]
+        key = f"{prefix}_{rng.choice(STEMS)}{i}{rng.choice(SUFFIXES)}"
+        placeholders = {}
+        if rng.random() < 0.1:
+            for n in range(rng.randint(1, 2)):
+                placeholders[f"value{n}"] = rng.choice(PLACEHOLDER_TYPES)
+        tagged = rng.random() < 0.3
+        keys.append((key, placeholders, tagged))
+    return keys
+
+
+def generate_locale(keys: list, locale: str, seed: int = 0) -> dict:
+    """Build one locale's ARB dict for keys from generate_keys()."""
+    rng = random.Random(f"{seed}:{locale}")
+    data = {'@@locale': locale}
+    for key, placeholders, tagged in keys:
+        value = _text(rng, locale)
+        for name in placeholders:
+            value += f" {{{name}}}"
+        data[key] = value
+
+        description = f"Synthetic {key.split('_')[0]} string"
+        if tagged and key.startswith(('checkin_', 'coping_', 'tracking_emergency_')):
+            description += " - MEDICAL REVIEW REQUIRED"
+        metadata = {'description': description}
+        if placeholders:
+            metadata['placeholders'] = {
+                name: ({'type': kind, 'format': 'decimalPattern'} if kind == 'double' else {'type': kind})
+                for name, kind in placeholders.items()
+            }
+        data[f'@{key}'] = metadata
+    return data
+
+
+def write_synthetic_arb_files(out_dir: str, num_keys: int, locales=('ko', 'en'), seed: int = 0) -> list:
+    """Write app_<locale>.arb files to out_dir. Returns their paths, template first."""
+    os.makedirs(out_dir, exist_ok=True)
+    keys = generate_keys(num_keys, seed)
+    paths = []
+    for locale in locales:
+        path = os.path.join(out_dir, f'app_{locale}.arb')
+        with open(path, 'w', encoding='utf-8') as f:
+            # Same layout as the real files: 2-space indent, no trailing newline
+            json.dump(generate_locale(keys, locale, seed), f, ensure_ascii=False, indent=2)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate synthetic ARB files')
+    parser.add_argument('out_dir')
+    parser.add_argument('--keys', type=int, default=10000, help='keys per locale (default: 10000)')
+    parser.add_argument('--locales', default='ko,en', help='comma-separated locales, template first')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    paths = write_synthetic_arb_files(args.out_dir, args.keys, args.locales.split(','), args.seed)
+    for path in paths:
+        print(f"✅ {path}: {args.keys} keys ({os.path.getsize(path) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
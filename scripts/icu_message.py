@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+ICU MessageFormat parser and placeholder checks for ARB messages.
+
+Parses the subset of ICU syntax that ``flutter gen-l10n`` understands
+(simple ``{name}`` arguments, ``plural``, ``select``, ``date``/``time``/
+``number`` arguments and, with ``use-escaping: true``, apostrophe quoting)
+into a small immutable AST. ASTs are cached per message, so re-checking
+an unchanged message across locales or watch-mode runs costs a dict lookup.
+
+AST: a tuple of nodes, where a node is either a text ``str`` or an
+argument tuple ``(name, kind, options)``. ``kind`` is None for a simple
+argument; ``options`` is a tuple of ``(selector, ast)`` pairs for plural
+and select, otherwise None.
+"""
+
+import re
+from functools import lru_cache
+
+PLURAL_KEYWORDS = frozenset(('zero', 'one', 'two', 'few', 'many', 'other'))
+ARGUMENT_KINDS = frozenset(('plural', 'select', 'date', 'time', 'number'))
+
+# Placeholder types gen-l10n accepts for each argument kind
+KIND_TYPES = {
+    'plural': frozenset(('int', 'num', 'double')),
+    'select': frozenset(('String',)),
+    'date': frozenset(('DateTime',)),
+    'time': frozenset(('DateTime',)),
+    'number': frozenset(('int', 'num', 'double')),
+}
+
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_SELECTOR = re.compile(r'=\d+|[A-Za-z_][A-Za-z0-9_]*')
+_SPACE = re.compile(r'\s*')
+_TEXT_RUN = re.compile(r"[^{}']+")
+
+
+class IcuSyntaxError(ValueError):
+    """Malformed ICU message."""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f'{message} at offset {position}')
+        self.position = position
+
+
+class _Parser:
+    def __init__(self, text: str, use_escaping: bool):
+        self.text = text
+        self.pos = 0
+        self.use_escaping = use_escaping
+
+    def error(self, message: str):
+        raise IcuSyntaxError(message, self.pos)
+
+    def skip_space(self):
+        self.pos = _SPACE.match(self.text, self.pos).end()
+
+    def expect(self, ch: str):
+        self.skip_space()
+        if not self.text.startswith(ch, self.pos):
+            self.error(f'expected {ch!r}')
+        self.pos += 1
+
+    def message(self, nested: bool) -> tuple:
+        """Parse text and arguments up to EOF (or a closing brace when nested)."""
+        text = self.text
+        nodes = []
+        chunk = []
+        while self.pos < len(text):
+            run = _TEXT_RUN.match(text, self.pos)
+            if run:
+                chunk.append(run.group())
+                self.pos = run.end()
+                continue
+            ch = text[self.pos]
+            if ch == '{':
+                if chunk:
+                    nodes.append(''.join(chunk))
+                    chunk = []
+                nodes.append(self.argument())
+            elif ch == '}':
+                if not nested:
+                    self.error("unmatched '}'")
+                break
+            elif ch == "'" and self.use_escaping:
+                chunk.append(self.quoted())
+            else:
+                chunk.append(ch)
+                self.pos += 1
+        else:
+            if nested:
+                self.error("unclosed '{'")
+        if chunk:
+            nodes.append(''.join(chunk))
+        return tuple(nodes)
+
+    def quoted(self) -> str:
+        """Apostrophe quoting: '' is a literal quote, '{...}' is literal text."""
+        text = self.text
+        if text.startswith("''", self.pos):
+            self.pos += 2
+            return "'"
+        end = text.find("'", self.pos + 1)
+        if end < 0:
+            self.error('unterminated quote')
+        literal = text[self.pos + 1:end]
+        self.pos = end + 1
+        return literal
+
+    def identifier(self, what: str) -> str:
+        self.skip_space()
+        m = _IDENTIFIER.match(self.text, self.pos)
+        if not m:
+            self.error(f'expected {what}')
+        self.pos = m.end()
+        return m.group()
+
+    def argument(self) -> tuple:
+        self.pos += 1  # '{'
+        name = self.identifier('placeholder name')
+        self.skip_space()
+        if self.text.startswith('}', self.pos):
+            self.pos += 1
+            return (name, None, None)
+
+        self.expect(',')
+        kind = self.identifier('argument type')
+        if kind not in ARGUMENT_KINDS:
+            self.error(f'unknown argument type {kind!r}')
+        self.skip_space()
+
+        if kind in ('date', 'time', 'number'):
+            # Optional style: {when, date, yMd}
+            if self.text.startswith(',', self.pos):
+                self.pos += 1
+                self.identifier(f'{kind} style')
+            self.expect('}')
+            return (name, kind, None)
+
+        self.expect(',')
+        options = []
+        seen = set()
+        while True:
+            self.skip_space()
+            if self.text.startswith('}', self.pos):
+                self.pos += 1
+                break
+            m = _SELECTOR.match(self.text, self.pos)
+            if not m:
+                self.error(f'expected {kind} selector')
+            selector = m.group()
+            if kind == 'plural' and not selector.startswith('=') and selector not in PLURAL_KEYWORDS:
+                self.error(f'invalid plural selector {selector!r}')
+            if kind == 'select' and selector.startswith('='):
+                self.error(f'invalid select selector {selector!r}')
+            if selector in seen:
+                self.error(f'duplicate {kind} selector {selector!r}')
+            seen.add(selector)
+            self.pos = m.end()
+            self.expect('{')
+            branch = self.message(nested=True)
+            self.pos += 1  # '}'
+            options.append((selector, branch))
+
+        if 'other' not in seen:
+            self.error(f"{kind} for {name!r} is missing the 'other' case")
+        return (name, kind, tuple(options))
+
+
+@lru_cache(maxsize=None)
+def parse_message(text: str, use_escaping: bool = False) -> tuple:
+    """Parse an ARB message into an AST (cached per message). Raises IcuSyntaxError."""
+    return _Parser(text, use_escaping).message(nested=False)
+
+
+def arguments(ast: tuple) -> dict:
+    """Map each argument name in an AST to the set of kinds it is used with."""
+    found = {}
+
+    def walk(nodes):
+        for node in nodes:
+            if isinstance(node, str):
+                continue
+            name, kind, options = node
+            found.setdefault(name, set()).add(kind)
+            if options:
+                for _, branch in options:
+                    walk(branch)
+
+    walk(ast)
+    return found
+
+
+def declared_placeholders(data: dict, key: str) -> dict:
+    """Return ``{name: type}`` from a key's @metadata placeholders."""
+    metadata = data.get(f'@{key}')
+    placeholders = metadata.get('placeholders') if isinstance(metadata, dict) else None
+    if not isinstance(placeholders, dict):
+        return {}
+    return {name: (spec.get('type') if isinstance(spec, dict) else None)
+            for name, spec in placeholders.items()}
+
+
+def check_placeholders(locales: dict, template: str, use_escaping: bool = False) -> list:
+    """
+    Cross-check ICU syntax and placeholders of every message in one pass.
+
+    Args:
+        locales: ``{label: parsed ARB dict}``, where a label is a locale
+            name or, as in arb_validate and gen_l10n_check, the file path
+        template: label of the template in ``locales``
+
+    Returns:
+        list of ``(severity, label, key, message)`` with severity 'error'
+        or 'warning', in template key order
+    """
+    issues = []
+    template_data = locales[template]
+    others = [(name, data) for name, data in locales.items() if name != template]
+
+    for key, value in template_data.items():
+        if key.startswith('@'):
+            continue
+        declared = declared_placeholders(template_data, key)
+
+        for locale, data in [(template, template_data)] + others:
+            message = data.get(key)
+            if not isinstance(message, str):
+                continue
+            try:
+                used = arguments(parse_message(message, use_escaping))
+            except IcuSyntaxError as e:
+                issues.append(('error', locale, key, f'ICU syntax error: {e}'))
+                continue
+
+            for name in sorted(used.keys() - declared.keys()):
+                issues.append(('error', locale, key, f'placeholder {{{name}}} is not declared in the template'))
+            for name in sorted(declared.keys() - used.keys()):
+                if locale == template:
+                    issues.append(('warning', locale, key, f'declared placeholder {{{name}}} is not used'))
+                else:
+                    issues.append(('error', locale, key, f'placeholder {{{name}}} is missing'))
+
+            for name, kinds in used.items():
+                placeholder_type = declared.get(name)
+                for kind in kinds - {None}:
+                    if placeholder_type and placeholder_type not in KIND_TYPES[kind]:
+                        issues.append(('error', locale, key,
+                                       f'{{{name}}} is used as {kind} but declared as {placeholder_type}'))
+
+            if locale != template:
+                for name, placeholder_type in declared_placeholders(data, key).items():
+                    if name in declared and placeholder_type and placeholder_type != declared[name]:
+                        issues.append(('error', locale, key,
+                                       f'{{{name}}} is declared as {placeholder_type}, '
+                                       f'template declares {declared[name]}'))
+    return issues
@@ -1,88 +1,196 @@
 #!/usr/bin/env python3
 """
 Generate detailed report of MEDICAL REVIEW tagged keys by pattern.
+
+Besides the text report, the result can be written as JSON or CSV
+(--format), saved as a compact snapshot (--snapshot) and compared with
+an earlier snapshot (--since) to list only the keys added, removed or
+re-categorized since then.
 """
 
+import argparse
+import csv
 import json
-import re
+import os
+import sys
+from contextlib import nullcontext
+
+from arb import (content_digest, discover_arb_files, iter_arb_entries, load_arb,
+                 load_l10n_config, locale_of, run_per_locale)
+from arb_profile import add_profile_arguments, count, phase, profiling, profiling_enabled
+from arb_writer import atomic_write
+from medical_rules import REPORT_CATEGORIES, REPORT_RULES
+
+SNAPSHOT_VERSION = 1
 
 def analyze_medical_review_keys(arb_file_path: str):
     """Analyze and categorize all MEDICAL REVIEW tagged keys."""
 
-    with open(arb_file_path, 'r', encoding='utf-8') as f:
-        data = json.loads(f.read())
-
-    # Pattern categories from task requirements
-    pattern_categories = {
-        'Checkin - Feedback': r'^checkin_.*[Ff]eedback$',
-        'Checkin - Questions': r'^checkin_.*[Qq]uestion$',
-        'Checkin - Answers': r'^checkin_.*[Aa]nswer.*',
-        'Checkin - Derived': r'^checkin_.*[Dd]erived.*',
-        'Checkin - Greeting': r'^checkin_greeting_',
-        'Checkin - Other': r'^checkin_',
-        'Coping Guide': r'^coping_',
-        'Tracking - Emergency': r'^tracking_emergency_',
-        'Tracking - Symptom': r'^tracking_symptom',
-        'Tracking - Red Flag': r'^tracking_redFlag_',
-        'Tracking - Condition': r'^tracking_condition_',
-        'Onboarding - Side Effects': r'^onboarding_sideEffects_',
-        'Onboarding - Injection': r'^onboarding_injection_',
-        'Onboarding - Evidence': r'^onboarding_evidence_',
-        'Onboarding - How It Works': r'^onboarding_howItWorks_',
-        'Onboarding - Food Noise': r'^onboarding_foodNoise_',
-        'Onboarding - Not Your Fault': r'^onboarding_notYourFault_',
-        'Records - Symptoms': r'^records_symptom_',
-        'Dashboard - Health': r'^dashboard_(greeting_encouragement|progress_|checkin_)',
-    }
+    with phase('parse'):
+        data = load_arb(arb_file_path)
 
     results = {}
-    for category in pattern_categories:
+    for category in REPORT_CATEGORIES:
         results[category] = []
 
     uncategorized = []
+    key_count = 0
 
     # Check all keys
-    for key in data.keys():
-        if key.startswith('@'):
-            continue
+    with phase('classify'):
+        for key in data.keys():
+            if key.startswith('@'):
+                continue
+            key_count += 1
 
-        # Check if has MEDICAL REVIEW tag
-        metadata_key = f'@{key}'
-        metadata = data.get(metadata_key, {})
-        description = metadata.get('description', '')
+            # Check if has MEDICAL REVIEW tag
+            metadata_key = f'@{key}'
+            metadata = data.get(metadata_key, {})
+            description = metadata.get('description', '')
 
-        if 'MEDICAL REVIEW' not in description:
-            continue
+            if 'MEDICAL REVIEW' not in description:
+                continue
 
-        # Categorize
-        categorized = False
-        for category, pattern in pattern_categories.items():
-            if re.search(pattern, key):
-                results[category].append(key)
-                categorized = True
-                break
+            # Categorize (first matching category wins)
+            rule = REPORT_RULES.match(key)
+            if rule is not None:
+                results[rule.name].append(key)
+            else:
+                uncategorized.append(key)
 
-        if not categorized:
-            uncategorized.append(key)
+    count('keys', key_count)
 
     return results, uncategorized
 
-if __name__ == '__main__':
-    print("="*70)
-    print("MEDICAL REVIEW TAGGED KEYS - DETAILED REPORT")
-    print("="*70)
+def _is_medical_review(metadata) -> bool:
+    return isinstance(metadata, dict) and 'MEDICAL REVIEW' in metadata.get('description', '')
+
+def analyze_medical_review_stream(f):
+    """
+    Count MEDICAL REVIEW tagged keys by category from a streamed ARB.
+
+    Entries are read one at a time with iter_arb_entries, so memory is
+    bounded by the largest single entry plus the names of the keys seen.
+    Each value key is paired with its @metadata when the two are adjacent
+    (the gen-l10n layout, in either order); metadata separated from its key
+    is counted as unpaired. Streams may contain several ARB documents or
+    locale sections. A duplicate key is counted once, with the tag of its
+    last occurrence (as json.loads keeps the last), and listed in
+    'duplicates'.
+
+    Returns:
+        (category_counts, uncategorized_count, stats) where stats has
+        'keys', 'tagged', 'unpaired_metadata', per-locale 'locales' and
+        'duplicates' (``[(locale, key)]``).
+    """
+    counts = dict.fromkeys(REPORT_CATEGORIES, 0)
+    uncategorized = 0
+    stats = {'keys': 0, 'tagged': 0, 'unpaired_metadata': 0, 'locales': {}, 'duplicates': []}
+
+    pending_key = None       # (scope, key) of a value key awaiting its metadata
+    pending_metadata = None  # (scope, key, tagged) of metadata awaiting its key
+    locale = None
+    # scope -> {key: tag} for every value key seen: None (not tagged yet),
+    # a category name or '' (uncategorized). One dict per scope and shared
+    # tag strings keep this to the key names themselves.
+    seen = {}
+
+    def record(keys, key, tagged):
+        nonlocal uncategorized
+        # A later occurrence of a duplicate key replaces the earlier one;
+        # both are in the same scope, so in the same locale_stats
+        previous = keys[key]
+        if previous is not None:
+            stats['tagged'] -= 1
+            locale_stats['tagged'] -= 1
+            if previous:
+                counts[previous] -= 1
+            else:
+                uncategorized -= 1
+        if not tagged:
+            keys[key] = None
+            return
+        stats['tagged'] += 1
+        locale_stats['tagged'] += 1
+        rule = REPORT_RULES.match(key)
+        if rule is not None:
+            counts[rule.name] += 1
+        else:
+            uncategorized += 1
+        keys[key] = rule.name if rule is not None else ''
 
-    results, uncategorized = analyze_medical_review_keys('lib/l10n/app_ko.arb')
+    for section, key, value in iter_arb_entries(f):
+        if key == '@@locale':
+            locale = value
+        locale_name = section[-1] if section else (locale or '?')
+        locale_stats = stats['locales'].setdefault(locale_name, {'keys': 0, 'tagged': 0})
+        scope = (section, locale)
 
+        if key.startswith('@@'):
+            continue
+
+        if key.startswith('@'):
+            name = key[1:]
+            if pending_key == (scope, name):
+                record(seen[scope], name, _is_medical_review(value))
+                pending_key = None
+            else:
+                if pending_metadata is not None:
+                    stats['unpaired_metadata'] += 1
+                pending_metadata = (scope, name, _is_medical_review(value))
+            continue
+
+        # Value key: an unmatched previous key simply has no metadata
+        keys = seen.setdefault(scope, {})
+        if key in keys:
+            stats['duplicates'].append((locale_name, key))
+        else:
+            keys[key] = None
+            stats['keys'] += 1
+            locale_stats['keys'] += 1
+        pending_key = None
+        if pending_metadata is not None:
+            if pending_metadata[:2] == (scope, key):
+                record(keys, key, pending_metadata[2])
+                pending_metadata = None
+                continue
+            stats['unpaired_metadata'] += 1
+            pending_metadata = None
+        pending_key = (scope, key)
+
+    if pending_metadata is not None:
+        stats['unpaired_metadata'] += 1
+
+    count('keys', stats['keys'])
+    return counts, uncategorized, stats
+
+def analyze_medical_review_file(path: str):
+    """Stream one ARB file or bundle ('-' for stdin) through analyze_medical_review_stream."""
+    opened = nullcontext(sys.stdin) if path == '-' else open(path, 'r', encoding='utf-8')
+    if path != '-':
+        count('bytes_read', os.path.getsize(path))
+    with opened as f, phase('stream'):
+        return analyze_medical_review_stream(f)
+
+def feature_totals(category_counts: dict) -> dict:
+    """Sum category counts per feature ('Checkin - Feedback' -> 'Checkin')."""
+    totals = {}
+    for category, n in category_counts.items():
+        feature = category.split(' - ')[0]
+        totals[feature] = totals.get(feature, 0) + n
+    return totals
+
+def print_report(category_counts: dict, uncategorized_count: int):
+    """Print category counts and the per-feature breakdown."""
     total_count = 0
-    for category, keys in sorted(results.items()):
-        if len(keys) > 0:
-            print(f"\n{category}: {len(keys)} keys")
-            total_count += len(keys)
+    for category, n in sorted(category_counts.items()):
+        if n > 0:
+            print(f"\n{category}: {n} keys")
+            total_count += n
 
-    if uncategorized:
-        print(f"\nUncategorized: {len(uncategorized)} keys")
-        total_count += len(uncategorized)
+    if uncategorized_count:
+        print(f"\nUncategorized: {uncategorized_count} keys")
+        total_count += uncategorized_count
 
     print("\n" + "="*70)
     print(f"TOTAL MEDICAL REVIEW KEYS: {total_count}")
@@ -92,13 +200,278 @@ if __name__ == '__main__':
     print("\nBREAKDOWN BY FEATURE:")
     print("-" * 70)
 
-    feature_totals = {}
-    for category, keys in results.items():
-        feature = category.split(' - ')[0]
-        feature_totals[feature] = feature_totals.get(feature, 0) + len(keys)
-
-    for feature, count in sorted(feature_totals.items(), key=lambda x: x[1], reverse=True):
-        print(f"{feature:.<40} {count:>4} keys")
+    for feature, n in sorted(feature_totals(category_counts).items(), key=lambda x: x[1], reverse=True):
+        print(f"{feature:.<40} {n:>4} keys")
 
     print("-" * 70)
     print(f"{'TOTAL':.<40} {total_count:>4} keys")
+
+def report_entries(arb_files, file_results) -> dict:
+    """
+    Map analyze_medical_review_keys results to ``{locale: {key: category or None}}``.
+
+    Raises ValueError if two files have the same locale (one would hide the other).
+    """
+    entries = {}
+    sources = {}
+    for path, (results, uncategorized) in zip(arb_files, file_results):
+        locale = locale_of(path)
+        if locale in sources:
+            raise ValueError(f"{sources[locale]} and {path} are both locale '{locale}'; report them separately")
+        sources[locale] = path
+        locale_entries = entries[locale] = {}
+        for category, keys in results.items():
+            for key in keys:
+                locale_entries[key] = category
+        for key in uncategorized:
+            locale_entries[key] = None
+    return entries
+
+def report_document(entries: dict) -> dict:
+    """JSON report: category -> keys per locale, plus category and feature totals."""
+    category_counts = dict.fromkeys(REPORT_CATEGORIES, 0)
+    uncategorized_count = 0
+    locales = {}
+    for locale, locale_entries in entries.items():
+        categories = {category: [] for category in REPORT_CATEGORIES}
+        uncategorized = []
+        for key, category in locale_entries.items():
+            if category is None:
+                uncategorized.append(key)
+            else:
+                categories[category].append(key)
+                category_counts[category] += 1
+        uncategorized_count += len(uncategorized)
+        locales[locale] = {
+            'categories': {category: keys for category, keys in categories.items() if keys},
+            'uncategorized': uncategorized,
+        }
+    return {
+        'rules_version': REPORT_RULES.version,
+        'locales': locales,
+        'category_totals': {category: n for category, n in category_counts.items() if n},
+        'feature_totals': feature_totals(category_counts),
+        'uncategorized_total': uncategorized_count,
+        'total': sum(category_counts.values()) + uncategorized_count,
+    }
+
+def write_csv(entries: dict, out):
+    """CSV report: one ``locale,key,category,feature`` row per tagged key."""
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(['locale', 'key', 'category', 'feature'])
+    for locale, locale_entries in entries.items():
+        for key, category in locale_entries.items():
+            category = category or 'Uncategorized'
+            writer.writerow([locale, key, category, category.split(' - ')[0]])
+
+def _entries_digest(entries: dict) -> str:
+    items = sorted((locale, key, category or '')
+                   for locale, locale_entries in entries.items()
+                   for key, category in locale_entries.items())
+    return content_digest(json.dumps(items, ensure_ascii=False).encode('utf-8')).hex()
+
+def make_snapshot(entries: dict) -> dict:
+    """
+    Compact snapshot of the tagged keys.
+
+    Categories are stored once and referenced by index (-1 for
+    uncategorized); the digest lets --since skip the diff entirely when
+    nothing changed.
+    """
+    categories = list(REPORT_CATEGORIES)
+    index = {category: i for i, category in enumerate(categories)}
+    return {
+        'version': SNAPSHOT_VERSION,
+        'rules_version': REPORT_RULES.version,
+        'digest': _entries_digest(entries),
+        'categories': categories,
+        'locales': {locale: {key: index.get(category, -1) for key, category in locale_entries.items()}
+                    for locale, locale_entries in entries.items()},
+    }
+
+def load_snapshot(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f'{path}: unsupported snapshot version {snapshot.get("version")!r}')
+    return snapshot
+
+def diff_snapshot(snapshot: dict, entries: dict) -> dict:
+    """
+    Compare current entries with a snapshot.
+
+    Returns:
+        dict with 'added' and 'removed' lists of ``(locale, key, category)``
+        and 'recategorized' ``(locale, key, old_category, new_category)``
+    """
+    delta = {'added': [], 'removed': [], 'recategorized': []}
+    if snapshot['digest'] == _entries_digest(entries):
+        return delta
+
+    categories = snapshot['categories']
+    previous = {(locale, key): categories[i] if i >= 0 else None
+                for locale, locale_entries in snapshot['locales'].items()
+                for key, i in locale_entries.items()}
+    current = {(locale, key): category
+               for locale, locale_entries in entries.items()
+               for key, category in locale_entries.items()}
+
+    # Hashed set difference: only changed (locale, key, category) items are visited
+    previous_items = set(previous.items())
+    current_items = set(current.items())
+    for (locale, key), category in sorted(current_items - previous_items, key=str):
+        if (locale, key) in previous:
+            delta['recategorized'].append((locale, key, previous[(locale, key)], category))
+        else:
+            delta['added'].append((locale, key, category))
+    for (locale, key), category in sorted(previous_items - current_items, key=str):
+        if (locale, key) not in current:
+            delta['removed'].append((locale, key, category))
+    return delta
+
+def print_delta(delta: dict, since: str, out=None):
+    """Print a --since delta."""
+    out = out or sys.stdout
+    print("="*70, file=out)
+    print(f"MEDICAL REVIEW CHANGES SINCE {since}", file=out)
+    print("="*70, file=out)
+    sections = (
+        ('ADDED', delta['added'], lambda e: e[2] or 'Uncategorized'),
+        ('REMOVED', delta['removed'], lambda e: e[2] or 'Uncategorized'),
+        ('RE-CATEGORIZED', delta['recategorized'],
+         lambda e: f"{e[2] or 'Uncategorized'} -> {e[3] or 'Uncategorized'}"),
+    )
+    for title, items, describe in sections:
+        print(f"\n{title}: {len(items)} keys", file=out)
+        for item in items:
+            print(f"  [{item[0]}] {item[1]} ({describe(item)})", file=out)
+
+def write_machine_report(args, entries: dict, out):
+    """Write the --since delta or the JSON/CSV report to out."""
+    if not args.since:
+        if args.format == 'json':
+            json.dump(report_document(entries), out, ensure_ascii=False, indent=2)
+            out.write('\n')
+        else:
+            write_csv(entries, out)
+        return
+
+    delta = diff_snapshot(load_snapshot(args.since), entries)
+    if args.format == 'text':
+        print_delta(delta, args.since, out)
+    elif args.format == 'json':
+        json.dump({
+            'since': args.since,
+            'added': [{'locale': l, 'key': k, 'category': c} for l, k, c in delta['added']],
+            'removed': [{'locale': l, 'key': k, 'category': c} for l, k, c in delta['removed']],
+            'recategorized': [{'locale': l, 'key': k, 'from': old, 'to': new}
+                              for l, k, old, new in delta['recategorized']],
+        }, out, ensure_ascii=False, indent=2)
+        out.write('\n')
+    else:
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(['change', 'locale', 'key', 'old_category', 'new_category'])
+        for locale, key, category in delta['added']:
+            writer.writerow(['added', locale, key, '', category or 'Uncategorized'])
+        for locale, key, category in delta['removed']:
+            writer.writerow(['removed', locale, key, category or 'Uncategorized', ''])
+        for locale, key, old, new in delta['recategorized']:
+            writer.writerow(['recategorized', locale, key, old or 'Uncategorized', new or 'Uncategorized'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='MEDICAL REVIEW tagged keys report')
+    parser.add_argument('arb_files', nargs='*',
+                        help="ARB files, merged bundles or snapshots ('-' for stdin; "
+                             "default: l10n.yaml's template ARB)")
+    parser.add_argument('--stream', action='store_true',
+                        help='stream entries instead of loading each file (bounded memory)')
+    parser.add_argument('--all-locales', action='store_true',
+                        help="report every app_*.arb in l10n.yaml's arb-dir, in parallel")
+    parser.add_argument('--format', choices=('text', 'json', 'csv'), default='text',
+                        help='output format (default: text)')
+    parser.add_argument('--output', '-o', metavar='FILE',
+                        help='write the JSON/CSV report or --since delta to FILE')
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='save a compact snapshot of the tagged keys to FILE')
+    parser.add_argument('--since', metavar='SNAPSHOT',
+                        help='only report keys added, removed or re-categorized since SNAPSHOT')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.stream and (args.format != 'text' or args.snapshot or args.since):
+        parser.error('--format, --snapshot and --since need per-key results (omit --stream)')
+    if args.output and args.format == 'text' and not args.since:
+        parser.error('--output needs --format json/csv or --since')
+
+    config = load_l10n_config()
+    arb_files = args.arb_files or [
+        os.path.relpath(os.path.join(config['arb-dir'], config['template-arb-file']))]
+    if args.all_locales:
+        arb_files = [os.path.relpath(path) for path in discover_arb_files(config)]
+    analyze = analyze_medical_review_file if args.stream else analyze_medical_review_keys
+    with profiling('report', args):
+        if '-' in arb_files:
+            # stdin cannot be shared with worker processes
+            file_results = [analyze(path) for path in arb_files]
+        else:
+            # Profiled runs stay in-process so every phase is measured
+            file_results = run_per_locale(analyze, arb_files,
+                                          max_workers=1 if profiling_enabled(args) else None)
+
+    if not args.stream:
+        try:
+            entries = report_entries(arb_files, file_results)
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        if args.snapshot:
+            atomic_write(args.snapshot, json.dumps(make_snapshot(entries), ensure_ascii=False,
+                                                   separators=(',', ':')))
+        if args.since or args.format != 'text':
+            with (open(args.output, 'w', encoding='utf-8', newline='') if args.output
+                  else nullcontext(sys.stdout)) as out:
+                write_machine_report(args, entries, out)
+            return 0
+
+    print("="*70)
+    print("MEDICAL REVIEW TAGGED KEYS - DETAILED REPORT")
+    print("="*70)
+
+    category_counts = dict.fromkeys(REPORT_CATEGORIES, 0)
+    uncategorized_count = 0
+
+    if not args.stream:
+        for results, uncategorized in file_results:
+            for category, keys in results.items():
+                category_counts[category] += len(keys)
+            uncategorized_count += len(uncategorized)
+        print_report(category_counts, uncategorized_count)
+        return 0
+
+    totals = {'keys': 0, 'tagged': 0, 'unpaired_metadata': 0}
+    locales = {}
+    for path, (counts, uncategorized, stats) in zip(arb_files, file_results):
+        for locale, key in stats['duplicates']:
+            print(f"⚠️  {path}: duplicate key '{key}' in {locale} (last occurrence kept)", file=sys.stderr)
+        for category, n in counts.items():
+            category_counts[category] += n
+        uncategorized_count += uncategorized
+        for name in totals:
+            totals[name] += stats[name]
+        for name, locale_stats in stats['locales'].items():
+            merged = locales.setdefault(name, {'keys': 0, 'tagged': 0})
+            merged['keys'] += locale_stats['keys']
+            merged['tagged'] += locale_stats['tagged']
+
+    print_report(category_counts, uncategorized_count)
+
+    print("\nMEDICAL REVIEW STATS:")
+    print("-" * 70)
+    for name, locale_stats in sorted(locales.items()):
+        print(f"{name:.<40} {locale_stats['tagged']:>4} / {locale_stats['keys']} keys tagged")
+    print(f"{'Unpaired @metadata':.<40} {totals['unpaired_metadata']:>4}")
+    print("-" * 70)
+    print(f"{'TOTAL':.<40} {totals['tagged']:>4} / {totals['keys']} keys tagged")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
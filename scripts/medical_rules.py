@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Compiled rule engine for MEDICAL REVIEW key classification.
+
+Rule sets are compiled once. Literal anchored rules (``^prefix`` and
+``suffix$``) go into a prefix and a suffix trie, everything else into one
+combined regex with a named group per rule, so classifying a key costs a
+trie walk plus at most one regex match instead of one ``re`` call per rule.
+
+All patterns use ``re.search`` semantics and rules are evaluated in order:
+the first rule that matches decides the result.
+"""
+
+import hashlib
+import re
+
+INCLUDE = 'include'
+EXCLUDE = 'exclude'
+
+# How a RuleSet evaluates a rule (see rule_lookup)
+PREFIX_TRIE = 'prefix'
+SUFFIX_TRIE = 'suffix'
+REGEX = 'regex'
+
+# Rule patterns made only of identifier characters are stored in the tries
+_LITERAL = re.compile(r'\w+$')
+
+
+def rule_lookup(pattern: str) -> str:
+    """Where a compiled RuleSet evaluates pattern: PREFIX_TRIE, SUFFIX_TRIE or REGEX."""
+    if pattern.startswith('^') and _LITERAL.match(pattern[1:]):
+        return PREFIX_TRIE
+    if pattern.endswith('$') and _LITERAL.match(pattern[:-1]):
+        return SUFFIX_TRIE
+    return REGEX
+
+
+class Rule:
+    """A single classification rule."""
+
+    __slots__ = ('index', 'name', 'pattern', 'action')
+
+    def __init__(self, index: int, name: str, pattern: str, action: str):
+        self.index = index
+        self.name = name
+        self.pattern = pattern
+        self.action = action
+
+    def __repr__(self):
+        return f'Rule({self.name!r}, {self.pattern!r}, {self.action!r})'
+
+
+class _Trie:
+    """Character trie mapping literal prefixes to the lowest rule index."""
+
+    __slots__ = ('_root',)
+
+    def __init__(self):
+        self._root = {}
+
+    def __bool__(self):
+        return bool(self._root)
+
+    def insert(self, literal: str, index: int):
+        node = self._root
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        # '' can never be a character key, so it marks rule ends
+        if '' not in node or index < node['']:
+            node[''] = index
+
+    def lowest_match(self, text: str, limit: int):
+        """Return the lowest rule index below ``limit`` whose literal prefixes text."""
+        best = limit
+        node = self._root
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                break
+            index = node.get('', limit)
+            if index < best:
+                best = index
+        return best
+
+
+class RuleSet:
+    """Ordered rules compiled into tries plus one combined regex."""
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules: iterable of ``(name, pattern, action)`` tuples in priority order.
+        """
+        self.rules = [Rule(i, name, pattern, action)
+                      for i, (name, pattern, action) in enumerate(rules)]
+        self._prefixes = _Trie()
+        self._suffixes = _Trie()
+        alternatives = []
+        self._first_regex_index = len(self.rules)
+
+        for rule in self.rules:
+            pattern = rule.pattern
+            lookup = rule_lookup(pattern)
+            if lookup == PREFIX_TRIE:
+                self._prefixes.insert(pattern[1:], rule.index)
+            elif lookup == SUFFIX_TRIE:
+                self._suffixes.insert(pattern[-2::-1], rule.index)
+            else:
+                # re.search(p) is re.match('.*?p') for single-line keys
+                body = pattern if pattern.startswith('^') else f'.*?(?:{pattern})'
+                alternatives.append(f'(?P<r{rule.index}>{body})')
+                self._first_regex_index = min(self._first_regex_index, rule.index)
+
+        # Alternation tries groups left to right, so the first match is the
+        # lowest-index regex rule; lastgroup names the outermost group.
+        self._regex = re.compile('|'.join(alternatives)) if alternatives else None
+        self.version = hashlib.sha1(
+            repr([(r.pattern, r.action) for r in self.rules]).encode('utf-8')
+        ).hexdigest()[:12]
+        # Combined-regex runs, read by arb_profile for --profile
+        self.regex_evaluations = 0
+
+    def match(self, key: str):
+        """Return the first rule matching key, or None."""
+        limit = len(self.rules)
+        best = self._prefixes.lowest_match(key, limit) if self._prefixes else limit
+        if self._suffixes:
+            best = self._suffixes.lowest_match(key[::-1], best)
+        if self._regex is not None and self._first_regex_index < best:
+            self.regex_evaluations += 1
+            m = self._regex.match(key)
+            if m is not None:
+                index = int(m.lastgroup[1:])
+                if index < best:
+                    best = index
+        return self.rules[best] if best < limit else None
+
+    def requires_review(self, key: str) -> bool:
+        """Check if the first matching rule includes key for medical review."""
+        rule = self.match(key)
+        return rule is not None and rule.action == INCLUDE
+
+
+def tagging_rules(include, exclude=()):
+    """Build a RuleSet where any exclude pattern wins over the include patterns."""
+    return RuleSet([(p, p, EXCLUDE) for p in exclude] +
+                   [(p, p, INCLUDE) for p in include])
+
+
+def category_rules(categories: dict):
+    """Build a RuleSet whose rule names are report categories."""
+    return RuleSet([(name, pattern, INCLUDE) for name, pattern in categories.items()])
+
+
+# v1 tagging rules (add_medical_review_tags.py)
+V1_MEDICAL_PATTERNS = [
+    # Checkin feedback
+    r'^checkin_.*Feedback$',
+    r'^checkin_.*_feedback$',
+    # Checkin questions
+    r'^checkin_.*Question$',
+    r'^checkin_.*_question$',
+    # Checkin answers
+    r'^checkin_.*Answer$',
+    r'^checkin_.*_answer$',
+    # Emergency tracking
+    r'^tracking_emergency_',
+    # Symptom tracking
+    r'^tracking_symptom',
+    # Onboarding medical content
+    r'^onboarding_sideEffects_',
+    r'^onboarding_injection_',
+    r'^onboarding_evidence_',
+    r'^onboarding_howItWorks_',
+    # Records symptoms
+    r'^records_symptom_',
+    # Coping guides
+    r'^coping_',
+]
+
+# v2 tagging rules (add_medical_review_tags_v2.py)
+V2_UI_ONLY_PATTERNS = [
+    r'^checkin_screen_',
+    r'^checkin_button_',
+    r'^checkin_nav',
+    r'_title$',
+    r'_label$',
+    r'_hint$',
+    r'_unit$',
+]
+
+V2_MEDICAL_PATTERNS = [
+    # All checkin content (questions, answers, feedback, etc.)
+    r'^checkin_',
+
+    # All coping guide content
+    r'^coping_',
+
+    # Tracking - emergency and symptoms
+    r'^tracking_emergency_',
+    r'^tracking_symptom',
+    r'^tracking_condition_',
+    r'^tracking_redFlag_',
+
+    # Onboarding medical content
+    r'^onboarding_sideEffects_',
+    r'^onboarding_injection_',
+    r'^onboarding_evidence_',
+    r'^onboarding_howItWorks_',
+    r'^onboarding_foodNoise_',
+    r'^onboarding_notYourFault_',
+
+    # Records symptoms
+    r'^records_symptom_',
+
+    # Dashboard health-related messages
+    r'^dashboard_greeting_encouragement',
+    r'^dashboard_progress_',
+    r'^dashboard_checkin_',
+]
+
+# Report categories (medical_review_report.py), first match wins
+REPORT_CATEGORIES = {
+    'Checkin - Feedback': r'^checkin_.*[Ff]eedback$',
+    'Checkin - Questions': r'^checkin_.*[Qq]uestion$',
+    'Checkin - Answers': r'^checkin_.*[Aa]nswer.*',
+    'Checkin - Derived': r'^checkin_.*[Dd]erived.*',
+    'Checkin - Greeting': r'^checkin_greeting_',
+    'Checkin - Other': r'^checkin_',
+    'Coping Guide': r'^coping_',
+    'Tracking - Emergency': r'^tracking_emergency_',
+    'Tracking - Symptom': r'^tracking_symptom',
+    'Tracking - Red Flag': r'^tracking_redFlag_',
+    'Tracking - Condition': r'^tracking_condition_',
+    'Onboarding - Side Effects': r'^onboarding_sideEffects_',
+    'Onboarding - Injection': r'^onboarding_injection_',
+    'Onboarding - Evidence': r'^onboarding_evidence_',
+    'Onboarding - How It Works': r'^onboarding_howItWorks_',
+    'Onboarding - Food Noise': r'^onboarding_foodNoise_',
+    'Onboarding - Not Your Fault': r'^onboarding_notYourFault_',
+    'Records - Symptoms': r'^records_symptom_',
+    'Dashboard - Health': r'^dashboard_(greeting_encouragement|progress_|checkin_)',
+}
+
+V1_RULES = tagging_rules(V1_MEDICAL_PATTERNS)
+V2_RULES = tagging_rules(V2_MEDICAL_PATTERNS, exclude=V2_UI_ONLY_PATTERNS)
+REPORT_RULES = category_rules(REPORT_CATEGORIES)
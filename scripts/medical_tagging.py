@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Shared MEDICAL REVIEW tagging pipeline for the v1 and v2 tag commands.
+
+tag_arb() classifies the keys of one ARB file with a RuleSet and appends
+the MEDICAL REVIEW REQUIRED tag to the descriptions that lack it. It reads
+the file through the parse cache, classifies only changed keys with
+incremental=True (tag_manifest.py, one manifest per rule set), writes the
+changed entries in place with ArbEditor and records --profile phases.
+
+main() is the command line both add_medical_review_tags scripts run: it
+tags every locale in parallel, optionally syncs the review state store
+(review_store.py) and prints the summary. The scripts only supply their
+RuleSet and their own report lines.
+"""
+
+import argparse
+import os
+
+from arb import discover_arb_files, load_arb, run_per_locale
+from arb_profile import add_profile_arguments, count, phase, profiling, profiling_enabled
+from arb_writer import ArbEditor
+from review_store import record_tagging
+from tag_manifest import file_digest, load_manifest, save_manifest, split_changed_keys
+
+TAG = 'MEDICAL REVIEW REQUIRED'
+
+
+def tag_arb(arb_file_path: str, rules, rule_set: str, incremental: bool = False):
+    """
+    Add MEDICAL REVIEW tags to the keys ``rules`` select in one ARB file.
+
+    With incremental=True, only keys added or edited since the last run
+    with ``rule_set`` (per its tag manifest) are classified, unless the
+    rules changed.
+
+    Returns:
+        (added_count, already_tagged_count, skipped_count, categories) where
+        categories maps a key prefix to ``{'added': n, 'already_tagged': n}``
+        and skipped_count is the number of classified keys left untagged
+    """
+
+    # Read and parse ARB file (cached)
+    with phase('parse'):
+        data = load_arb(arb_file_path)
+        editor = ArbEditor(arb_file_path, data)
+
+    # Select keys to classify
+    with phase('select'):
+        previous = load_manifest(arb_file_path, rule_set, rules.version) if incremental else None
+        changed_keys, unchanged = split_changed_keys(data, previous, file_digest(arb_file_path))
+    medical_keys = []
+
+    # Track changes
+    added_count = 0
+    already_tagged_count = 0
+    skipped_count = 0
+    categories = {}
+
+    # Unchanged keys were fully tagged by the previous run
+    with phase('classify'):
+        for key, medical in unchanged.items():
+            if not medical:
+                skipped_count += 1
+                continue
+            category = key.split('_')[0]
+            if category not in categories:
+                categories[category] = {'added': 0, 'already_tagged': 0}
+            already_tagged_count += 1
+            categories[category]['already_tagged'] += 1
+
+        # Process each added or edited key
+        for key in changed_keys:
+            # Check if key should have medical review
+            if not rules.requires_review(key):
+                skipped_count += 1
+                continue
+
+            medical_keys.append(key)
+
+            # Get category
+            category = key.split('_')[0]
+            if category not in categories:
+                categories[category] = {'added': 0, 'already_tagged': 0}
+
+            # Get or create metadata
+            metadata_key = f'@{key}'
+            metadata = data.get(metadata_key, {})
+
+            # Check if already has MEDICAL REVIEW tag
+            description = metadata.get('description', '')
+            if 'MEDICAL REVIEW' in description:
+                already_tagged_count += 1
+                categories[category]['already_tagged'] += 1
+                continue
+
+            # Add MEDICAL REVIEW tag
+            if description:
+                new_description = f"{description} - {TAG}"
+            else:
+                new_description = TAG
+
+            editor.set(metadata_key, {**metadata, 'description': new_description})
+
+            added_count += 1
+            categories[category]['added'] += 1
+
+    # Write back only the changed entries (no write when nothing changed)
+    with phase('write'):
+        editor.save()
+
+        save_manifest(arb_file_path, data, rule_set, rules.version, changed_keys, medical_keys, previous)
+
+    count('keys', len(changed_keys) + len(unchanged))
+    count('keys_classified', len(changed_keys))
+    count('tags_added', added_count)
+
+    return added_count, already_tagged_count, skipped_count, categories
+
+
+def print_categories(categories: dict):
+    """Print per-category tag counts."""
+    print("\nBy category:")
+    for cat, counts in sorted(categories.items()):
+        total = counts['added'] + counts['already_tagged']
+        print(f"  {cat}: {total} total ({counts['added']} added, {counts['already_tagged']} already tagged)")
+
+
+def merge_category_counts(results) -> dict:
+    """Merge per-locale category counts into one summary."""
+    merged = {}
+    for _, _, categories in results:
+        for cat, counts in categories.items():
+            total = merged.setdefault(cat, {'added': 0, 'already_tagged': 0})
+            total['added'] += counts['added']
+            total['already_tagged'] += counts['already_tagged']
+    return merged
+
+
+def main(argv, description: str, tag_file, rules, rule_set: str, print_totals):
+    """
+    Command line shared by the tag scripts.
+
+    Args:
+        description: argparse description of the script
+        tag_file: module-level ``func(path, incremental)`` returning
+            ``(added, already_tagged, categories)`` and printing the file's
+            report; it runs in worker processes
+        rules: RuleSet the review store is synced with
+        rule_set: rule set name ('v1', 'v2')
+        print_totals: ``func(results)`` printing the script's summary lines
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('arb_files', nargs='*',
+                        help="ARB files (default: every app_*.arb in l10n.yaml's arb-dir)")
+    parser.add_argument('--incremental', action='store_true',
+                        help='only classify keys changed since the last run')
+    parser.add_argument('--review-db', metavar='FILE', nargs='?', const='',
+                        help='also update the review state store (default FILE: medical_review.db '
+                             'in the project root)')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.review_db and args.review_db.endswith('.arb'):
+        parser.error(f'--review-db took {args.review_db} as the database; use --review-db=FILE or put it last')
+
+    # Every app_*.arb in l10n.yaml's arb-dir, template locale first
+    arb_files = args.arb_files or [os.path.relpath(path) for path in discover_arb_files()]
+    # Profiled runs stay in-process so every phase is measured
+    with profiling('tag', args):
+        results = run_per_locale(tag_file, arb_files, args.incremental,
+                                 max_workers=1 if profiling_enabled(args) else None)
+        if args.review_db is not None:
+            # One transaction for all locales, after every file is written
+            with phase('review-db'):
+                review = record_tagging(arb_files, rules, rule_set, args.review_db)
+
+    print("\n" + "="*60)
+    print("SUMMARY")
+    print("="*60)
+    print_totals(results)
+
+    print(f"\nAll locales ({len(arb_files)}):")
+    for cat, counts in sorted(merge_category_counts(results).items()):
+        total = counts['added'] + counts['already_tagged']
+        print(f"  {cat}: {total} total ({counts['added']} added, {counts['already_tagged']} already tagged)")
+
+    if args.review_db is not None:
+        print(f"\nReview store: {review['changed']} entries new or changed, "
+              f"{review['retired']} retired (revision {review['revision']})")
+
+    return 0
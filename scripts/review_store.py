@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+SQLite store of MEDICAL REVIEW state, keyed by message value hash.
+
+One row per (rule set, locale, key) that the tagging rules select, holding
+the hash of the message value, the rule that fired, the review status
+(pending, approved, rejected, retired), the reviewer and timestamps. The
+tag commands sync every locale in one transaction: new keys start as
+pending, and a key whose value hash changed goes back to pending even if
+it was approved, so "what needs (re-)review" is an index query instead of
+a scan of every ``@key`` description.
+
+The v1 and v2 tag commands keep separate rows (``rule_set``), so running
+one never touches the review state of the other. A key that is deleted or
+no longer selected is retired rather than deleted: its last verdict and
+reviewed hash are kept, and if it comes back with the text that was
+reviewed, the verdict is restored instead of asking for review again.
+
+Each sync that changes rows bumps a revision number; ``release`` records
+the current revision under a name, and ``pending --since NAME`` lists the
+keys that became pending after it (index on status, revision).
+
+The store is opt-in (``arbtool tag --review-db``) and is local state: the
+database (medical_review.db in the project root by default) is ignored by
+git, since binary SQLite files cannot be merged between branches.
+
+Usage:
+    python3 scripts/arbtool.py tag --review-db [FILE]
+    python3 scripts/arbtool.py review status
+    python3 scripts/arbtool.py review pending [--since RELEASE] [--locale ko] [--rule-set v2]
+    python3 scripts/arbtool.py review approve|reject <key or glob>... --reviewer NAME [--locale ko] [--rule-set v2]
+    python3 scripts/arbtool.py review release <name>
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+
+from arb import load_arb, load_l10n_config, locale_of
+from medical_rules import INCLUDE
+
+PENDING = 'pending'
+APPROVED = 'approved'
+REJECTED = 'rejected'
+RETIRED = 'retired'
+STATUSES = (PENDING, APPROVED, REJECTED, RETIRED)
+
+_SCHEMA_VERSION = 1
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS review (
+    rule_set TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value_hash TEXT NOT NULL,
+    rule TEXT,
+    status TEXT NOT NULL DEFAULT '{PENDING}'
+        CHECK (status IN ('{PENDING}', '{APPROVED}', '{REJECTED}', '{RETIRED}')),
+    verdict TEXT CHECK (verdict IN ('{APPROVED}', '{REJECTED}')),
+    reviewer TEXT,
+    reviewed_at INTEGER,
+    reviewed_hash TEXT,
+    changed_rev INTEGER NOT NULL,
+    changed_at INTEGER NOT NULL,
+    PRIMARY KEY (rule_set, locale, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS review_status ON review (status, changed_rev);
+CREATE TABLE IF NOT EXISTS release (
+    name TEXT PRIMARY KEY,
+    rev INTEGER NOT NULL,
+    created_at INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Unchanged rows are left alone, so re-running the tagger writes nothing.
+# A changed (or returning) value is pending unless it is the text that was
+# last reviewed, in which case that verdict applies again.
+_UPSERT = f"""
+INSERT INTO review (rule_set, locale, key, value_hash, rule, changed_rev, changed_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (rule_set, locale, key) DO UPDATE SET
+    status = CASE
+        WHEN value_hash = excluded.value_hash AND status != '{RETIRED}' THEN status
+        WHEN reviewed_hash = excluded.value_hash AND verdict IS NOT NULL THEN verdict
+        ELSE '{PENDING}' END,
+    changed_rev = CASE
+        WHEN value_hash = excluded.value_hash AND status != '{RETIRED}' THEN changed_rev
+        ELSE excluded.changed_rev END,
+    changed_at = CASE
+        WHEN value_hash = excluded.value_hash AND status != '{RETIRED}' THEN changed_at
+        ELSE excluded.changed_at END,
+    value_hash = excluded.value_hash,
+    rule = excluded.rule
+WHERE value_hash != excluded.value_hash OR rule IS NOT excluded.rule OR status = '{RETIRED}'
+"""
+
+
+def default_db_path(config: dict = None) -> str:
+    config = config or load_l10n_config()
+    return os.path.join(config['project_root'], 'medical_review.db')
+
+
+def value_hash(value) -> str:
+    """Hash of a message value (what a reviewer approves)."""
+    return hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (and create if needed) the review database."""
+    conn = sqlite3.connect(path, timeout=30)
+    row = conn.execute("SELECT name FROM sqlite_master WHERE name = 'meta'").fetchone()
+    version = row and conn.execute("SELECT value FROM meta WHERE name = 'schema'").fetchone()
+    if not version:
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.execute("INSERT INTO meta VALUES ('schema', ?), ('revision', '0')", (str(_SCHEMA_VERSION),))
+    elif int(version[0]) != _SCHEMA_VERSION:
+        conn.close()
+        raise ValueError(f'{path}: unsupported review database schema {version[0]}')
+    return conn
+
+
+def revision(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("SELECT value FROM meta WHERE name = 'revision'").fetchone()[0])
+
+
+def sync(conn: sqlite3.Connection, datasets: dict, rules, rule_set: str) -> dict:
+    """
+    Record the keys that ``rules`` select in each locale, in one transaction.
+
+    Args:
+        datasets: ``{locale: parsed ARB dict}``
+        rules: RuleSet whose include rules select keys for review
+        rule_set: name the rows are kept under ('v1', 'v2'); other rule sets are not touched
+
+    Returns:
+        ``{'changed': rows inserted or updated, 'retired': rows retired, 'revision': n}``
+    """
+    now = int(time.time())
+    with conn:
+        rev = revision(conn) + 1
+        before = conn.total_changes
+        rows = []
+        for locale, data in datasets.items():
+            for key, value in data.items():
+                if key.startswith('@'):
+                    continue
+                rule = rules.match(key)
+                if rule is not None and rule.action == INCLUDE:
+                    rows.append((rule_set, locale, key, value_hash(value), rule.name, rev, now))
+        conn.executemany(_UPSERT, rows)
+        changed = conn.total_changes - before
+
+        # Keys that were deleted or are no longer selected keep their verdict for when they return
+        conn.execute('CREATE TEMP TABLE selected (locale TEXT, key TEXT, PRIMARY KEY (locale, key))')
+        conn.executemany('INSERT INTO selected VALUES (?, ?)', [row[1:3] for row in rows])
+        placeholders = ', '.join('?' * len(datasets))
+        retired = conn.execute(
+            f"UPDATE review SET status = '{RETIRED}', changed_rev = ?, changed_at = ? "
+            f"WHERE rule_set = ? AND status != '{RETIRED}' AND locale IN ({placeholders}) "
+            f'AND (locale, key) NOT IN (SELECT locale, key FROM selected)',
+            [rev, now, rule_set] + list(datasets)).rowcount
+        conn.execute('DROP TABLE temp.selected')
+
+        if changed or retired:
+            conn.execute("UPDATE meta SET value = ? WHERE name = 'revision'", (str(rev),))
+        else:
+            rev -= 1
+    return {'changed': changed, 'retired': retired, 'revision': rev}
+
+
+def record_tagging(arb_files, rules, rule_set: str, db_path: str = None) -> dict:
+    """Sync the review store after a tagging run (called by the tag commands with --review-db)."""
+    datasets = {locale_of(path): load_arb(path) for path in arb_files}
+    conn = connect(db_path or default_db_path())
+    try:
+        return sync(conn, datasets, rules, rule_set)
+    finally:
+        conn.close()
+
+
+def mark_release(conn: sqlite3.Connection, name: str) -> int:
+    """Record the current revision as release ``name``; returns the revision."""
+    rev = revision(conn)
+    with conn:
+        conn.execute('INSERT OR REPLACE INTO release VALUES (?, ?, ?)', (name, rev, int(time.time())))
+    return rev
+
+
+def release_revision(conn: sqlite3.Connection, name: str) -> int:
+    row = conn.execute('SELECT rev FROM release WHERE name = ?', (name,)).fetchone()
+    if row is None:
+        known = [r[0] for r in conn.execute('SELECT name FROM release ORDER BY rev')]
+        raise ValueError(f"unknown release {name!r} (known: {', '.join(known) or 'none'})")
+    return row[0]
+
+
+def pending(conn: sqlite3.Connection, since: str = None, locale: str = None, rule_set: str = None) -> list:
+    """
+    Keys waiting for review, optionally only those that became pending after release ``since``.
+
+    Returns ``[(rule_set, locale, key, rule, previously_reviewed, changed_at)]``.
+    """
+    query = ('SELECT rule_set, locale, key, rule, reviewed_hash IS NOT NULL, changed_at FROM review '
+             'WHERE status = ? AND changed_rev > ?')
+    params = [PENDING, release_revision(conn, since) if since else 0]
+    if locale:
+        query += ' AND locale = ?'
+        params.append(locale)
+    if rule_set:
+        query += ' AND rule_set = ?'
+        params.append(rule_set)
+    return conn.execute(query + ' ORDER BY rule_set, locale, key', params).fetchall()
+
+
+def set_status(conn: sqlite3.Connection, patterns, status: str, reviewer: str,
+               locale: str = None, rule_set: str = None) -> int:
+    """Set the review status of current keys matching GLOB patterns; returns the number of rows updated."""
+    query = ('UPDATE review SET status = ?, verdict = ?, reviewer = ?, reviewed_at = ?, '
+             f"reviewed_hash = value_hash WHERE key GLOB ? AND status != '{RETIRED}'")
+    extra = []
+    if locale:
+        query += ' AND locale = ?'
+        extra.append(locale)
+    if rule_set:
+        query += ' AND rule_set = ?'
+        extra.append(rule_set)
+    now = int(time.time())
+    with conn:
+        return sum(conn.execute(query, [status, status, reviewer, now, pattern] + extra).rowcount
+                   for pattern in patterns)
+
+
+def status_counts(conn: sqlite3.Connection) -> dict:
+    """``{(rule_set, locale): {status: count}}``"""
+    counts = {}
+    for rule_set, locale, status, n in conn.execute(
+            'SELECT rule_set, locale, status, COUNT(*) FROM review '
+            'GROUP BY rule_set, locale, status ORDER BY rule_set, locale'):
+        counts.setdefault((rule_set, locale), dict.fromkeys(STATUSES, 0))[status] = n
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Query and update the MEDICAL REVIEW state store')
+    parser.add_argument('--db', help='review database (default: medical_review.db in the project root)')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('status', help='review status counts per locale')
+    pending_parser = commands.add_parser('pending', help='keys waiting for (re-)review')
+    pending_parser.add_argument('--since', metavar='RELEASE', help='only keys changed after this release')
+    pending_parser.add_argument('--locale')
+    pending_parser.add_argument('--rule-set', help='only this rule set (v1, v2)')
+    for name in ('approve', 'reject'):
+        status_parser = commands.add_parser(name, help=f'{name} keys (GLOB patterns, e.g. coping_*)')
+        status_parser.add_argument('keys', nargs='+')
+        status_parser.add_argument('--reviewer', required=True)
+        status_parser.add_argument('--locale')
+        status_parser.add_argument('--rule-set', help='only this rule set (v1, v2)')
+    release_parser = commands.add_parser('release', help='mark the current state as a release')
+    release_parser.add_argument('name')
+    args = parser.parse_args(argv)
+
+    path = args.db or default_db_path()
+    if args.command != 'release' and not os.path.exists(path):
+        print(f"❌ No review database at {os.path.relpath(path)} (run: arbtool tag --review-db)", file=sys.stderr)
+        return 1
+
+    try:
+        conn = connect(path)
+    except (sqlite3.Error, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    try:
+        if args.command == 'status':
+            print(f"📋 Review state (revision {revision(conn)})")
+            for (rule_set, locale), counts in status_counts(conn).items():
+                print(f"  {rule_set} {locale}: " + ', '.join(f"{counts[status]} {status}" for status in STATUSES))
+        elif args.command == 'pending':
+            rows = pending(conn, args.since, args.locale, args.rule_set)
+            for rule_set, locale, key, rule, reviewed, changed_at in rows:
+                marker = '🔁' if reviewed else '🆕'
+                print(f"{marker} {rule_set} {locale}: {key}  "
+                      f"[{rule}, {time.strftime('%Y-%m-%d', time.localtime(changed_at))}]")
+            since = f" since {args.since}" if args.since else ''
+            print(f"📋 {len(rows)} keys need review{since} "
+                  f"({sum(1 for row in rows if row[4])} changed after review)")
+        elif args.command == 'release':
+            print(f"✅ Release {args.name} at revision {mark_release(conn, args.name)}")
+        else:
+            status = APPROVED if args.command == 'approve' else REJECTED
+            updated = set_status(conn, args.keys, status, args.reviewer, args.locale, args.rule_set)
+            if not updated:
+                print(f"⚠️  No reviewed keys match {' '.join(args.keys)}")
+                return 1
+            print(f"✅ {updated} entries {status} by {args.reviewer}")
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Rule coverage profiler for the MEDICAL REVIEW rule sets.
+
+For every rule of the v1 and v2 tagging rules and the report categories
+(medical_rules.py), over the keys of the template ARB:
+
+  matched   keys the pattern matches on its own (re.search)
+  first     keys it decides, i.e. no earlier rule matched them
+  time      cumulative time of matching the pattern alone against every
+            key (best of --repeat), and whether the compiled RuleSet
+            evaluates it in the prefix trie, the suffix trie or the
+            combined regex
+
+Rules that match nothing are reported as dead, rules whose every match is
+claimed by an earlier rule as shadowed. For exclude rules (v2
+``_title$``, ``_label$``, ...) the keys they kept out of review that an
+include rule would otherwise have tagged are listed. The last section
+shows how the sets diverge: keys one set selects that another does not,
+grouped by the rule that selected them.
+
+Usage: python3 scripts/arbtool.py rules [arb_file] [--set v2] [--limit N] [--format json]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from arb import load_arb, load_l10n_config, message_keys
+from medical_rules import EXCLUDE, INCLUDE, REPORT_RULES, V1_RULES, V2_RULES, rule_lookup
+
+RULE_SETS = {
+    'v1': V1_RULES,
+    'v2': V2_RULES,
+    'report': REPORT_RULES,
+}
+
+DEAD = 'dead'
+SHADOWED = 'shadowed'
+
+
+def _time_pattern(pattern: str, keys: list, repeat: int):
+    """(matching keys, best seconds) for one pattern searched against every key."""
+    search = re.compile(pattern).search
+    best = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        matched = [key for key in keys if search(key)]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return matched, best
+
+
+def rule_coverage(rules, keys: list, repeat: int = 3) -> list:
+    """
+    Coverage of each rule in a RuleSet, in rule order.
+
+    Returns ``[{'index', 'name', 'pattern', 'action', 'lookup', 'matched',
+    'first', 'seconds', 'status', 'excluded'}]``; ``excluded`` lists
+    ``(key, include rule name)`` for keys an exclude rule kept out of review.
+    """
+    matched = {}
+    stats = []
+    for rule in rules.rules:
+        hits, seconds = _time_pattern(rule.pattern, keys, repeat)
+        matched[rule.index] = set(hits)
+        stats.append({'index': rule.index, 'name': rule.name, 'pattern': rule.pattern,
+                      'action': rule.action, 'lookup': rule_lookup(rule.pattern),
+                      'matched': len(hits), 'first': 0, 'seconds': seconds,
+                      'status': DEAD if not hits else None, 'excluded': []})
+
+    includes = [rule for rule in rules.rules if rule.action == INCLUDE]
+    for key in keys:
+        rule = rules.match(key)
+        if rule is None:
+            continue
+        entry = stats[rule.index]
+        entry['first'] += 1
+        if rule.action == EXCLUDE:
+            tagged_by = next((r.name for r in includes if key in matched[r.index]), None)
+            if tagged_by is not None:
+                entry['excluded'].append((key, tagged_by))
+
+    for entry in stats:
+        if entry['matched'] and not entry['first']:
+            entry['status'] = SHADOWED
+    return stats
+
+
+def selected_keys(rules, keys: list) -> dict:
+    """``{key: include rule name}`` for the keys a RuleSet selects."""
+    selected = {}
+    for key in keys:
+        rule = rules.match(key)
+        if rule is not None and rule.action == INCLUDE:
+            selected[key] = rule.name
+    return selected
+
+
+def divergence(rule_sets: dict, keys: list) -> list:
+    """
+    Keys selected by one rule set but not another.
+
+    Returns ``[(set, other set, {rule name in set: number of keys})]`` for
+    every ordered pair that differs.
+    """
+    selections = {name: selected_keys(rules, keys) for name, rules in rule_sets.items()}
+    differences = []
+    for name, selection in selections.items():
+        for other, other_selection in selections.items():
+            if other == name:
+                continue
+            by_rule = {}
+            for key, rule_name in selection.items():
+                if key not in other_selection:
+                    by_rule[rule_name] = by_rule.get(rule_name, 0) + 1
+            if by_rule:
+                differences.append((name, other, dict(sorted(by_rule.items(), key=lambda item: -item[1]))))
+    return differences
+
+
+def _engine_ns_per_key(rules, keys: list, repeat: int) -> float:
+    match = rules.match
+    best = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        for key in keys:
+            match(key)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / max(len(keys), 1) * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Report matches, shadowing and cost of each MEDICAL REVIEW rule')
+    parser.add_argument('arb_file', nargs='?', help="ARB file (default: the template from l10n.yaml)")
+    parser.add_argument('--set', dest='sets', action='append', choices=tuple(RULE_SETS),
+                        help='rule set to profile (repeatable, default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='timing runs per rule, best is kept (default: 3)')
+    parser.add_argument('--limit', type=int, default=10,
+                        help='excluded keys to print per exclude rule (default: 10, 0 = all)')
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    args = parser.parse_args(argv)
+
+    if args.arb_file:
+        arb_file = args.arb_file
+    else:
+        config = load_l10n_config()
+        arb_file = os.path.relpath(os.path.join(config['arb-dir'], config['template-arb-file']))
+    keys = message_keys(load_arb(arb_file))
+    sets = {name: RULE_SETS[name] for name in (args.sets or RULE_SETS)}
+    coverage = {name: rule_coverage(rules, keys, args.repeat) for name, rules in sets.items()}
+    differences = divergence(sets, keys) if len(sets) > 1 else []
+
+    if args.format == 'json':
+        json.dump({'keys': len(keys), 'sets': coverage,
+                   'divergence': [{'set': name, 'not_in': other, 'rules': rules}
+                                  for name, other, rules in differences]},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+
+    print(f"🔍 {len(keys)} keys from {arb_file}")
+    for name, stats in coverage.items():
+        rules = sets[name]
+        dead = sum(1 for entry in stats if entry['status'] == DEAD)
+        shadowed = sum(1 for entry in stats if entry['status'] == SHADOWED)
+        print(f"\n📋 {name}: {len(stats)} rules, {dead} dead, {shadowed} shadowed, "
+              f"engine {_engine_ns_per_key(rules, keys, args.repeat):.0f} ns/key")
+        print(f"  {'#':>3} {'action':<8} {'matched':>7} {'first':>6} {'µs':>8} {'lookup':<7} rule")
+        for entry in stats:
+            label = entry['name'] if entry['name'] == entry['pattern'] else f"{entry['name']}  {entry['pattern']}"
+            status = f"  ⚠️  {entry['status']}" if entry['status'] else ''
+            print(f"  {entry['index']:>3} {entry['action']:<8} {entry['matched']:>7} {entry['first']:>6} "
+                  f"{entry['seconds'] * 1e6:>8.0f} {entry['lookup']:<7} {label}{status}")
+        slowest = max(stats, key=lambda entry: entry['seconds'], default=None)
+        if slowest is not None:
+            print(f"  Slowest alone: {slowest['pattern']} ({slowest['seconds'] * 1e6:.0f} µs for {len(keys)} keys)")
+        for entry in stats:
+            if not entry['excluded']:
+                continue
+            excluded = entry['excluded']
+            shown = excluded[:args.limit] if args.limit else excluded
+            print(f"\n  🚫 {entry['pattern']} kept {len(excluded)} keys out of review:")
+            for key, tagged_by in shown:
+                print(f"       {key}  (would match {tagged_by})")
+            if len(shown) < len(excluded):
+                print(f"       ... {len(excluded) - len(shown)} more (use --limit 0)")
+
+    if differences:
+        print("\n📋 Selection differences")
+        for name, other, by_rule in differences:
+            total = sum(by_rule.values())
+            rules = ', '.join(f"{rule}: {n}" for rule, n in list(by_rule.items())[:5])
+            more = ', ...' if len(by_rule) > 5 else ''
+            print(f"  {name} selects {total} keys {other} does not ({rules}{more})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
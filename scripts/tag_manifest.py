@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Key-level change manifest for incremental MEDICAL REVIEW tagging.
+
+The manifest is a sidecar next to the ARB file, one per rule set
+(``.app_ko.arb.v1.manifest``, ``.app_ko.arb.v2.manifest``), so alternating
+the v1 and v2 taggers keeps both incremental. It records, for the last
+tagging run with that rule set, the rule-set version, the digest of
+the written file and a hash of each key's value and description after
+tagging. An incremental run only classifies keys that were added or edited
+since then, or every key when the rule set changed; an untouched file
+skips per-key hashing altogether.
+"""
+
+import hashlib
+import json
+import os
+
+from arb import content_digest
+
+
+def manifest_path(arb_file_path: str, rule_set: str) -> str:
+    """Return the manifest sidecar path for an ARB file and rule set ('v1', 'v2')."""
+    directory, name = os.path.split(arb_file_path)
+    return os.path.join(directory, f'.{name}.{rule_set}.manifest')
+
+
+def entry_hash(data: dict, key: str) -> str:
+    """Hash a key's value and @metadata description."""
+    metadata = data.get(f'@{key}')
+    description = metadata.get('description', '') if isinstance(metadata, dict) else ''
+    text = f"{data[key]}\0{description}"
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def load_manifest(arb_file_path: str, rule_set: str, rules_version: str):
+    """
+    Load the manifest for an ARB file.
+
+    Returns the manifest dict, or None when there is no usable manifest or
+    it was written with a different rule-set version.
+    """
+    try:
+        with open(manifest_path(arb_file_path, rule_set), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('rules') != rules_version:
+        return None
+    return manifest
+
+
+def file_digest(arb_file_path: str) -> str:
+    """Return the hex content digest of an ARB file."""
+    with open(arb_file_path, 'rb') as f:
+        return content_digest(f.read()).hex()
+
+
+def split_changed_keys(data: dict, previous, digest: str):
+    """
+    Split message keys into changed keys and unchanged manifest entries.
+
+    Args:
+        data: parsed ARB file
+        previous: manifest from load_manifest, or None for a full run
+        digest: file_digest of the ARB file that data was parsed from
+
+    Returns:
+        (changed_keys, unchanged) where unchanged maps key -> medical flag
+    """
+    keys = [key for key in data if not key.startswith('@')]
+    if previous is None:
+        return keys, {}
+
+    entries = previous['keys']
+    if previous.get('digest') == digest:
+        return [], {key: entries[key][1] for key in keys if key in entries}
+
+    changed = []
+    unchanged = {}
+    for key in keys:
+        entry = entries.get(key)
+        if entry is not None and entry[0] == entry_hash(data, key):
+            unchanged[key] = entry[1]
+        else:
+            changed.append(key)
+    return changed, unchanged
+
+
+def save_manifest(arb_file_path: str, data: dict, rule_set: str, rules_version: str,
+                  changed_keys, medical_keys, previous=None):
+    """
+    Record the post-tagging state of the ARB file.
+
+    Only changed_keys are rehashed; entries of unchanged keys are carried
+    over from the previous manifest.
+    """
+    entries = previous['keys'] if previous is not None else {}
+    medical_keys = set(medical_keys)
+    keys = {}
+    for key in data:
+        if not key.startswith('@') and key in entries:
+            keys[key] = entries[key]
+    for key in changed_keys:
+        keys[key] = [entry_hash(data, key), key in medical_keys]
+
+    manifest = {
+        'rules': rules_version,
+        'digest': file_digest(arb_file_path),
+        'keys': keys,
+    }
+    target = manifest_path(arb_file_path, rule_set)
+    tmp = f'{target}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for arb_exchange.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from arb_exchange import export_units, import_translations, iter_messages, write_xliff
+
+# checkin_findHospital appears twice, as in the shipped ARBs; json.loads keeps the last
+KO = '''{
+  "@@locale": "ko",
+  "checkin_findHospital": "병원 찾기",
+  "@checkin_findHospital": {
+    "description": "Button - MEDICAL REVIEW REQUIRED"
+  },
+  "settings": "설정",
+  "checkin_findHospital": "가까운 병원 찾기",
+  "@checkin_findHospital": {
+    "description": "Button"
+  }
+}'''
+EN = '''{
+  "@@locale": "en",
+  "checkin_findHospital": "Find clinic",
+  "settings": "Settings",
+  "checkin_findHospital": "Find Hospital"
+}'''
+
+
+class DuplicateKeyTest(unittest.TestCase):
+
+    def _messages(self, text):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            messages = list(iter_messages(io.StringIO(text)))
+        return messages, stderr.getvalue()
+
+    def test_iter_messages_keeps_the_last_occurrence(self):
+        messages, warnings = self._messages(KO)
+        self.assertEqual(messages, [
+            ('settings', '설정', None),
+            ('checkin_findHospital', '가까운 병원 찾기', {'description': 'Button'}),
+        ])
+        self.assertIn("duplicate key 'checkin_findHospital' (2 times, last one kept)", warnings)
+        self.assertEqual(self._messages(EN)[0], [('settings', 'Settings', None),
+                                                 ('checkin_findHospital', 'Find Hospital', None)])
+
+    def test_export_writes_one_unit_per_key(self):
+        out = io.StringIO()
+        with contextlib.redirect_stderr(io.StringIO()):
+            written = write_xliff(export_units(io.StringIO(KO), io.StringIO(EN)), out, 'ko', 'en')
+        self.assertEqual(written, 2)
+        self.assertEqual(out.getvalue().count('<unit id="checkin_findHospital">'), 1)
+        self.assertIn('<target>Find Hospital</target>', out.getvalue())
+        self.assertNotIn('medical-review', out.getvalue())
+
+    def test_import_updates_only_the_last_occurrence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'app_en.arb')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(EN)
+
+            counts = import_translations(path, [('checkin_findHospital', 'Find Hospital'),
+                                                ('settings', 'Settings')])
+            self.assertEqual(counts, {'updated': 0, 'identical': 2, 'added': 0})
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), EN)
+
+            counts = import_translations(path, [('checkin_findHospital', 'Find a hospital')])
+            self.assertEqual(counts, {'updated': 1, 'identical': 0, 'added': 0})
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+            self.assertIn('"checkin_findHospital": "Find clinic"', text)
+            self.assertEqual(json.loads(text)['checkin_findHospital'], 'Find a hospital')
+
+
+if __name__ == '__main__':
+    unittest.main()
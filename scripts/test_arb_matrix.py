@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for arb_matrix.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import unittest
+
+from arb_matrix import ArbMatrix
+
+KO = {
+    '@@locale': 'ko',
+    'coping_nausea_title': '메스꺼움',
+    '@coping_nausea_title': {'description': 'Nausea guide title - MEDICAL REVIEW REQUIRED'},
+    'dose_count': '{n}회',
+    '@dose_count': {'description': 'Dose count', 'placeholders': {'n': {'type': 'int'}}, 'context': 'dose'},
+    'settings': '설정',
+    '@settings': {'description': ['Settings', 'title']},
+}
+EN = {
+    '@@locale': 'en',
+    'coping_nausea_title': 'Nausea',
+    '@coping_nausea_title': {'description': 'Nausea guide title - MEDICAL REVIEW REQUIRED'},
+    'dose_count': '{n} doses',
+}
+
+
+class ArbMatrixTest(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = ArbMatrix()
+        self.matrix.add_locale('ko', KO)
+        self.matrix.add_locale('en', EN)
+
+    def test_round_trip(self):
+        self.assertEqual(self.matrix.to_dict('ko'), KO)
+        self.assertEqual(self.matrix.to_dict('en'), EN)
+        self.assertEqual(self.matrix.missing('en'), ['settings'])
+
+    def test_records_are_shared_and_immutable(self):
+        i = self.matrix.index('coping_nausea_title')
+        record = self.matrix.metadata['ko'][i]
+        self.assertIs(self.matrix.metadata['en'][i], record)
+        with self.assertRaises(AttributeError):
+            record.description = 'Nausea'
+        self.assertEqual(record.description, 'Nausea guide title - MEDICAL REVIEW REQUIRED')
+
+    def test_non_string_description_is_kept(self):
+        record = self.matrix.metadata['ko'][self.matrix.index('settings')]
+        self.assertIsNone(record.description)
+        self.assertEqual(record.to_dict(), {'description': ['Settings', 'title']})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for arb_merge.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import unittest
+
+from arb_merge import (IDENTICAL, METADATA_CONFLICT, NEW, VALUE_CONFLICT, MergeConflict,
+                       merge_entries, merge_metadata)
+
+EXISTING = {
+    '@@locale': 'ko',
+    'checkin_mood_question': '기분은 어떠세요?',
+    '@checkin_mood_question': {'description': 'Mood question - MEDICAL REVIEW REQUIRED'},
+    'settings': '설정',
+    '@settings': {'description': 'Settings title'},
+    'coping_nausea_tip': '물을 마셔요',
+}
+INCOMING = {
+    '@@locale': 'ko',
+    # Same value; the new description lacks the review tag
+    'checkin_mood_question': '기분은 어떠세요?',
+    '@checkin_mood_question': {'description': 'Daily mood question'},
+    'settings': '설정',
+    '@settings': {'description': 'Settings title'},
+    'coping_nausea_tip': '물을 조금씩 마셔요',
+    'tracking_sleep_title': '수면',
+    '@tracking_sleep_title': {'description': 'Sleep title'},
+}
+TAGGED = {'description': 'Daily mood question - MEDICAL REVIEW REQUIRED'}
+
+
+class MergeEntriesTest(unittest.TestCase):
+
+    def test_classification(self):
+        _, counts, conflicts = merge_entries(EXISTING, INCOMING)
+        self.assertEqual(counts, {NEW: 1, IDENTICAL: 1, VALUE_CONFLICT: 1, METADATA_CONFLICT: 1})
+        self.assertEqual(conflicts, [
+            (METADATA_CONFLICT, 'checkin_mood_question', EXISTING['@checkin_mood_question'], TAGGED),
+            (VALUE_CONFLICT, 'coping_nausea_tip', '물을 마셔요', '물을 조금씩 마셔요'),
+        ])
+
+    def test_keep_only_inserts_new_keys(self):
+        updates, _, _ = merge_entries(EXISTING, INCOMING, 'keep')
+        self.assertEqual(updates, {'tracking_sleep_title': '수면',
+                                   '@tracking_sleep_title': {'description': 'Sleep title'}})
+
+    def test_overwrite_takes_incoming_and_keeps_review_tags(self):
+        updates, _, _ = merge_entries(EXISTING, INCOMING, 'overwrite')
+        self.assertEqual(updates, {
+            '@checkin_mood_question': TAGGED,
+            'coping_nausea_tip': '물을 조금씩 마셔요',
+            'tracking_sleep_title': '수면',
+            '@tracking_sleep_title': {'description': 'Sleep title'},
+        })
+
+    def test_fail_raises_before_any_update(self):
+        with self.assertRaises(MergeConflict) as caught:
+            merge_entries(EXISTING, INCOMING, 'fail', source='fragment.csv')
+        self.assertEqual(len(caught.exception.conflicts), 2)
+        self.assertEqual(str(caught.exception),
+                         'fragment.csv: 2 conflicting entries (first: checkin_mood_question metadata-conflict)')
+        # Without conflicts 'fail' merges like the other policies
+        updates, counts, _ = merge_entries(EXISTING, {'tracking_sleep_title': '수면'}, 'fail')
+        self.assertEqual(updates, {'tracking_sleep_title': '수면'})
+        self.assertEqual(counts[NEW], 1)
+
+    def test_metadata_without_its_key(self):
+        incoming = {'@settings': {'description': 'Settings screen title'}}
+        _, counts, _ = merge_entries(EXISTING, incoming, 'keep')
+        self.assertEqual(counts[METADATA_CONFLICT], 1)
+        updates, _, _ = merge_entries(EXISTING, incoming, 'overwrite')
+        self.assertEqual(updates, {'@settings': {'description': 'Settings screen title'}})
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            merge_entries(EXISTING, INCOMING, 'replace')
+
+
+class MergeMetadataTest(unittest.TestCase):
+
+    def test_review_tag_is_preserved(self):
+        existing = {'description': 'Mood - MEDICAL REVIEW REQUIRED', 'placeholders': {'n': {}}}
+        self.assertEqual(merge_metadata(existing, {'description': 'Mood'}),
+                         {'description': 'Mood - MEDICAL REVIEW REQUIRED', 'placeholders': {'n': {}}})
+        # An emptied description keeps the tagged one
+        self.assertEqual(merge_metadata(existing, {'description': ''})['description'],
+                         'Mood - MEDICAL REVIEW REQUIRED')
+        # An incoming description that already carries a tag is taken as is
+        self.assertEqual(merge_metadata(existing, {'description': 'MEDICAL REVIEW: mood'})['description'],
+                         'MEDICAL REVIEW: mood')
+
+    def test_missing_metadata(self):
+        self.assertEqual(merge_metadata({'description': 'x'}, None), {'description': 'x'})
+        self.assertEqual(merge_metadata(None, {'description': 'y'}), {'description': 'y'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for arb_shards.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import os
+import tempfile
+import unittest
+
+import arb_shards
+from arb import load_l10n_config
+
+KO = {
+    '@@locale': 'ko',
+    'coping_nausea_title': '메스꺼움',
+    '@coping_nausea_title': {'description': 'Nausea guide title'},
+    'checkin_greeting_morning': '좋은 아침이에요',
+    '_comment_release': '출시 메모',
+    'coping_nausea_tip': '물을 조금씩 마셔요',
+    'settings': '설정',
+    'checkin_mood_question': '기분은 어떠세요?',
+}
+EN = {
+    '@@locale': 'en',
+    'coping_nausea_title': 'Nausea',
+    'checkin_greeting_morning': 'Good morning',
+    '_comment_release': 'Release note',
+    'coping_nausea_tip': 'Sip water slowly',
+    'settings': 'Settings',
+    'checkin_mood_question': 'How are you feeling?',
+}
+
+
+class ArbShardsTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = self._tmp.name
+        os.makedirs(os.path.join(root, 'lib', 'l10n'))
+        with open(os.path.join(root, 'l10n.yaml'), 'w', encoding='utf-8') as f:
+            f.write('arb-dir: lib/l10n\ntemplate-arb-file: app_ko.arb\n')
+        self.config = load_l10n_config(root)
+        self.paths = {}
+        for locale, data in (('ko', KO), ('en', EN)):
+            path = self.paths[locale] = os.path.join(root, 'lib', 'l10n', f'app_{locale}.arb')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(arb_shards.render_arb(data))
+        self.root = arb_shards.shard_root(self.config)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _read(self, locale):
+        with open(self.paths[locale], encoding='utf-8') as f:
+            return f.read()
+
+    def test_underscore_keys_go_to_common(self):
+        self.assertEqual(arb_shards.feature_of('_comment_release'), 'common')
+        self.assertEqual(arb_shards.feature_of('@_comment_release'), 'common')
+        arb_shards.split(self.config, self.root)
+        shards = arb_shards.shard_files(self.root)['ko']
+        self.assertNotIn('', shards)
+        self.assertEqual(sorted(shards), ['checkin', 'common', 'coping'])
+
+    def test_split_build_round_trip(self):
+        before = {locale: self._read(locale) for locale in self.paths}
+        arb_shards.split(self.config, self.root)
+        self.assertEqual(arb_shards.build(self.config, self.root), {'ko': 'unchanged', 'en': 'unchanged'})
+        arb_shards.build(self.config, self.root, force=True)
+        self.assertEqual({locale: self._read(locale) for locale in self.paths}, before)
+
+    def test_build_changes_only_edited_entries(self):
+        before = self._read('ko').splitlines()
+        arb_shards.split(self.config, self.root)
+        shard = arb_shards.shard_files(self.root)['ko']['coping']
+        with open(shard, encoding='utf-8') as f:
+            text = f.read()
+        with open(shard, 'w', encoding='utf-8') as f:
+            f.write(text.replace('메스꺼움', '메스꺼움 대처'))
+
+        self.assertEqual(arb_shards.build(self.config, self.root)['ko'], 'built')
+        after = self._read('ko').splitlines()
+        self.assertEqual(len(after), len(before))
+        self.assertEqual([(a, b) for a, b in zip(before, after) if a != b],
+                         [('  "coping_nausea_title": "메스꺼움",', '  "coping_nausea_title": "메스꺼움 대처",')])
+
+    def test_new_key_follows_its_shard_neighbour(self):
+        merged = {'a_1': 1, 'a_new': 2, 'b_1': 3, 'c_1': 4}
+        ordered = arb_shards.keep_order(merged, ['c_1', 'a_1', 'gone', 'b_1'])
+        self.assertEqual(list(ordered), ['c_1', 'a_1', 'a_new', 'b_1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for icu_message.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import unittest
+
+from icu_message import IcuSyntaxError, arguments, check_placeholders, parse_message
+
+
+class ParseMessageTest(unittest.TestCase):
+
+    def test_text_and_simple_arguments(self):
+        self.assertEqual(parse_message(''), ())
+        self.assertEqual(parse_message('Hello'), ('Hello',))
+        self.assertEqual(parse_message('Hi {name}, { count }!'),
+                         ('Hi ', ('name', None, None), ', ', ('count', None, None), '!'))
+
+    def test_plural(self):
+        ast = parse_message('{n, plural, =0{No doses} one{# dose} other{{n} doses}}')
+        self.assertEqual(ast, (('n', 'plural', (
+            ('=0', ('No doses',)),
+            ('one', ('# dose',)),
+            ('other', (('n', None, None), ' doses')),
+        )),))
+        self.assertEqual(arguments(ast), {'n': {'plural', None}})
+
+    def test_select_and_formatted_arguments(self):
+        ast = parse_message('{sex, select, male{He} female{She} other{They}} took it {when, date, yMd}')
+        self.assertEqual(ast, (
+            ('sex', 'select', (('male', ('He',)), ('female', ('She',)), ('other', ('They',)))),
+            ' took it ',
+            ('when', 'date', None),
+        ))
+        self.assertEqual(parse_message('{kg, number}'), (('kg', 'number', None),))
+
+    def test_nested_plural_in_select(self):
+        ast = parse_message('{g, select, other{{n, plural, one{one} other{many}}}}')
+        self.assertEqual(arguments(ast), {'g': {'select'}, 'n': {'plural'}})
+
+    def test_escaping(self):
+        # Without use-escaping an apostrophe is plain text
+        self.assertEqual(parse_message("It's {x}"), ("It's ", ('x', None, None)))
+        self.assertEqual(parse_message("It''s '{literal}' {x}", True),
+                         ("It's {literal} ", ('x', None, None)))
+        self.assertEqual(parse_message("'{n, plural, other{x}}'", True), ('{n, plural, other{x}}',))
+        self.assertEqual(parse_message("'{literal}'"), ("'", ('literal', None, None), "'"))
+
+    def test_errors(self):
+        cases = {
+            'a } b': ("unmatched '}'", 2),
+            '{n, plural, other{x': ("unclosed '{'", 19),
+            '{}': ('expected placeholder name', 1),
+            '{a, foo}': ("unknown argument type 'foo'", 7),
+            '{n, plural, few{x}}': ("plural for 'n' is missing the 'other' case", 19),
+            '{n, plural, lots{x} other{y}}': ("invalid plural selector 'lots'", 12),
+            '{n, plural, one{x} one{y} other{z}}': ("duplicate plural selector 'one'", 19),
+            '{g, select, =1{x} other{y}}': ("invalid select selector '=1'", 12),
+            '{g, select, male other{y}}': ("expected '{'", 17),
+        }
+        for message, (error, position) in cases.items():
+            with self.subTest(message=message):
+                with self.assertRaises(IcuSyntaxError) as caught:
+                    parse_message(message)
+                self.assertEqual(str(caught.exception), f'{error} at offset {position}')
+                self.assertEqual(caught.exception.position, position)
+
+    def test_unterminated_quote(self):
+        with self.assertRaises(IcuSyntaxError) as caught:
+            parse_message("Don't {x}", True)
+        self.assertIn('unterminated quote', str(caught.exception))
+
+
+class CheckPlaceholdersTest(unittest.TestCase):
+
+    def test_cross_locale_issues(self):
+        ko = {
+            'dose_count': '{n, plural, other{{n}회}}',
+            '@dose_count': {'placeholders': {'n': {'type': 'int'}}},
+            'greeting': '안녕 {name}',
+            '@greeting': {'placeholders': {'name': {'type': 'String'}, 'unused': {}}},
+            'broken': '괜찮아요',
+        }
+        en = {
+            'dose_count': '{n, plural, one{# dose} other{{n} doses}}',
+            '@dose_count': {'placeholders': {'n': {'type': 'double'}}},
+            'greeting': 'Hello {nom}',
+            'broken': '{oops',
+        }
+        self.assertEqual(check_placeholders({'ko': ko, 'en': en}, 'ko'), [
+            ('error', 'en', 'dose_count', '{n} is declared as double, template declares int'),
+            ('warning', 'ko', 'greeting', 'declared placeholder {unused} is not used'),
+            ('error', 'en', 'greeting', 'placeholder {nom} is not declared in the template'),
+            ('error', 'en', 'greeting', 'placeholder {name} is missing'),
+            ('error', 'en', 'greeting', 'placeholder {unused} is missing'),
+            ('error', 'en', 'broken', "ICU syntax error: expected ',' at offset 5"),
+        ])
+
+    def test_kind_must_fit_the_declared_type(self):
+        ko = {'when': '{d, plural, other{x}}', '@when': {'placeholders': {'d': {'type': 'DateTime'}}}}
+        self.assertEqual(check_placeholders({'ko': ko}, 'ko'),
+                         [('error', 'ko', 'when', '{d} is used as plural but declared as DateTime')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for medical_review_report.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+import medical_review_report as report
+
+TAGGED = ' - MEDICAL REVIEW REQUIRED'
+
+# Hand-written so the duplicate key survives (a dict cannot hold it)
+ARB = """{
+  "@@locale": "ko",
+  "checkin_redFlag_findHospitalButton": "병원 찾기",
+  "@checkin_redFlag_findHospitalButton": {"description": "Find hospital%(tag)s"},
+  "coping_nausea_tip": "물을 조금씩 마셔요",
+  "@coping_nausea_tip": {"description": "Nausea tip%(tag)s"},
+  "settings_title": "설정",
+  "checkin_redFlag_findHospitalButton": "병원 찾기",
+  "@checkin_redFlag_findHospitalButton": {"description": "Button to open hospital search"}
+}""" % {'tag': TAGGED}
+
+
+class StreamReportTest(unittest.TestCase):
+
+    def test_stream_and_load_agree_on_duplicate_keys(self):
+        counts, uncategorized, stats = report.analyze_medical_review_stream(io.StringIO(ARB))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'app_ko.arb')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(ARB)
+            results, loaded_uncategorized = report.analyze_medical_review_keys(path)
+
+        self.assertEqual(counts, {category: len(keys) for category, keys in results.items()})
+        self.assertEqual(uncategorized, len(loaded_uncategorized))
+        self.assertEqual(counts['Coping Guide'], 1)
+        self.assertEqual(counts['Checkin - Other'], 0)
+        self.assertEqual((stats['keys'], stats['tagged']), (3, 1))
+        self.assertEqual(stats['locales'], {'ko': {'keys': 3, 'tagged': 1}})
+        self.assertEqual(stats['duplicates'], [('ko', 'checkin_redFlag_findHospitalButton')])
+
+    def test_last_occurrence_can_add_the_tag(self):
+        arb = ARB.replace(TAGGED, '').replace('Button to open hospital search', 'Find hospital' + TAGGED)
+        counts, _, stats = report.analyze_medical_review_stream(io.StringIO(arb))
+        self.assertEqual(counts['Checkin - Other'], 1)
+        self.assertEqual((stats['keys'], stats['tagged']), (3, 1))
+
+    def test_locales_in_one_stream_are_not_duplicates(self):
+        bundle = '{"ko": {"coping_a": "가", "@coping_a": {"description": "x%s"}}, ' \
+                 '"en": {"coping_a": "A", "@coping_a": {"description": "x%s"}}}' % (TAGGED, TAGGED)
+        counts, _, stats = report.analyze_medical_review_stream(io.StringIO(bundle))
+        self.assertEqual(counts['Coping Guide'], 2)
+        self.assertEqual(stats['duplicates'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
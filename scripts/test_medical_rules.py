@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for medical_rules.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import re
+import unittest
+
+from gen_synthetic_arb import PREFIXES, generate_keys
+from medical_rules import (EXCLUDE, INCLUDE, PREFIX_TRIE, REGEX, REPORT_RULES, SUFFIX_TRIE,
+                           V1_RULES, V2_RULES, RuleSet, rule_lookup)
+
+# Keys that sit on the edges of the shipped patterns
+EDGE_KEYS = [
+    '', 'checkin', 'checkin_', 'checkin_title', 'checkin_screen_title', 'checkin_navBack',
+    'checkin_mood_question', 'checkin_moodQuestion', 'checkin_bowel_feedback', 'checkin_derivedFeedback',
+    'checkin_meal_answerLabel', 'checkin_greeting_morning', 'xcheckin_moodQuestion',
+    'coping_', 'coping_nausea_title', 'coping_nausea_tip_label', 'tracking_symptom',
+    'tracking_symptomCheck_hint', 'tracking_redFlag_unit', 'records_symptom_',
+    'dashboard_greeting_encouragement', 'dashboard_greeting_encouragementTitle', 'dashboard_progress_',
+    'dashboard_checkin_title', 'dashboard_report_title', '_title', '_label_title', 'settings',
+]
+
+
+def naive_match(rules, key):
+    """The semantics RuleSet compiles away: first rule whose pattern re.search()es the key."""
+    for rule in rules.rules:
+        if re.search(rule.pattern, key):
+            return rule
+    return None
+
+
+class RuleSetTest(unittest.TestCase):
+
+    def assertMatchesNaive(self, rules, keys):
+        for key in keys:
+            expected = naive_match(rules, key)
+            actual = rules.match(key)
+            self.assertIs(actual, expected, f'{key!r}: {actual} != {expected}')
+
+    def test_shipped_rule_sets_match_naive_search(self):
+        keys = EDGE_KEYS + [prefix for prefix, _ in PREFIXES]
+        keys += [key for key, _, _ in generate_keys(3000, seed=7)]
+        for name, rules in (('v1', V1_RULES), ('v2', V2_RULES), ('report', REPORT_RULES)):
+            with self.subTest(rules=name):
+                self.assertMatchesNaive(rules, keys)
+
+    def test_rule_lookup(self):
+        self.assertEqual(rule_lookup('^coping_'), PREFIX_TRIE)
+        self.assertEqual(rule_lookup('_title$'), SUFFIX_TRIE)
+        self.assertEqual(rule_lookup('^checkin_.*Feedback$'), REGEX)
+        self.assertEqual(rule_lookup('^exact$'), REGEX)
+        self.assertEqual(rule_lookup('coping'), REGEX)
+
+    def test_earlier_rule_wins_across_lookups(self):
+        keys = ['checkin_mood_title', 'checkin_moodFeedback', 'checkin_moodFeedback_title',
+                'coping_title', 'coping_nauseaFeedback', 'a_checkin_title', 'nothing']
+        patterns = ['^checkin_', '_title$', '^checkin_.*Feedback$', 'Feedback', '^coping_']
+        # Every order of trie and regex rules must give the first match in rule order
+        orders = [patterns, patterns[::-1], patterns[2:] + patterns[:2], patterns[1::2] + patterns[::2]]
+        for order in orders:
+            rules = RuleSet([(p, p, INCLUDE if i % 2 else EXCLUDE) for i, p in enumerate(order)])
+            with self.subTest(order=order):
+                self.assertMatchesNaive(rules, keys)
+
+    def test_overlapping_literals_keep_the_lowest_index(self):
+        rules = RuleSet([('long', '^checkin_mood', INCLUDE), ('short', '^checkin_', EXCLUDE),
+                         ('suffix', 'Question$', INCLUDE), ('longer suffix', '_moodQuestion$', EXCLUDE)])
+        self.assertEqual(rules.match('checkin_moodQuestion').name, 'long')
+        self.assertEqual(rules.match('checkin_energyQuestion').name, 'short')
+        self.assertEqual(rules.match('tracking_moodQuestion').name, 'suffix')
+        self.assertIsNone(rules.match('tracking_mood'))
+
+    def test_v2_excludes_ui_keys(self):
+        self.assertTrue(V2_RULES.requires_review('checkin_mood_question'))
+        self.assertFalse(V2_RULES.requires_review('checkin_mood_title'))
+        self.assertFalse(V2_RULES.requires_review('checkin_screen_intro'))
+        self.assertFalse(V1_RULES.requires_review('checkin_greeting_morning'))
+        self.assertTrue(V1_RULES.requires_review('checkin_mood_title_question'))
+
+    def test_empty_rule_set(self):
+        rules = RuleSet([])
+        self.assertIsNone(rules.match('coping_nausea_title'))
+        self.assertFalse(rules.requires_review('coping_nausea_title'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for review_store.py.
+
+Usage: python3 -m unittest discover -s scripts   (or: python3 -m pytest scripts)
+"""
+
+import unittest
+
+import review_store
+from medical_rules import V1_RULES, V2_RULES
+
+DATASETS = {
+    'ko': {
+        '@@locale': 'ko',
+        'checkin_greeting_morning': '좋은 아침이에요',   # v2 only
+        'checkin_mood_moodQuestion': '기분은 어떠세요?',  # v1 and v2
+        'coping_nausea_title': '메스꺼움',              # v1 only (v2 excludes _title$)
+        'settings_screen_title': '설정',                # neither
+    },
+}
+
+
+def _statuses(conn, rule_set):
+    return dict(conn.execute('SELECT key, status FROM review WHERE rule_set = ?', (rule_set,)))
+
+
+class ReviewStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = review_store.connect(':memory:')
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_rule_sets_keep_separate_state(self):
+        review_store.sync(self.conn, DATASETS, V2_RULES, 'v2')
+        review_store.set_status(self.conn, ['*'], review_store.APPROVED, 'reviewer', rule_set='v2')
+        review_store.sync(self.conn, DATASETS, V1_RULES, 'v1')
+        result = review_store.sync(self.conn, DATASETS, V2_RULES, 'v2')
+
+        self.assertEqual(result['changed'], 0)
+        self.assertEqual(result['retired'], 0)
+        self.assertEqual(_statuses(self.conn, 'v2'), {
+            'checkin_greeting_morning': review_store.APPROVED,
+            'checkin_mood_moodQuestion': review_store.APPROVED,
+        })
+        self.assertEqual(_statuses(self.conn, 'v1'), {
+            'checkin_mood_moodQuestion': review_store.PENDING,
+            'coping_nausea_title': review_store.PENDING,
+        })
+
+    def test_removed_key_gets_its_verdict_back(self):
+        key = 'checkin_greeting_morning'
+        review_store.sync(self.conn, DATASETS, V2_RULES, 'v2')
+        review_store.set_status(self.conn, [key], review_store.APPROVED, 'reviewer')
+
+        without = {'ko': {k: v for k, v in DATASETS['ko'].items() if k != key}}
+        result = review_store.sync(self.conn, without, V2_RULES, 'v2')
+        self.assertEqual(result['retired'], 1)
+        self.assertEqual(_statuses(self.conn, 'v2')[key], review_store.RETIRED)
+        self.assertEqual(review_store.set_status(self.conn, [key], review_store.REJECTED, 'reviewer'), 0)
+
+        review_store.sync(self.conn, DATASETS, V2_RULES, 'v2')
+        self.assertEqual(_statuses(self.conn, 'v2')[key], review_store.APPROVED)
+        self.assertNotIn(key, [row[2] for row in review_store.pending(self.conn)])
+
+    def test_changed_value_needs_review_again(self):
+        key = 'checkin_greeting_morning'
+        review_store.sync(self.conn, DATASETS, V2_RULES, 'v2')
+        review_store.set_status(self.conn, [key], review_store.APPROVED, 'reviewer')
+
+        changed = {'ko': {**DATASETS['ko'], key: '안녕하세요'}}
+        review_store.sync(self.conn, changed, V2_RULES, 'v2')
+        self.assertEqual(_statuses(self.conn, 'v2')[key], review_store.PENDING)
+        # Reverting to the reviewed text restores the verdict
+        review_store.sync(self.conn, DATASETS, V2_RULES, 'v2')
+        self.assertEqual(_statuses(self.conn, 'v2')[key], review_store.APPROVED)
+
+
+if __name__ == '__main__':
+    unittest.main()